@@ -56,6 +56,11 @@ ARGS_BACKTEST = [
     "exportfilename",
     "backtest_breakdown",
     "backtest_cache",
+    "backtest_incremental_cache",
+    "backtest_engine",
+    "backtest_strategy_jobs",
+    "indicator_jobs",
+    "data_load_jobs",
     "freqai_backtest_live_models",
 ]
 
@@ -72,12 +77,18 @@ ARGS_HYPEROPT = [
     "print_all",
     "print_json",
     "hyperopt_jobs",
+    "hyperopt_persistent_workers",
+    "hyperopt_async_scheduler",
     "hyperopt_random_state",
     "hyperopt_min_trades",
     "hyperopt_loss",
     "disableparamexport",
     "hyperopt_ignore_missing_space",
     "analyze_per_epoch",
+    "hyperopt_indicator_cache_size",
+    "backtest_engine",
+    "indicator_jobs",
+    "data_load_jobs",
 ]
 
 ARGS_EDGE = [*ARGS_COMMON_OPTIMIZE, "stoploss_range"]
@@ -166,6 +177,7 @@ ARGS_DOWNLOAD_DATA = [
     "dataformat_trades",
     "trading_mode",
     "prepend_data",
+    "download_jobs",
 ]
 
 ARGS_PLOT_DATAFRAME = [
@@ -249,7 +261,14 @@ ARGS_STRATEGY_UPDATER = ["strategy_list", "strategy_path", "recursive_strategy_s
 ARGS_LOOKAHEAD_ANALYSIS = [
     a
     for a in ARGS_BACKTEST
-    if a not in ("position_stacking", "backtest_cache", "backtest_breakdown")
+    if a
+    not in (
+        "position_stacking",
+        "backtest_cache",
+        "backtest_incremental_cache",
+        "backtest_breakdown",
+        "backtest_strategy_jobs",
+    )
 ] + ["minimum_trade_amount", "targeted_trade_amount", "lookahead_analysis_exportfilename"]
 
 ARGS_RECURSIVE_ANALYSIS = ["timeframe", "timerange", "dataformat_ohlcv", "pairs", "startup_candle"]
@@ -235,6 +235,48 @@ AVAILABLE_CLI_OPTIONS = {
         default=constants.BACKTEST_CACHE_DEFAULT,
         choices=constants.BACKTEST_CACHE_AGE,
     ),
+    "backtest_incremental_cache": Arg(
+        "--incremental-cache",
+        help="Store the backtest state before the last candle, and continue from it when "
+        "backtesting the same strategy and configuration with a later end date. "
+        "Only new candles are simulated, as long as the candle data up to the stored state "
+        "is unchanged.",
+        action="store_true",
+        default=False,
+    ),
+    "backtest_engine": Arg(
+        "--backtest-engine",
+        help="Backtesting engine to use. `columnar` only visits candles with entry signals "
+        "or open trades (default: `classic`).",
+        choices=constants.BACKTEST_ENGINES,
+    ),
+    "indicator_jobs": Arg(
+        "--indicator-jobs",
+        help="Number of threads used to calculate indicators for all pairs. "
+        "Speeds up indicator calculation for strategies using libraries which release "
+        "the GIL (e.g. TA-Lib, numpy). "
+        "If -1, all CPUs are used, for -2, all CPUs but one are used, etc. "
+        "If 1 (default), pairs are analyzed one after the other.",
+        type=check_int_nonzero,
+        metavar="JOBS",
+    ),
+    "data_load_jobs": Arg(
+        "--data-load-jobs",
+        help="Number of threads used to load candle data for all pairs. "
+        "If -1, all CPUs are used, for -2, all CPUs but one are used, etc. "
+        "If 1 (default), pairs are loaded one after the other.",
+        type=check_int_nonzero,
+        metavar="JOBS",
+    ),
+    "backtest_strategy_jobs": Arg(
+        "--strategy-jobs",
+        help="Number of worker processes used to backtest the strategies of `--strategy-list`. "
+        "Candle data is loaded once and shared with all workers. "
+        "If -1, all CPUs are used, for -2, all CPUs but one are used, etc. "
+        "If 1 (default), strategies are backtested one after the other.",
+        type=check_int_nonzero,
+        metavar="JOBS",
+    ),
     # Edge
     "stoploss_range": Arg(
         "--stoplosses",
@@ -285,6 +327,14 @@ AVAILABLE_CLI_OPTIONS = {
         action="store_true",
         default=False,
     ),
+    "hyperopt_indicator_cache_size": Arg(
+        "--indicator-cache-size",
+        help="Memory (in MB, per hyperopt worker) used to cache indicators between epochs "
+        "when using --analyze-per-epoch. Indicators of a pair are reused if none of the "
+        "parameters used in populate_indicators() changed. Disabled by default.",
+        type=check_int_positive,
+        metavar="MB",
+    ),
     "print_all": Arg(
         "--print-all",
         help="Print all results, not only the best ones.",
@@ -322,6 +372,21 @@ AVAILABLE_CLI_OPTIONS = {
         metavar="JOBS",
         default=-1,
     ),
+    "hyperopt_persistent_workers": Arg(
+        "--persistent-workers",
+        help="Keep hyperopt worker processes running for the whole hyperopt run. "
+        "Strategy and backtesting state are sent to every worker once, instead of "
+        "with every epoch.",
+        action="store_true",
+        default=False,
+    ),
+    "hyperopt_async_scheduler": Arg(
+        "--async-scheduler",
+        help="Start a new epoch as soon as a worker becomes idle, instead of waiting for "
+        "all epochs of a batch to complete. Uses persistent worker processes.",
+        action="store_true",
+        default=False,
+    ),
     "hyperopt_random_state": Arg(
         "--random-state",
         help="Set random state to some positive integer for reproducible hyperopt results.",
@@ -443,6 +508,13 @@ AVAILABLE_CLI_OPTIONS = {
         type=check_int_positive,
         metavar="INT",
     ),
+    "download_jobs": Arg(
+        "--download-jobs",
+        help="Number of pair / timeframe combinations to download concurrently. "
+        "Requests are still limited by the exchange's rate limit. Default: 1.",
+        type=check_int_positive,
+        metavar="INT",
+    ),
     "download_trades": Arg(
         "--dl-trades",
         help="Download trades instead of OHLCV data.",
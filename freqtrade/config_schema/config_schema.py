@@ -4,6 +4,7 @@ from freqtrade.constants import (
     AVAILABLE_DATAHANDLERS,
     AVAILABLE_PAIRLISTS,
     BACKTEST_BREAKDOWNS,
+    BACKTEST_ENGINES,
     DRY_RUN_WALLET,
     EXPORT_OPTIONS,
     MARGIN_MODES,
@@ -216,6 +217,78 @@ CONF_SCHEMA = {
             "type": "array",
             "items": {"type": "string", "enum": BACKTEST_BREAKDOWNS},
         },
+        "backtest_engine": {
+            "description": (
+                "Backtesting engine. `columnar` keeps candles in numpy arrays and only "
+                "visits candles with entry signals or open trades."
+            ),
+            "type": "string",
+            "enum": BACKTEST_ENGINES,
+            "default": "classic",
+        },
+        "backtest_incremental_cache": {
+            "description": (
+                "Store the backtest state before the last candle, to continue from it "
+                "when backtesting with a later end date."
+            ),
+            "type": "boolean",
+            "default": False,
+        },
+        "backtest_strategy_jobs": {
+            "description": (
+                "Number of worker processes used to backtest multiple strategies. -1 uses all CPUs."
+            ),
+            "type": "integer",
+            "default": 1,
+        },
+        "analyze_jobs": {
+            "description": (
+                "Number of threads used to analyze pairs in dry-run and live mode. "
+                "-1 uses all CPUs."
+            ),
+            "type": "integer",
+            "default": 1,
+        },
+        "indicator_jobs": {
+            "description": (
+                "Number of threads used to calculate indicators for all pairs in "
+                "backtesting, hyperopt and lookahead analysis. -1 uses all CPUs."
+            ),
+            "type": "integer",
+            "default": 1,
+        },
+        "data_load_jobs": {
+            "description": (
+                "Number of threads used to load candle data for all pairs in "
+                "backtesting, hyperopt and lookahead analysis. -1 uses all CPUs."
+            ),
+            "type": "integer",
+            "default": 1,
+        },
+        "ohlcv_cache_size": {
+            "description": (
+                "Memory (in MB) used to cache candle data loaded from disk, so repeated "
+                "backtests in one process (e.g. through the webserver) reuse it. "
+                "0 disables the cache."
+            ),
+            "type": "integer",
+            "minimum": 0,
+            "default": 0,
+        },
+        "ohlcv_base_timeframe": {
+            "description": (
+                "Only download candles of this timeframe (e.g. `1m`). Higher timeframes are "
+                "aggregated from it when loading data."
+            ),
+            "type": "string",
+        },
+        "ohlcv_candle_offset": {
+            "description": (
+                "Shift the boundaries of aggregated candles by this duration (e.g. `8h`), "
+                "for exchanges not aligning daily candles to midnight UTC."
+            ),
+            "type": "string",
+        },
         "bot_name": {
             "description": "Name of the trading bot. Passed via API to a client.",
             "type": "string",
@@ -716,6 +789,14 @@ CONF_SCHEMA = {
                     "description": "Enable systemd notify.",
                     "type": "boolean",
                 },
+                "event_driven": {
+                    "description": (
+                        "Refresh and analyze pairs only once per candle, "
+                        "handling open trades in between."
+                    ),
+                    "type": "boolean",
+                    "default": False,
+                },
             },
         },
         "dataformat_ohlcv": {
@@ -744,6 +825,12 @@ CONF_SCHEMA = {
             "description": "Download trades data by default (instead of ohlcv data).",
             "type": "boolean",
         },
+        "download_jobs": {
+            "description": "Number of pair / timeframe combinations to download concurrently.",
+            "type": "integer",
+            "minimum": 1,
+            "default": 1,
+        },
         "max_entry_position_adjustment": {
             "description": f"Maximum entry position adjustment allowed. {__IN_STRATEGY}",
             "type": ["integer", "number"],
@@ -790,6 +877,11 @@ CONF_SCHEMA = {
                     "type": "number",
                     "minimum": 0.0,
                 },
+                "store_trades": {
+                    "description": "Store the raw trades of each candle in the `trades` column.",
+                    "type": "boolean",
+                    "default": False,
+                },
             },
             "required": [
                 "max_candles",
@@ -308,6 +308,11 @@ class Configuration:
             ("export", "Parameter --export detected: {} ..."),
             ("backtest_breakdown", "Parameter --breakdown detected ..."),
             ("backtest_cache", "Parameter --cache={} detected ..."),
+            ("backtest_incremental_cache", "Parameter --incremental-cache detected ..."),
+            ("backtest_engine", "Parameter --backtest-engine detected, using {} engine ..."),
+            ("backtest_strategy_jobs", "Parameter --strategy-jobs detected: {} ..."),
+            ("indicator_jobs", "Parameter --indicator-jobs detected: {} ..."),
+            ("data_load_jobs", "Parameter --data-load-jobs detected: {} ..."),
             ("disableparamexport", "Parameter --disableparamexport detected: {} ..."),
             ("freqai_backtest_live_models", "Parameter --freqai-backtest-live-models detected ..."),
         ]
@@ -331,6 +336,7 @@ class Configuration:
             ("epochs", "Parameter --epochs detected ... Will run Hyperopt with for {} epochs ..."),
             ("spaces", "Parameter -s/--spaces detected: {}"),
             ("analyze_per_epoch", "Parameter --analyze-per-epoch detected."),
+            ("hyperopt_indicator_cache_size", "Parameter --indicator-cache-size detected: {} MB"),
             ("print_all", "Parameter --print-all detected ..."),
         ]
         self._args_to_config_loop(config, configurations)
@@ -339,6 +345,8 @@ class Configuration:
             ("print_json", "Parameter --print-json detected ..."),
             ("export_csv", "Parameter --export-csv detected: {}"),
             ("hyperopt_jobs", "Parameter -j/--job-workers detected: {}"),
+            ("hyperopt_persistent_workers", "Parameter --persistent-workers detected ..."),
+            ("hyperopt_async_scheduler", "Parameter --async-scheduler detected ..."),
             ("hyperopt_random_state", "Parameter --random-state detected: {}"),
             ("hyperopt_min_trades", "Parameter --min-trades detected: {}"),
             ("hyperopt_loss", "Using Hyperopt loss class name: {}"),
@@ -378,6 +386,7 @@ class Configuration:
             ("days", "Detected --days: {}"),
             ("include_inactive", "Detected --include-inactive-pairs: {}"),
             ("download_trades", "Detected --dl-trades: {}"),
+            ("download_jobs", "Detected --download-jobs: {}"),
             ("convert_trades", "Detected --convert: {} - Converting Trade data to OHCV {}"),
             ("dataformat_ohlcv", 'Using "{}" to store OHLCV data.'),
             ("dataformat_trades", 'Using "{}" to store trades data.'),
@@ -63,6 +63,7 @@ AVAILABLE_DATAHANDLERS = ["json", "jsongz", "feather", "parquet"]
 BACKTEST_BREAKDOWNS = ["day", "week", "month", "year"]
 BACKTEST_CACHE_AGE = ["none", "day", "week", "month"]
 BACKTEST_CACHE_DEFAULT = "day"
+BACKTEST_ENGINES = ["classic", "columnar"]
 DRY_RUN_WALLET = 1000
 DATETIME_PRINT_FORMAT = "%Y-%m-%d %H:%M:%S"
 MATH_CLOSE_PREC = 1e-14  # Precision used for float comparisons
@@ -70,6 +71,8 @@ DEFAULT_DATAFRAME_COLUMNS = ["date", "open", "high", "low", "close", "volume"]
 # Don't modify sequence of DEFAULT_TRADES_COLUMNS
 # it has wide consequences for stored trades files
 DEFAULT_TRADES_COLUMNS = ["timestamp", "id", "type", "side", "price", "amount", "cost"]
+# Number of trades read at once when streaming trades from disk
+DEFAULT_TRADES_CHUNK_SIZE = 1_000_000
 DEFAULT_ORDERFLOW_COLUMNS = ["level", "bid", "ask", "delta"]
 ORDERFLOW_ADDED_COLUMNS = [
     "trades",
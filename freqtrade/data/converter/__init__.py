@@ -1,7 +1,10 @@
 from freqtrade.data.converter.converter import (
+    can_resample_timeframe,
     clean_ohlcv_dataframe,
     convert_ohlcv_format,
+    merge_ohlcv_dataframes,
     ohlcv_fill_up_missing_data,
+    ohlcv_resample,
     ohlcv_to_dataframe,
     order_book_to_dataframe,
     reduce_dataframe_footprint,
@@ -12,6 +15,7 @@ from freqtrade.data.converter.orderflow import populate_dataframe_with_trades
 from freqtrade.data.converter.trade_converter import (
     convert_trades_format,
     convert_trades_to_ohlcv,
+    trades_chunks_to_ohlcv,
     trades_convert_types,
     trades_df_remove_duplicates,
     trades_dict_to_list,
@@ -21,9 +25,12 @@ from freqtrade.data.converter.trade_converter import (
 
 
 __all__ = [
+    "can_resample_timeframe",
     "clean_ohlcv_dataframe",
     "convert_ohlcv_format",
+    "merge_ohlcv_dataframes",
     "ohlcv_fill_up_missing_data",
+    "ohlcv_resample",
     "ohlcv_to_dataframe",
     "order_book_to_dataframe",
     "reduce_dataframe_footprint",
@@ -32,6 +39,7 @@ __all__ = [
     "convert_trades_format",
     "convert_trades_to_ohlcv",
     "populate_dataframe_with_trades",
+    "trades_chunks_to_ohlcv",
     "trades_convert_types",
     "trades_df_remove_duplicates",
     "trades_dict_to_list",
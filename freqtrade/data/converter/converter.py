@@ -73,16 +73,20 @@ def clean_ohlcv_dataframe(
     :param drop_incomplete: Drop the last candle of the dataframe, assuming it's incomplete
     :return: DataFrame
     """
-    # group by index and aggregate results to eliminate duplicate ticks
-    data = data.groupby(by="date", as_index=False, sort=True).agg(
-        {
-            "open": "first",
-            "high": "max",
-            "low": "min",
-            "close": "last",
-            "volume": "max",
-        }
-    )
+    if _candle_dates(data) is not None:
+        # Dates are unique and sorted already - grouping would not change the data
+        data = data.loc[:, DEFAULT_DATAFRAME_COLUMNS].reset_index(drop=True)
+    else:
+        # group by index and aggregate results to eliminate duplicate ticks
+        data = data.groupby(by="date", as_index=False, sort=True).agg(
+            {
+                "open": "first",
+                "high": "max",
+                "low": "min",
+                "close": "last",
+                "volume": "max",
+            }
+        )
     # eliminate partial candle
     if drop_incomplete:
         data.drop(data.tail(1).index, inplace=True)
@@ -94,32 +98,173 @@ def clean_ohlcv_dataframe(
         return data
 
 
-def ohlcv_fill_up_missing_data(dataframe: DataFrame, timeframe: str, pair: str) -> DataFrame:
+def _candle_dates(data: DataFrame) -> np.ndarray | None:
     """
-    Fills up missing data with 0 volume rows,
-    using the previous close as price for "open", "high", "low" and "close", volume is set to 0
+    Get the candle dates as int64 (in the unit of the date column),
+    if they're strictly increasing.
+    :return: int64 array of dates - or None if dates are unsorted, duplicated or missing.
+    """
+    if "date" not in data or data["date"].dtype.kind != "M":
+        return None
+    dates = data["date"].to_numpy(dtype=data["date"].dtype.base).view("int64")
+    if len(dates) and (dates[0] == np.iinfo(np.int64).min or (np.diff(dates) <= 0).any()):
+        # int64.min is NaT - which would otherwise pass as the smallest date
+        return None
+    return dates
 
+
+def _aligned_candle_dates(data: DataFrame, timeframe: str) -> tuple[np.ndarray, int] | None:
     """
-    from freqtrade.exchange import timeframe_to_resample_freq
+    Get the candle dates as int64 and the timeframe in the same unit,
+    for float candles with strictly increasing dates aligned to the timeframe.
+    :return: Tuple of dates and timeframe step - or None if the candles don't qualify.
+    """
+    from freqtrade.exchange import timeframe_to_seconds
+
+    tf_seconds = timeframe_to_seconds(timeframe)
+    if data.empty or 86400 % tf_seconds != 0:
+        # Resampling aligns candles of longer timeframes to weeks / months
+        return None
+    if any(
+        col not in data or data[col].dtype != np.float64 for col in DEFAULT_DATAFRAME_COLUMNS[1:]
+    ):
+        return None
+    dates = _candle_dates(data)
+    if dates is None:
+        return None
+    unit = np.datetime_data(data["date"].dtype.base)[0]
+    tf_step = np.timedelta64(tf_seconds, "s").astype(f"timedelta64[{unit}]").view("int64")
+    if (dates % tf_step).any():
+        return None
+    return dates, int(tf_step)
+
+
+def _fill_candle_gaps(columns: dict[str, np.ndarray]) -> None:
+    """
+    Fill missing (NaN) candles in place - same as after resampling.
+    """
+    # Forwardfill close, use close for "open, high, low"
+    close = pd.Series(columns["close"]).ffill().to_numpy()
+    columns["close"] = close
+    for col in ("open", "high", "low"):
+        missing = np.isnan(columns[col])
+        columns[col][missing] = close[missing]
+    columns["volume"] = np.nan_to_num(columns["volume"], nan=0.0)
 
-    ohlcv_dict = {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}
-    resample_interval = timeframe_to_resample_freq(timeframe)
-    # Resample to create "NAN" values
-    df = dataframe.resample(resample_interval, on="date").agg(ohlcv_dict)
-
-    # Forwardfill close for missing columns
-    df["close"] = df["close"].ffill()
-    # Use close for "open, high, low"
-    df.loc[:, ["open", "high", "low"]] = df[["open", "high", "low"]].fillna(
-        value={
-            "open": df["close"],
-            "high": df["close"],
-            "low": df["close"],
-        }
+
+def _candles_dataframe(
+    start: int, tf_step: int, date_dtype, columns: dict[str, np.ndarray]
+) -> DataFrame:
+    size = len(columns["close"])
+    date_index = pd.DatetimeIndex((start + np.arange(size) * tf_step).view(date_dtype.base))
+    if getattr(date_dtype, "tz", None) is not None:
+        date_index = date_index.tz_localize(date_dtype.tz)
+    return DataFrame({"date": date_index, **columns})
+
+
+def _fill_up_missing_fast(dataframe: DataFrame, timeframe: str) -> DataFrame | None:
+    """
+    Fill up missing candles without resampling, for candles aligned to the timeframe.
+    Produces the same result as resampling.
+    :return: Filled DataFrame, or None if the data can't be filled this way.
+    """
+    aligned = _aligned_candle_dates(dataframe, timeframe)
+    if aligned is None:
+        return None
+    dates, tf_step = aligned
+    slots = (dates - dates[0]) // tf_step
+    size = int(slots[-1]) + 1
+    columns = {}
+    for col in DEFAULT_DATAFRAME_COLUMNS[1:]:
+        columns[col] = np.full(size, np.nan)
+        columns[col][slots] = dataframe[col].to_numpy()
+    _fill_candle_gaps(columns)
+    return _candles_dataframe(dates[0], tf_step, dataframe["date"].dtype, columns)
+
+
+def _merge_ohlcv_fast(
+    old: DataFrame, new: DataFrame, timeframe: str, pair: str
+) -> DataFrame | None:
+    """
+    Merge candles aligned to the timeframe directly on numpy columns.
+    Only the existing candles from the first new candle onwards are merged,
+    the older candles are kept as they are.
+    Produces the same result as grouping and resampling the concatenated candles.
+    :return: Merged DataFrame, or None if the data can't be merged this way.
+    """
+    if old["date"].dtype != new["date"].dtype:
+        return None
+    aligned_new = _aligned_candle_dates(new, timeframe)
+    if aligned_new is None:
+        return None
+    new_dates, _ = aligned_new
+    # Keep the last old candle in the merged part, so gaps before the new candles can be filled
+    split = min(int(old["date"].searchsorted(new["date"].iat[0])), len(old) - 1)
+    old_tail = old.iloc[split:]
+    aligned_old = _aligned_candle_dates(old_tail, timeframe)
+    if aligned_old is None:
+        return None
+    old_dates, tf_step = aligned_old
+    start = min(old_dates[0], new_dates[0])
+    size = int((max(old_dates[-1], new_dates[-1]) - start) // tf_step) + 1
+    old_slots = (old_dates - start) // tf_step
+    new_slots = (new_dates - start) // tf_step
+
+    columns = {}
+    for col in DEFAULT_DATAFRAME_COLUMNS[1:]:
+        old_col = np.full(size, np.nan)
+        old_col[old_slots] = old_tail[col].to_numpy()
+        new_col = np.full(size, np.nan)
+        new_col[new_slots] = new[col].to_numpy()
+        if col == "open":
+            # First valid value - existing candles take precedence
+            columns[col] = np.where(np.isnan(old_col), new_col, old_col)
+        elif col == "close":
+            # Last valid value - new candles take precedence
+            columns[col] = np.where(np.isnan(new_col), old_col, new_col)
+        elif col == "low":
+            columns[col] = np.fmin(old_col, new_col)
+        else:
+            columns[col] = np.fmax(old_col, new_col)
+    _fill_candle_gaps(columns)
+    _log_fillup(pair, timeframe, len(np.union1d(old_slots, new_slots)), size)
+    merged = _candles_dataframe(start, tf_step, old["date"].dtype, columns)
+    if split == 0:
+        return merged
+    prefix = old.iloc[:split][DEFAULT_DATAFRAME_COLUMNS]
+    return pd.concat([prefix, merged], axis=0, ignore_index=True)
+
+
+def merge_ohlcv_dataframes(old: DataFrame, new: DataFrame, timeframe: str, pair: str) -> DataFrame:
+    """
+    Merge new candles into existing candles (e.g. cached candles refreshed from the exchange).
+    Candles of the same date are combined - keeping the open of the existing candle,
+    the close of the new candle and the highest high / volume and lowest low.
+    Missing candles are filled up (see ohlcv_fill_up_missing_data for details).
+    Same result as clean_ohlcv_dataframe on the concatenated candles,
+    but without grouping and resampling for candles aligned to the timeframe.
+    For aligned candles, only the existing candles from the first new candle onwards are merged -
+    so older candles are expected to be clean already (e.g. the result of an earlier merge).
+    :param old: DataFrame with the existing candles
+    :param new: DataFrame with the new candles
+    :param timeframe: timeframe (e.g. 5m)
+    :param pair: Pair this data is for (used to warn if fillup was necessary)
+    :return: DataFrame with the merged candles
+    """
+    if not old.empty and not new.empty:
+        merged = _merge_ohlcv_fast(old, new, timeframe, pair)
+        if merged is not None:
+            return merged
+    return clean_ohlcv_dataframe(
+        pd.concat([old, new], axis=0),
+        timeframe,
+        pair,
+        fill_missing=True,
+        drop_incomplete=False,
     )
-    df.reset_index(inplace=True)
-    len_before = len(dataframe)
-    len_after = len(df)
+
+
+def _log_fillup(pair: str, timeframe: str, len_before: int, len_after: int) -> None:
     pct_missing = (len_after - len_before) / len_before if len_before > 0 else 0
     if len_before != len_after:
         message = (
@@ -131,6 +276,93 @@ def ohlcv_fill_up_missing_data(dataframe: DataFrame, timeframe: str, pair: str)
         else:
             # Don't be verbose if only a small amount is missing
             logger.debug(message)
+
+
+def ohlcv_fill_up_missing_data(dataframe: DataFrame, timeframe: str, pair: str) -> DataFrame:
+    """
+    Fills up missing data with 0 volume rows,
+    using the previous close as price for "open", "high", "low" and "close", volume is set to 0
+    Sorted candles aligned to the timeframe are filled directly, without resampling.
+    """
+    from freqtrade.exchange import timeframe_to_resample_freq
+
+    df = _fill_up_missing_fast(dataframe, timeframe)
+    if df is None:
+        ohlcv_dict = {
+            "open": "first",
+            "high": "max",
+            "low": "min",
+            "close": "last",
+            "volume": "sum",
+        }
+        resample_interval = timeframe_to_resample_freq(timeframe)
+        # Resample to create "NAN" values
+        df = dataframe.resample(resample_interval, on="date").agg(ohlcv_dict)
+
+        # Forwardfill close for missing columns
+        df["close"] = df["close"].ffill()
+        # Use close for "open, high, low"
+        df.loc[:, ["open", "high", "low"]] = df[["open", "high", "low"]].fillna(
+            value={
+                "open": df["close"],
+                "high": df["close"],
+                "low": df["close"],
+            }
+        )
+        df.reset_index(inplace=True)
+    _log_fillup(pair, timeframe, len(dataframe), len(df))
+    return df
+
+
+def can_resample_timeframe(base_timeframe: str | None, timeframe: str) -> bool:
+    """
+    Check if candles of timeframe can be aggregated from candles of base_timeframe.
+    """
+    from freqtrade.exchange import timeframe_to_seconds
+
+    if not base_timeframe:
+        return False
+    base_seconds = timeframe_to_seconds(base_timeframe)
+    tf_seconds = timeframe_to_seconds(timeframe)
+    return tf_seconds > base_seconds and tf_seconds % base_seconds == 0
+
+
+def ohlcv_resample(
+    dataframe: DataFrame, base_timeframe: str, timeframe: str, *, offset: str | None = None
+) -> DataFrame:
+    """
+    Aggregate candles to a higher timeframe.
+    Candles at the start and end of the data which are not fully covered are dropped.
+    :param dataframe: DataFrame with candles of base_timeframe
+    :param base_timeframe: Timeframe of the candles in dataframe (e.g. "1m")
+    :param timeframe: Timeframe to aggregate to (e.g. "1h")
+    :param offset: Shift candle boundaries by this duration (e.g. "8h"),
+                   for exchanges not aligning candles to UTC midnight.
+    :return: DataFrame with candles of timeframe
+    """
+    from pandas.tseries.frequencies import to_offset
+
+    from freqtrade.exchange import timeframe_to_resample_freq, timeframe_to_seconds
+
+    if dataframe.empty:
+        return dataframe
+    shift = pd.Timedelta(seconds=timeframe_to_seconds(offset)) if offset else pd.Timedelta(0)
+    freq = timeframe_to_resample_freq(timeframe)
+    df = dataframe.assign(date=dataframe["date"] - shift)
+    df = (
+        df.resample(freq, on="date", origin="epoch", closed="left", label="left")
+        .agg({"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"})
+        .dropna(subset=["open"])
+        .reset_index()
+    )
+    if df.empty:
+        return df
+    # Drop candles only partially covered by the base candles
+    base_step = pd.Timedelta(seconds=timeframe_to_seconds(base_timeframe))
+    first_base, last_base = dataframe["date"].iat[0] - shift, dataframe["date"].iat[-1] - shift
+    complete = (df["date"] >= first_base) & (df["date"] + to_offset(freq) <= last_base + base_step)
+    df = df.loc[complete].reset_index(drop=True)
+    df["date"] += shift
     return df
 
 
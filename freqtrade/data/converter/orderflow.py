@@ -4,7 +4,6 @@ Functions to convert orderflow data from public_trades
 
 import logging
 import time
-from datetime import datetime
 
 import numpy as np
 import pandas as pd
@@ -76,6 +75,143 @@ def _calculate_ohlcv_candle_start_and_end(df: pd.DataFrame, timeframe: str):
         df.drop(columns=["datetime"], inplace=True)
 
 
+def _stacked_imbalance_starts(
+    imbalance: np.ndarray, group_starts: np.ndarray, stacked_imbalance_range: int
+) -> np.ndarray:
+    """
+    Find the beginnings of stacked imbalance ranges, for the price levels of all candles at once.
+    Same as stacked_imbalance - runs of imbalanced levels don't extend across candles.
+    :param imbalance: Boolean imbalance per price level, sorted by candle and price
+    :param group_starts: Index of the first price level of each candle
+    :param stacked_imbalance_range: Minimum number of consecutive imbalanced levels
+    :return: Indexes of the price levels where a stacked imbalance range begins
+    """
+    idx = np.arange(len(imbalance))
+    # Index of the last level interrupting a run - before the level, or the start of its candle
+    interruption = np.where(imbalance, -1, idx)
+    interruption[group_starts] = np.where(imbalance[group_starts], group_starts - 1, group_starts)
+    counts = np.where(imbalance, idx - np.maximum.accumulate(interruption), 0)
+    valid = idx[counts >= stacked_imbalance_range]
+    return valid - (stacked_imbalance_range - 1)
+
+
+def _orderflow_per_candle(
+    trades: pd.DataFrame, config_orderflow: dict, store_trades: bool
+) -> tuple[pd.Index, dict[str, list]]:
+    """
+    Calculate orderflow for all candles in one pass.
+    Produces the same values as applying trades_to_volumeprofile_with_total_delta_bid_ask,
+    trades_orderflow_to_imbalances and stacked_imbalance to the trades of each candle.
+    :param trades: Trades with "candle_start" column
+    :param config_orderflow: Orderflow configuration
+    :param store_trades: Include the raw trades of each candle
+    :return: Tuple of candle starts and the values of the orderflow columns per candle
+    """
+    codes, candle_starts = pd.factorize(trades["candle_start"], sort=True)
+    order = np.argsort(codes, kind="stable")
+    trades = trades.iloc[order]
+    codes = codes[order]
+    bounds = np.searchsorted(codes, np.arange(len(candle_starts) + 1))
+
+    is_sell = trades["side"].str.contains("sell").to_numpy()
+    is_buy = trades["side"].str.contains("buy").to_numpy()
+    amount = trades["amount"].to_numpy()
+    bid_amount = np.where(is_sell, amount, 0)
+    ask_amount = np.where(is_buy, amount, 0)
+    scale = config_orderflow["scale"]
+
+    # Volume profile - grouped by candle and price bin
+    profile = pd.DataFrame(
+        {
+            "candle": codes,
+            "price": ((trades["price"] / scale).round() * scale).astype("float64").to_numpy(),
+            "bid": np.where(is_sell, 1, 0),
+            "ask": np.where(is_buy, 1, 0),
+            "delta": ask_amount - bid_amount,
+            "bid_amount": bid_amount,
+            "ask_amount": ask_amount,
+            "total_volume": ask_amount + bid_amount,
+            "total_trades": np.where(is_sell, 1, 0) + np.where(is_buy, 1, 0),
+        }
+    )
+    profile = profile.groupby(["candle", "price"], sort=True).sum()
+    level_candles = profile.index.get_level_values("candle").to_numpy()
+    level_prices = profile.index.get_level_values("price").to_numpy()
+    level_bounds = np.searchsorted(level_candles, np.arange(len(candle_starts) + 1))
+    level_starts = level_bounds[:-1][level_bounds[:-1] < level_bounds[1:]]
+
+    # Imbalances - compares bid and ask diagonally, within each candle
+    level_bid = profile["bid"].to_numpy()
+    next_ask = np.append(profile["ask"].to_numpy()[1:], np.nan).astype("float64")
+    next_ask[level_bounds[1:][level_bounds[1:] > level_bounds[:-1]] - 1] = np.nan
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bid_imbalance = (level_bid / next_ask) > config_orderflow["imbalance_ratio"]
+        ask_imbalance = (next_ask / level_bid) > config_orderflow["imbalance_ratio"]
+    # Imbalances are only considered if the volume is big enough
+    enough_volume = profile["total_volume"].to_numpy() >= config_orderflow["imbalance_volume"]
+    bid_imbalance &= enough_volume
+    ask_imbalance &= enough_volume
+
+    stacked_imbalance_range = config_orderflow["stacked_imbalance_range"]
+    stacked_bid = _stacked_imbalance_starts(bid_imbalance, level_starts, stacked_imbalance_range)
+    stacked_ask = _stacked_imbalance_starts(ask_imbalance, level_starts, stacked_imbalance_range)
+    stacked_bid_bounds = np.searchsorted(stacked_bid, level_bounds)
+    stacked_ask_bounds = np.searchsorted(stacked_ask, level_bounds)
+
+    level_keys = level_prices.tolist()
+    level_values = profile.to_dict(orient="records")
+    level_imbalances = [
+        {"bid_imbalance": bid, "ask_imbalance": ask}
+        for bid, ask in zip(bid_imbalance.tolist(), ask_imbalance.tolist(), strict=True)
+    ]
+    records = (
+        trades.drop(columns=["candle_start", "candle_end"]).to_dict(orient="records")
+        if store_trades
+        else None
+    )
+    deltas_per_trade = ask_amount - bid_amount
+
+    result: dict[str, list] = {col: [] for col in ORDERFLOW_ADDED_COLUMNS}
+    for i in range(len(candle_starts)):
+        start, end = bounds[i], bounds[i + 1]
+        level_start, level_end = level_bounds[i], level_bounds[i + 1]
+        result["trades"].append(records[start:end] if records is not None else np.nan)
+        result["orderflow"].append(
+            dict(
+                zip(
+                    level_keys[level_start:level_end],
+                    level_values[level_start:level_end],
+                    strict=True,
+                )
+            )
+        )
+        result["imbalances"].append(
+            dict(
+                zip(
+                    level_keys[level_start:level_end],
+                    level_imbalances[level_start:level_end],
+                    strict=True,
+                )
+            )
+        )
+        result["stacked_imbalances_bid"].append(
+            list(level_prices[stacked_bid[stacked_bid_bounds[i] : stacked_bid_bounds[i + 1]]])
+        )
+        result["stacked_imbalances_ask"].append(
+            list(level_prices[stacked_ask[stacked_ask_bounds[i] : stacked_ask_bounds[i + 1]]])
+        )
+        cumulative_delta = deltas_per_trade[start:end].cumsum()
+        result["max_delta"].append(cumulative_delta.max())
+        result["min_delta"].append(cumulative_delta.min())
+        bid = bid_amount[start:end].sum()
+        ask = ask_amount[start:end].sum()
+        result["bid"].append(bid)
+        result["ask"].append(ask)
+        result["delta"].append(ask - bid)
+        result["total_trades"].append(end - start)
+    return candle_starts, result
+
+
 def populate_dataframe_with_trades(
     cached_grouped_trades: pd.DataFrame | None,
     config: Config,
@@ -109,72 +245,33 @@ def populate_dataframe_with_trades(
         trades = trades.loc[trades["candle_start"] >= start_date]
         trades.reset_index(inplace=True, drop=True)
 
-        # group trades by candle start
-        trades_grouped_by_candle_start = trades.groupby("candle_start", group_keys=False)
-
-        candle_start: datetime
-        for candle_start, trades_grouped_df in trades_grouped_by_candle_start:
-            is_between = candle_start == dataframe["date"]
-            if is_between.any():
-                # there can only be one row with the same date
-                index = dataframe.index[is_between][0]
-
-                if (
-                    cached_grouped_trades is not None
-                    and (candle_start == cached_grouped_trades["date"]).any()
-                ):
-                    # Check if the trades are already in the cache
-                    cache_idx = cached_grouped_trades.index[
-                        cached_grouped_trades["date"] == candle_start
-                    ][0]
-                    for col in ORDERFLOW_ADDED_COLUMNS:
-                        dataframe.at[index, col] = cached_grouped_trades.at[cache_idx, col]
-                    continue
-
-                dataframe.at[index, "trades"] = trades_grouped_df.drop(
-                    columns=["candle_start", "candle_end"]
-                ).to_dict(orient="records")
-
-                # Calculate orderflow for each candle
-                orderflow = trades_to_volumeprofile_with_total_delta_bid_ask(
-                    trades_grouped_df, scale=config_orderflow["scale"]
-                )
-                dataframe.at[index, "orderflow"] = orderflow.to_dict(orient="index")
-                # orderflow_series.loc[[index]] = [orderflow.to_dict(orient="index")]
-                # Calculate imbalances for each candle's orderflow
-                imbalances = trades_orderflow_to_imbalances(
-                    orderflow,
-                    imbalance_ratio=config_orderflow["imbalance_ratio"],
-                    imbalance_volume=config_orderflow["imbalance_volume"],
-                )
-                dataframe.at[index, "imbalances"] = imbalances.to_dict(orient="index")
-
-                stacked_imbalance_range = config_orderflow["stacked_imbalance_range"]
-                dataframe.at[index, "stacked_imbalances_bid"] = stacked_imbalance(
-                    imbalances, label="bid", stacked_imbalance_range=stacked_imbalance_range
-                )
-
-                dataframe.at[index, "stacked_imbalances_ask"] = stacked_imbalance(
-                    imbalances, label="ask", stacked_imbalance_range=stacked_imbalance_range
-                )
-
-                bid = np.where(
-                    trades_grouped_df["side"].str.contains("sell"), trades_grouped_df["amount"], 0
-                )
-
-                ask = np.where(
-                    trades_grouped_df["side"].str.contains("buy"), trades_grouped_df["amount"], 0
-                )
-                deltas_per_trade = ask - bid
-                dataframe.at[index, "max_delta"] = deltas_per_trade.cumsum().max()
-                dataframe.at[index, "min_delta"] = deltas_per_trade.cumsum().min()
-
-                dataframe.at[index, "bid"] = bid.sum()
-                dataframe.at[index, "ask"] = ask.sum()
-                dataframe.at[index, "delta"] = (
-                    dataframe.at[index, "ask"] - dataframe.at[index, "bid"]
-                )
-                dataframe.at[index, "total_trades"] = len(trades_grouped_df)
+        # Candles can only be populated if they're in the dataframe
+        dataframe_dates = pd.Index(dataframe["date"])
+        trades = trades.loc[dataframe_dates.get_indexer(trades["candle_start"]) >= 0]
+        columns = {col: dataframe[col].to_numpy(copy=True) for col in ORDERFLOW_ADDED_COLUMNS}
+
+        if cached_grouped_trades is not None and not trades.empty:
+            # Use cached orderflow for candles which are already in the cache
+            cache_idx = pd.Index(cached_grouped_trades["date"]).get_indexer(trades["candle_start"])
+            cached_dates = trades.loc[cache_idx >= 0, "candle_start"].unique()
+            if len(cached_dates) > 0:
+                cache_rows = pd.Index(cached_grouped_trades["date"]).get_indexer(cached_dates)
+                rows = dataframe_dates.get_indexer(cached_dates)
+                for col in ORDERFLOW_ADDED_COLUMNS:
+                    columns[col][rows] = cached_grouped_trades[col].to_numpy()[cache_rows]
+                trades = trades.loc[cache_idx < 0]
+
+        if not trades.empty:
+            candle_starts, orderflow = _orderflow_per_candle(
+                trades, config_orderflow, config_orderflow.get("store_trades", False)
+            )
+            rows = dataframe_dates.get_indexer(candle_starts)
+            for col in ORDERFLOW_ADDED_COLUMNS:
+                # Series keeps lists and dicts as individual values
+                columns[col][rows] = pd.Series(orderflow[col], dtype=columns[col].dtype).to_numpy()
+
+        for col in ORDERFLOW_ADDED_COLUMNS:
+            dataframe[col] = columns[col]
 
         logger.debug(f"trades.groups_keys in {time.time() - start_time} seconds")
 
@@ -3,6 +3,7 @@ Functions to convert data from one format to another
 """
 
 import logging
+from collections.abc import Iterable
 from pathlib import Path
 
 import pandas as pd
@@ -89,6 +90,48 @@ def trades_to_ohlcv(trades: DataFrame, timeframe: str) -> DataFrame:
     return df_new.loc[:, DEFAULT_DATAFRAME_COLUMNS]
 
 
+def trades_chunks_to_ohlcv(
+    chunks: Iterable[DataFrame], timeframes: list[str]
+) -> dict[str, DataFrame]:
+    """
+    Converts chunks of trades to OHLCV for multiple timeframes in one pass.
+    Only one chunk of trades is held in memory at a time.
+    :param chunks: Chunks of trades, sorted by timestamp (e.g. from IDataHandler.trades_load_chunks)
+    :param timeframes: Timeframes to resample data to
+    :return: Dict of timeframe -> OHLCV Dataframe.
+    :raises: ValueError if no trades are provided
+    """
+    parts: dict[str, list[DataFrame]] = {timeframe: [] for timeframe in timeframes}
+    for chunk in chunks:
+        if chunk.empty:
+            continue
+        for timeframe in timeframes:
+            parts[timeframe].append(trades_to_ohlcv(chunk, timeframe))
+
+    result = {}
+    for timeframe, ohlcv_parts in parts.items():
+        if not ohlcv_parts:
+            raise ValueError("Trade-list empty.")
+        if len(ohlcv_parts) == 1:
+            result[timeframe] = ohlcv_parts[0]
+            continue
+        # Candles spanning a chunk boundary are split across two parts
+        result[timeframe] = (
+            pd.concat(ohlcv_parts, axis=0, ignore_index=True)
+            .groupby("date", sort=False, as_index=False)
+            .agg(
+                open=("open", "first"),
+                high=("high", "max"),
+                low=("low", "min"),
+                close=("close", "last"),
+                volume=("volume", "sum"),
+            )
+            .set_index("date", drop=False)
+            .loc[:, DEFAULT_DATAFRAME_COLUMNS]
+        )
+    return result
+
+
 def convert_trades_to_ohlcv(
     pairs: list[str],
     timeframes: list[str],
@@ -101,6 +144,7 @@ def convert_trades_to_ohlcv(
 ) -> None:
     """
     Convert stored trades data to ohlcv data
+    Trades are streamed from disk in chunks, building all timeframes in one pass.
     """
     from freqtrade.data.history import get_datahandler
 
@@ -113,17 +157,23 @@ def convert_trades_to_ohlcv(
     )
     trading_mode = TradingMode.FUTURES if candle_type != CandleType.SPOT else TradingMode.SPOT
     for pair in pairs:
-        trades = data_handler_trades.trades_load(pair, trading_mode)
-        for timeframe in timeframes:
-            if erase:
+        if erase:
+            for timeframe in timeframes:
                 if data_handler_ohlcv.ohlcv_purge(pair, timeframe, candle_type=candle_type):
                     logger.info(f"Deleting existing data for pair {pair}, interval {timeframe}.")
-            try:
-                ohlcv = trades_to_ohlcv(trades, timeframe)
-                # Store ohlcv
-                data_handler_ohlcv.ohlcv_store(pair, timeframe, data=ohlcv, candle_type=candle_type)
-            except ValueError:
-                logger.warning(f"Could not convert {pair} to OHLCV.")
+        try:
+            ohlcv_per_timeframe = trades_chunks_to_ohlcv(
+                data_handler_trades.trades_load_chunks(pair, trading_mode), timeframes
+            )
+        except ValueError:
+            logger.warning(f"Could not convert {pair} to OHLCV.")
+            continue
+        except Exception:
+            logger.exception(f"Error loading trades for {pair}, not converting to OHLCV.")
+            continue
+        for timeframe, ohlcv in ohlcv_per_timeframe.items():
+            # Store ohlcv
+            data_handler_ohlcv.ohlcv_store(pair, timeframe, data=ohlcv, candle_type=candle_type)
 
 
 def convert_trades_format(config: Config, convert_from: str, convert_to: str, erase: bool):
@@ -8,6 +8,7 @@ Common Interface for bot and strategy to access data.
 import logging
 from collections import deque
 from datetime import datetime, timezone
+from threading import Lock
 from typing import Any
 
 from pandas import DataFrame, Timedelta, Timestamp, to_timedelta
@@ -32,6 +33,11 @@ from freqtrade.util import PeriodicCache
 
 logger = logging.getLogger(__name__)
 
+# Serializes loading of historic data per pair - indicators may be calculated in multiple threads.
+# Module level, as DataProvider instances are pickled for backtesting worker processes.
+_historic_load_locks: dict[PairWithTimeframe, Lock] = {}
+_historic_load_locks_lock = Lock()
+
 NO_EXCHANGE_EXCEPTION = "Exchange is not available to DataProvider."
 MAX_DATAFRAME_CANDLES = 1000
 
@@ -305,30 +311,35 @@ class DataProvider:
             else self._config["candle_type_def"]
         )
         saved_pair: PairWithTimeframe = (pair, str(timeframe), _candle_type)
-        if saved_pair not in self.__cached_pairs_backtesting:
-            timerange = TimeRange.parse_timerange(
-                None
-                if self._config.get("timerange") is None
-                else str(self._config.get("timerange"))
-            )
+        with _historic_load_locks_lock:
+            pair_lock = _historic_load_locks.setdefault(saved_pair, Lock())
+        with pair_lock:
+            if saved_pair not in self.__cached_pairs_backtesting:
+                timerange = TimeRange.parse_timerange(
+                    None
+                    if self._config.get("timerange") is None
+                    else str(self._config.get("timerange"))
+                )
 
-            startup_candles = self.get_required_startup(str(timeframe))
-            tf_seconds = timeframe_to_seconds(str(timeframe))
-            timerange.subtract_start(tf_seconds * startup_candles)
+                startup_candles = self.get_required_startup(str(timeframe))
+                tf_seconds = timeframe_to_seconds(str(timeframe))
+                timerange.subtract_start(tf_seconds * startup_candles)
 
-            logger.info(
-                f"Loading data for {pair} {timeframe} "
-                f"from {timerange.start_fmt} to {timerange.stop_fmt}"
-            )
+                logger.info(
+                    f"Loading data for {pair} {timeframe} "
+                    f"from {timerange.start_fmt} to {timerange.stop_fmt}"
+                )
 
-            self.__cached_pairs_backtesting[saved_pair] = load_pair_history(
-                pair=pair,
-                timeframe=timeframe,
-                datadir=self._config["datadir"],
-                timerange=timerange,
-                data_format=self._config["dataformat_ohlcv"],
-                candle_type=_candle_type,
-            )
+                self.__cached_pairs_backtesting[saved_pair] = load_pair_history(
+                    pair=pair,
+                    timeframe=timeframe,
+                    datadir=self._config["datadir"],
+                    timerange=timerange,
+                    data_format=self._config["dataformat_ohlcv"],
+                    candle_type=_candle_type,
+                    base_timeframe=self._config.get("ohlcv_base_timeframe"),
+                    candle_offset=self._config.get("ohlcv_candle_offset"),
+                )
         return self.__cached_pairs_backtesting[saved_pair].copy()
 
     def get_required_startup(self, timeframe: str) -> int:
@@ -8,6 +8,7 @@ Includes:
 
 # flake8: noqa: F401
 from .datahandlers import get_datahandler
+from .datahandlers.ohlcvcache import set_ohlcv_cache_size
 from .history_utils import (
     convert_trades_to_ohlcv,
     download_data_main,
@@ -0,0 +1,94 @@
+"""
+Helpers to read only the data of a timerange from arrow based files (feather / parquet).
+"""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+from pandas import DataFrame, concat
+
+from freqtrade.configuration import TimeRange
+
+
+def has_date_bounds(timerange: TimeRange | None) -> bool:
+    """
+    Check if the timerange limits the dates to load.
+    """
+    return timerange is not None and "date" in (timerange.starttype, timerange.stoptype)
+
+
+def _date_scalar(date_type: pa.DataType, timestamp: int) -> pa.Scalar:
+    if pa.types.is_timestamp(date_type):
+        return pa.scalar(timestamp, type=pa.timestamp("s", tz="UTC")).cast(date_type)
+    # Legacy files store the date as milliseconds
+    return pa.scalar(timestamp * 1000, type=date_type)
+
+
+def timerange_bounds(
+    date_type: pa.DataType, timerange: TimeRange
+) -> tuple[pa.Scalar | None, pa.Scalar | None]:
+    """
+    Get the (inclusive) start and end of the timerange, matching the type of the date column.
+    :param date_type: Arrow type of the date column
+    :param timerange: Timerange to get bounds for
+    :return: Tuple of lower and upper bound - None if the timerange is open on this side
+    """
+    lower = _date_scalar(date_type, timerange.startts) if timerange.starttype == "date" else None
+    upper = _date_scalar(date_type, timerange.stopts) if timerange.stoptype == "date" else None
+    return lower, upper
+
+
+def timerange_expression(date_field: pa.Field, timerange: TimeRange) -> pc.Expression:
+    """
+    Build a filter expression selecting the rows within the timerange.
+    Parquet uses this expression to skip row groups based on their statistics.
+    :param date_field: Arrow field of the date column
+    :param timerange: Timerange to filter for - must have at least one date bound
+    """
+    lower, upper = timerange_bounds(date_field.type, timerange)
+    date = pc.field(date_field.name)
+    if lower is not None and upper is not None:
+        return (date >= lower) & (date <= upper)
+    return date >= lower if lower is not None else date <= upper
+
+
+def iter_dataframe_chunks(
+    files: list[Path],
+    file_format: str,
+    *,
+    date_column: str,
+    timerange: TimeRange | None,
+    chunk_size: int,
+) -> Iterator[DataFrame]:
+    """
+    Read files one after the other, yielding DataFrames of up to chunk_size rows.
+    Only one chunk is held in memory at a time.
+    :param files: Files to read, in order
+    :param file_format: "feather" or "parquet"
+    :param date_column: Column used to filter for the timerange
+    :param timerange: Only read rows within this timerange
+    :param chunk_size: Maximum number of rows per chunk
+    """
+    pending: list[DataFrame] = []
+    rows = 0
+    for file in files:
+        dataset = ds.dataset(file, format=file_format)
+        row_filter = None
+        if has_date_bounds(timerange):
+            row_filter = timerange_expression(dataset.schema.field(date_column), timerange)
+        for batch in dataset.to_batches(
+            filter=row_filter, batch_size=chunk_size, use_threads=False
+        ):
+            if batch.num_rows == 0:
+                continue
+            if rows + batch.num_rows > chunk_size and pending:
+                yield concat(pending, axis=0, ignore_index=True)
+                pending = []
+                rows = 0
+            pending.append(batch.to_pandas(ignore_metadata=True))
+            rows += batch.num_rows
+    if pending:
+        yield concat(pending, axis=0, ignore_index=True)
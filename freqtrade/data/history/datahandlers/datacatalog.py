@@ -0,0 +1,238 @@
+"""
+Catalog of the ohlcv data files in a datadir.
+Stores date range, number of candles and gaps per data file in a sqlite sidecar,
+so this information is available without loading the data files.
+"""
+
+import glob
+import logging
+import sqlite3
+from contextlib import closing
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from pathlib import Path
+
+from pandas import DataFrame, Series
+
+from freqtrade.enums import CandleType
+from freqtrade.exchange import timeframe_to_seconds
+
+
+logger = logging.getLogger(__name__)
+
+CATALOG_FILENAME = ".datacatalog.sqlite"
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    pair: str
+    timeframe: str
+    candle_type: CandleType
+    min_date: datetime
+    max_date: datetime
+    rows: int
+    # Number of missing candles between min_date and max_date
+    gaps: int
+    # Size and modification time of the data file and its segments when the entry was written
+    checksum: str
+
+
+def segment_files(filename: Path) -> list[Path]:
+    """
+    Get the segments appended to a data file, oldest first.
+    Segments are named `<filename>.<number>.seg`, so they're not mistaken for data files.
+    """
+    return sorted(filename.parent.glob(f"{glob.escape(filename.name)}.*.seg"))
+
+
+def _file_checksum(filename: Path) -> str | None:
+    """
+    Checksum of a data file, covering the segments appended to it.
+    :return: Checksum, or None if the data file doesn't exist.
+    """
+    try:
+        stats = [(f.name, f.stat()) for f in [filename, *segment_files(filename)]]
+    except OSError:
+        return None
+    return ";".join(f"{name}-{stat.st_size}-{stat.st_mtime_ns}" for name, stat in stats)
+
+
+def _count_gaps(dates: Series, timeframe: str) -> int:
+    """
+    Count the candles missing between the first and the last date.
+    """
+    if len(dates) < 2:
+        return 0
+    steps = dates.diff().dt.total_seconds().iloc[1:] // timeframe_to_seconds(timeframe)
+    return int((steps - 1).clip(lower=0).sum())
+
+
+class DataCatalog:
+    """
+    Sqlite sidecar recording the contents of the ohlcv data files of one datadir.
+    Entries are validated against the size and modification time of the data file
+    and its segments, so files changed outside of freqtrade are not served from the catalog.
+    Errors accessing the catalog are never fatal - callers fall back to the data files.
+    """
+
+    def __init__(self, datadir: Path) -> None:
+        self._datadir = datadir
+        self._path = datadir / CATALOG_FILENAME
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._path, timeout=10)
+        # The catalog can be rebuilt from the data files - durability is not required.
+        conn.execute("PRAGMA synchronous = OFF")
+        if not self._initialized:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS ohlcv ("
+                "file TEXT PRIMARY KEY, pair TEXT, timeframe TEXT, candle_type TEXT, "
+                "min_date INTEGER, max_date INTEGER, rows INTEGER, gaps INTEGER, checksum TEXT)"
+            )
+            self._initialized = True
+        return conn
+
+    def _key(self, filename: Path) -> str:
+        return filename.relative_to(self._datadir).as_posix()
+
+    def get(self, filename: Path) -> CatalogEntry | None:
+        """
+        Get the catalog entry of a data file.
+        :return: CatalogEntry, or None if there's no up-to-date entry for this file.
+        """
+        if not self._path.is_file() or (checksum := _file_checksum(filename)) is None:
+            return None
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT pair, timeframe, candle_type, min_date, max_date, rows, gaps, checksum "
+                    "FROM ohlcv WHERE file = ?",
+                    (self._key(filename),),
+                ).fetchone()
+        except (sqlite3.Error, OSError, ValueError) as e:
+            logger.debug(f"Could not read data catalog {self._path}: {e}")
+            return None
+        if row is None or row[7] != checksum:
+            return None
+        pair, timeframe, candle_type, min_date, max_date, rows, gaps, _ = row
+        return CatalogEntry(
+            pair=pair,
+            timeframe=timeframe,
+            candle_type=CandleType(candle_type),
+            min_date=datetime.fromtimestamp(min_date / 1000, tz=timezone.utc),
+            max_date=datetime.fromtimestamp(max_date / 1000, tz=timezone.utc),
+            rows=rows,
+            gaps=gaps,
+            checksum=checksum,
+        )
+
+    def _write(self, filename: Path, entry: CatalogEntry | None) -> None:
+        try:
+            with closing(self._connect()) as conn, conn:
+                if entry is None:
+                    conn.execute("DELETE FROM ohlcv WHERE file = ?", (self._key(filename),))
+                    return
+                conn.execute(
+                    "INSERT OR REPLACE INTO ohlcv VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        self._key(filename),
+                        entry.pair,
+                        entry.timeframe,
+                        entry.candle_type.value,
+                        int(entry.min_date.timestamp() * 1000),
+                        int(entry.max_date.timestamp() * 1000),
+                        entry.rows,
+                        entry.gaps,
+                        entry.checksum,
+                    ),
+                )
+        except (sqlite3.Error, OSError, ValueError) as e:
+            logger.debug(f"Could not update data catalog {self._path}: {e}")
+
+    def update(
+        self,
+        filename: Path,
+        pair: str,
+        timeframe: str,
+        candle_type: CandleType,
+        data: DataFrame,
+    ) -> CatalogEntry | None:
+        """
+        Record the full content of a data file, after it has been written or loaded.
+        :param data: All candles of the data file, sorted by date
+        """
+        checksum = _file_checksum(filename)
+        if data.empty or checksum is None:
+            self.remove(filename)
+            return None
+        entry = CatalogEntry(
+            pair=pair,
+            timeframe=timeframe,
+            candle_type=CandleType.from_string(candle_type),
+            min_date=data.iloc[0]["date"].to_pydatetime(),
+            max_date=data.iloc[-1]["date"].to_pydatetime(),
+            rows=len(data),
+            gaps=_count_gaps(data["date"], timeframe),
+            checksum=checksum,
+        )
+        self._write(filename, entry)
+        return entry
+
+    def append(
+        self,
+        filename: Path,
+        pair: str,
+        timeframe: str,
+        candle_type: CandleType,
+        data: DataFrame,
+        previous: CatalogEntry | None,
+    ) -> None:
+        """
+        Record candles appended to a data file.
+        Candles of the appended data replace existing candles of the same date.
+        The entry is updated without loading the data file where the result can be derived
+        from the previous entry - otherwise it's removed, to be rebuilt on the next query.
+        :param data: Appended candles, sorted by date
+        :param previous: Catalog entry of the data file, read before the data was appended
+        """
+        checksum = _file_checksum(filename)
+        if previous is None or checksum is None:
+            self.remove(filename)
+            return
+        if data.empty:
+            self._write(filename, replace(previous, checksum=checksum))
+            return
+        first_date = data.iloc[0]["date"]
+        if first_date <= previous.max_date and (
+            previous.gaps > 0 or first_date < previous.min_date
+        ):
+            # Appended candles may fill gaps or extend the start - can't derive the new entry.
+            self.remove(filename)
+            return
+        # Candles up to the previous end replace existing candles (there are no gaps there)
+        new_dates = data.loc[data["date"] > previous.max_date, "date"]
+        if new_dates.empty:
+            self._write(filename, replace(previous, checksum=checksum))
+            return
+        self._write(
+            filename,
+            CatalogEntry(
+                pair=pair,
+                timeframe=timeframe,
+                candle_type=CandleType.from_string(candle_type),
+                min_date=previous.min_date,
+                max_date=new_dates.iloc[-1].to_pydatetime(),
+                rows=previous.rows + len(new_dates),
+                gaps=previous.gaps
+                + _count_gaps(Series([previous.max_date, *new_dates]), timeframe),
+                checksum=checksum,
+            ),
+        )
+
+    def remove(self, filename: Path) -> None:
+        """
+        Remove the entry of a data file.
+        """
+        if self._path.is_file():
+            self._write(filename, None)
@@ -1,11 +1,27 @@
 import logging
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
+from pathlib import Path
 
-from pandas import DataFrame, read_feather, to_datetime
+import pyarrow as pa
+from pandas import DataFrame, concat, read_feather, to_datetime
+from pyarrow import ipc
 
 from freqtrade.configuration import TimeRange
-from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, DEFAULT_TRADES_COLUMNS
+from freqtrade.constants import (
+    DEFAULT_DATAFRAME_COLUMNS,
+    DEFAULT_TRADES_CHUNK_SIZE,
+    DEFAULT_TRADES_COLUMNS,
+)
+from freqtrade.data.converter import trades_df_remove_duplicates
 from freqtrade.enums import CandleType, TradingMode
 
+from .arrowfilters import (
+    has_date_bounds,
+    iter_dataframe_chunks,
+    timerange_bounds,
+    timerange_expression,
+)
 from .idatahandler import IDataHandler
 
 
@@ -31,6 +47,11 @@ class FeatherDataHandler(IDataHandler):
         filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
         self.create_dir_if_needed(filename)
 
+        self._ohlcv_write(data, filename)
+        self._remove_segments(filename)
+        self._catalog.update(filename, pair, timeframe, candle_type, data)
+
+    def _ohlcv_write(self, data: DataFrame, filename: Path) -> None:
         data.reset_index(drop=True).loc[:, self._columns].to_feather(
             filename, compression_level=9, compression="lz4"
         )
@@ -59,18 +80,11 @@ class FeatherDataHandler(IDataHandler):
             if not filename.exists():
                 return DataFrame(columns=self._columns)
         try:
-            pairdata = read_feather(filename)
-            pairdata.columns = self._columns
-            pairdata = pairdata.astype(
-                dtype={
-                    "open": "float",
-                    "high": "float",
-                    "low": "float",
-                    "close": "float",
-                    "volume": "float",
-                }
-            )
-            pairdata["date"] = to_datetime(pairdata["date"], unit="ms", utc=True)
+            pairdata = self._ohlcv_read(filename, timerange)
+            if segments := self._segment_files(filename):
+                pairdata = self._merge_ohlcv_segments(
+                    [pairdata, *(self._ohlcv_read(segment, timerange) for segment in segments)]
+                )
             return pairdata
         except Exception as e:
             logger.exception(
@@ -78,17 +92,83 @@ class FeatherDataHandler(IDataHandler):
             )
             return DataFrame(columns=self._columns)
 
+    def _ohlcv_read(self, filename: Path, timerange: TimeRange | None) -> DataFrame:
+        if timerange and has_date_bounds(timerange):
+            pairdata = self._read_feather_timerange(filename, timerange)
+        else:
+            pairdata = read_feather(filename)
+        pairdata.columns = self._columns
+        pairdata = pairdata.astype(
+            dtype={
+                "open": "float",
+                "high": "float",
+                "low": "float",
+                "close": "float",
+                "volume": "float",
+            }
+        )
+        pairdata["date"] = to_datetime(pairdata["date"], unit="ms", utc=True)
+        return pairdata
+
+    @staticmethod
+    def _read_feather_timerange(filename: Path, timerange: TimeRange) -> DataFrame:
+        """
+        Read only the record batches of a feather file which overlap the timerange.
+        Candles are stored sorted by date, so the record batches to read can be
+        found by bisecting over the first / last date of each batch.
+        :param filename: Feather file to read
+        :param timerange: Timerange to read - must have at least one date bound
+        :return: DataFrame with the candles within the timerange
+        """
+        with pa.memory_map(str(filename)) as source:
+            reader = ipc.open_file(source)
+            date_field = reader.schema.field(0)
+            lower, upper = timerange_bounds(date_field.type, timerange)
+            first, last = 0, reader.num_record_batches
+
+            def batch_date(idx: int, pos: int):
+                return reader.get_batch(idx).column(0)[pos].as_py()
+
+            # A file can only contain empty record batches if it contains no candles at all.
+            if last > 1:
+                if lower is not None:
+                    first = bisect_left(
+                        range(last), lower.as_py(), key=lambda idx: batch_date(idx, -1)
+                    )
+                if upper is not None:
+                    last = bisect_right(
+                        range(last), upper.as_py(), lo=first, key=lambda idx: batch_date(idx, 0)
+                    )
+            table = pa.Table.from_batches(
+                [reader.get_batch(idx) for idx in range(first, last)], schema=reader.schema
+            )
+            return table.filter(timerange_expression(date_field, timerange)).to_pandas(
+                ignore_metadata=True
+            )
+
     def ohlcv_append(
         self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
     ) -> None:
         """
-        Append data to existing data structures
+        Append data to existing data structures.
+        Data is written to a new segment file next to the data file.
+        Once there are too many segments, they're merged into the data file.
         :param pair: Pair
         :param timeframe: Timeframe this ohlcv data is for
         :param data: Data to append.
         :param candle_type: Any of the enum CandleType (must match trading mode!)
         """
-        raise NotImplementedError()
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        segments = self._segment_files(filename)
+        if not filename.exists() or len(segments) >= self._max_segments:
+            existing = self._ohlcv_load(pair, timeframe, None, candle_type)
+            self.ohlcv_store(
+                pair, timeframe, self._merge_ohlcv_segments([existing, data]), candle_type
+            )
+            return
+        previous = self._catalog.get(filename)
+        self._ohlcv_write(data, self._next_segment_file(filename, segments))
+        self._catalog.append(filename, pair, timeframe, candle_type, data, previous)
 
     def _trades_store(self, pair: str, data: DataFrame, trading_mode: TradingMode) -> None:
         """
@@ -101,35 +181,84 @@ class FeatherDataHandler(IDataHandler):
         filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
         self.create_dir_if_needed(filename)
         data.reset_index(drop=True).to_feather(filename, compression_level=9, compression="lz4")
+        self._remove_segments(filename)
 
-    def trades_append(self, pair: str, data: DataFrame):
+    def trades_append(self, pair: str, data: DataFrame, trading_mode: TradingMode):
         """
-        Append data to existing files
+        Append data to existing files.
+        Data is written to a new segment file next to the trades file.
+        Once there are too many segments, they're merged into the trades file.
         :param pair: Pair - used for filename
         :param data: Dataframe containing trades
                      column sequence as in DEFAULT_TRADES_COLUMNS
+        :param trading_mode: Trading mode to use (used to determine the filename)
         """
-        raise NotImplementedError()
+        filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        segments = self._segment_files(filename)
+        if not filename.exists() or len(segments) >= self._max_segments:
+            trades = self.trades_load(pair, trading_mode)
+            if not trades.empty:
+                data = trades_df_remove_duplicates(concat([trades, data], axis=0))
+            self.trades_store(pair, data, trading_mode)
+            return
+        data.reset_index(drop=True).loc[:, DEFAULT_TRADES_COLUMNS].to_feather(
+            self._next_segment_file(filename, segments), compression_level=9, compression="lz4"
+        )
 
     def _trades_load(
         self, pair: str, trading_mode: TradingMode, timerange: TimeRange | None = None
     ) -> DataFrame:
         """
-        Load a pair from file, either .json.gz or .json
-        # TODO: respect timerange ...
+        Load a pair from file, either .feather or its segments
         :param pair: Load trades for this pair
         :param trading_mode: Trading mode to use (used to determine the filename)
-        :param timerange: Timerange to load trades for - currently not implemented
+        :param timerange: Timerange to load trades for
         :return: Dataframe containing trades
         """
         filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
         if not filename.exists():
             return DataFrame(columns=DEFAULT_TRADES_COLUMNS)
 
+        if has_date_bounds(timerange):
+            chunks = list(
+                self._trades_load_chunks(pair, trading_mode, timerange, DEFAULT_TRADES_CHUNK_SIZE)
+            )
+            if not chunks:
+                return DataFrame(columns=DEFAULT_TRADES_COLUMNS)
+            return concat(chunks, axis=0, ignore_index=True)
+
         tradesdata = read_feather(filename)
+        if segments := self._segment_files(filename):
+            tradesdata = concat(
+                [tradesdata, *(read_feather(segment) for segment in segments)],
+                axis=0,
+                ignore_index=True,
+            )
 
         return tradesdata
 
+    def _trades_load_chunks(
+        self, pair: str, trading_mode: TradingMode, timerange: TimeRange | None, chunk_size: int
+    ) -> Iterator[DataFrame]:
+        """
+        Load trades from the trades file and its segments in chunks of up to chunk_size trades.
+        Only trades within the timerange are read.
+        :param pair: Load trades for this pair
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :param timerange: Timerange to load trades for
+        :param chunk_size: Maximum number of trades per chunk
+        """
+        filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        if not filename.exists():
+            return
+        yield from iter_dataframe_chunks(
+            [filename, *self._segment_files(filename)],
+            "feather",
+            date_column="timestamp",
+            timerange=timerange,
+            chunk_size=chunk_size,
+        )
+
     @classmethod
     def _get_file_extension(cls):
         return "feather"
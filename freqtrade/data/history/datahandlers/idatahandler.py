@@ -7,17 +7,24 @@ It's subclasses handle and storing data from disk.
 import logging
 import re
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from copy import deepcopy
 from datetime import datetime, timezone
 from pathlib import Path
 
-from pandas import DataFrame, to_datetime
+from pandas import DataFrame, concat, to_datetime
 
 from freqtrade import misc
 from freqtrade.configuration import TimeRange
-from freqtrade.constants import DEFAULT_TRADES_COLUMNS, ListPairsWithTimeframes
+from freqtrade.constants import (
+    DEFAULT_TRADES_CHUNK_SIZE,
+    DEFAULT_TRADES_COLUMNS,
+    ListPairsWithTimeframes,
+)
 from freqtrade.data.converter import (
+    can_resample_timeframe,
     clean_ohlcv_dataframe,
+    ohlcv_resample,
     trades_convert_types,
     trades_df_remove_duplicates,
     trim_dataframe,
@@ -26,6 +33,9 @@ from freqtrade.enums import CandleType, TradingMode
 from freqtrade.exceptions import OperationalException
 from freqtrade.exchange import timeframe_to_seconds
 
+from .datacatalog import DataCatalog, segment_files
+from .ohlcvcache import cached_ohlcv_load, ohlcv_cache_enabled
+
 
 logger = logging.getLogger(__name__)
 
@@ -33,9 +43,12 @@ logger = logging.getLogger(__name__)
 class IDataHandler(ABC):
     _OHLCV_REGEX = r"^([a-zA-Z_\d-]+)\-(\d+[a-zA-Z]{1,2})\-?([a-zA-Z_]*)?(?=\.)"
     _TRADES_REGEX = r"^([a-zA-Z_\d-]+)\-(trades)?(?=\.)"
+    # Number of appended segments after which the segments are merged into the data file
+    _max_segments = 10
 
     def __init__(self, datadir: Path) -> None:
         self._datadir = datadir
+        self._catalog = DataCatalog(datadir)
 
     @classmethod
     def _get_file_extension(cls) -> str:
@@ -110,19 +123,24 @@ class IDataHandler(ABC):
     ) -> tuple[datetime, datetime, int]:
         """
         Returns the min and max timestamp for the given pair and timeframe.
+        Served from the data catalog where possible, so the data file doesn't need to be loaded.
         :param pair: Pair to get min/max for
         :param timeframe: Timeframe to get min/max for
         :param candle_type: Any of the enum CandleType (must match trading mode!)
         :return: (min, max, len)
         """
-        df = self._ohlcv_load(pair, timeframe, None, candle_type)
-        if df.empty:
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        entry = self._catalog.get(filename)
+        if entry is None:
+            df = self._ohlcv_load(pair, timeframe, None, candle_type)
+            entry = self._catalog.update(filename, pair, timeframe, candle_type, df)
+        if entry is None:
             return (
                 datetime.fromtimestamp(0, tz=timezone.utc),
                 datetime.fromtimestamp(0, tz=timezone.utc),
                 0,
             )
-        return df.iloc[0]["date"].to_pydatetime(), df.iloc[-1]["date"].to_pydatetime(), len(df)
+        return entry.min_date, entry.max_date, entry.rows
 
     @abstractmethod
     def _ohlcv_load(
@@ -152,6 +170,8 @@ class IDataHandler(ABC):
         filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
         if filename.exists():
             filename.unlink()
+            self._remove_segments(filename)
+            self._catalog.remove(filename)
             return True
         return False
 
@@ -160,11 +180,13 @@ class IDataHandler(ABC):
         self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
     ) -> None:
         """
-        Append data to existing data structures
+        Append data to existing data structures.
+        Candles of the appended data replace existing candles of the same date.
         :param pair: Pair
         :param timeframe: Timeframe this ohlcv data is for
         :param data: Data to append.
         :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :raises NotImplementedError: if the dataformat doesn't support appending.
         """
 
     @classmethod
@@ -237,12 +259,14 @@ class IDataHandler(ABC):
         """
 
     @abstractmethod
-    def trades_append(self, pair: str, data: DataFrame):
+    def trades_append(self, pair: str, data: DataFrame, trading_mode: TradingMode):
         """
         Append data to existing files
         :param pair: Pair - used for filename
         :param data: Dataframe containing trades
                      column sequence as in DEFAULT_TRADES_COLUMNS
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :raises NotImplementedError: if the dataformat doesn't support appending.
         """
 
     @abstractmethod
@@ -253,10 +277,23 @@ class IDataHandler(ABC):
         Load a pair from file, either .json.gz or .json
         :param pair: Load trades for this pair
         :param trading_mode: Trading mode to use (used to determine the filename)
-        :param timerange: Timerange to load trades for - currently not implemented
+        :param timerange: Timerange to load trades for - ignored by the json handlers
         :return: Dataframe containing trades
         """
 
+    def _trades_load_chunks(
+        self, pair: str, trading_mode: TradingMode, timerange: TimeRange | None, chunk_size: int
+    ) -> Iterator[DataFrame]:
+        """
+        Load trades from file in chunks of up to chunk_size trades.
+        Formats which can't be read partially load all trades as one chunk.
+        :param pair: Load trades for this pair
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :param timerange: Timerange to load trades for
+        :param chunk_size: Maximum number of trades per chunk
+        """
+        yield self._trades_load(pair, trading_mode, timerange=timerange)
+
     def trades_store(self, pair: str, data: DataFrame, trading_mode: TradingMode) -> None:
         """
         Store trades data (list of Dicts) to file
@@ -278,6 +315,7 @@ class IDataHandler(ABC):
         filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
         if filename.exists():
             filename.unlink()
+            self._remove_segments(filename)
             return True
         return False
 
@@ -289,7 +327,7 @@ class IDataHandler(ABC):
         Removes duplicates in the process.
         :param pair: Load trades for this pair
         :param trading_mode: Trading mode to use (used to determine the filename)
-        :param timerange: Timerange to load trades for - currently not implemented
+        :param timerange: Timerange to load trades for - ignored by the json handlers
         :return: List of trades
         """
         try:
@@ -303,6 +341,88 @@ class IDataHandler(ABC):
         trades = trades_convert_types(trades)
         return trades
 
+    def trades_load_chunks(
+        self,
+        pair: str,
+        trading_mode: TradingMode,
+        timerange: TimeRange | None = None,
+        chunk_size: int = DEFAULT_TRADES_CHUNK_SIZE,
+    ) -> Iterator[DataFrame]:
+        """
+        Load trades from file in chunks, so memory usage is bounded by the chunk size
+        rather than by the size of the trades history.
+        Removes duplicates in the process - also across chunk boundaries.
+        Trades are expected in chronological order, so trades of a chunk which are older
+        than the last trade of the previous chunk are dropped as repeated.
+        :param pair: Load trades for this pair
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :param timerange: Timerange to load trades for
+        :param chunk_size: Maximum number of trades per chunk
+        :return: Iterator of trade Dataframes, in the order they're stored
+        Read errors are raised, so partial data is never mistaken for the full history.
+        """
+        last_ts = None
+        boundary = None
+        for trades in self._trades_load_chunks(pair, trading_mode, timerange, chunk_size):
+            trades = trades_df_remove_duplicates(trades)
+            if last_ts is not None:
+                # Appended segments may repeat trades up to the last trade of the previous chunk
+                repeated = trades["timestamp"] < last_ts
+                at_boundary = trades["timestamp"] == last_ts
+                if at_boundary.any():
+                    keys = trades.loc[at_boundary].set_index(["timestamp", "id"]).index
+                    repeated[at_boundary] = keys.isin(boundary)
+                trades = trades.loc[~repeated]
+            if trades.empty:
+                continue
+            last_ts = trades["timestamp"].iloc[-1]
+            boundary = (
+                trades.loc[trades["timestamp"] == last_ts].set_index(["timestamp", "id"]).index
+            )
+            yield trades_convert_types(trades)
+
+    @staticmethod
+    def _merge_ohlcv_segments(segments: list[DataFrame]) -> DataFrame:
+        """
+        Combine ohlcv data of a data file and the segments appended to it.
+        Candles of later segments replace candles of the same date in earlier segments.
+        """
+        segments = [df for df in segments if not df.empty] or segments[:1]
+        if len(segments) == 1:
+            return segments[0]
+        return (
+            concat(segments, axis=0)
+            .drop_duplicates(subset="date", keep="last")
+            .sort_values("date", kind="stable")
+            .reset_index(drop=True)
+        )
+
+    @staticmethod
+    def _segment_files(filename: Path) -> list[Path]:
+        """
+        Get the segments appended to a data file, oldest first.
+        """
+        return segment_files(filename)
+
+    @staticmethod
+    def _next_segment_file(filename: Path, segments: list[Path]) -> Path:
+        number = int(segments[-1].suffixes[-2][1:]) + 1 if segments else 1
+        return filename.with_name(f"{filename.name}.{number:06d}.seg")
+
+    @classmethod
+    def _remove_segments(cls, filename: Path) -> None:
+        for segment in cls._segment_files(filename):
+            segment.unlink()
+
+    @classmethod
+    def _rename_data_file(cls, file_old: Path, file_new: Path) -> None:
+        """
+        Rename a data file, including the segments appended to it.
+        """
+        for segment in cls._segment_files(file_old):
+            segment.rename(file_new.with_name(file_new.name + segment.name[len(file_old.name) :]))
+        file_old.rename(file_new)
+
     @classmethod
     def create_dir_if_needed(cls, datadir: Path):
         """
@@ -375,6 +495,8 @@ class IDataHandler(ABC):
         drop_incomplete: bool = False,
         startup_candles: int = 0,
         warn_no_data: bool = True,
+        base_timeframe: str | None = None,
+        candle_offset: str | None = None,
     ) -> DataFrame:
         """
         Load cached candle (OHLCV) data for the given pair.
@@ -387,6 +509,9 @@ class IDataHandler(ABC):
         :param startup_candles: Additional candles to load at the start of the period
         :param warn_no_data: Log a warning message when no data is found
         :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :param base_timeframe: Aggregate higher timeframes from the stored data of this timeframe.
+                               Falls back to the stored timeframe if there's no base data.
+        :param candle_offset: Shift the boundaries of aggregated candles by this duration
         :return: DataFrame with ohlcv data, or empty DataFrame
         """
         # Fix startup period
@@ -394,9 +519,19 @@ class IDataHandler(ABC):
         if startup_candles > 0 and timerange_startup:
             timerange_startup.subtract_start(timeframe_to_seconds(timeframe) * startup_candles)
 
-        pairdf = self._ohlcv_load(
-            pair, timeframe, timerange=timerange_startup, candle_type=candle_type
-        )
+        timerange_load = timerange_startup
+        if drop_incomplete and timerange_startup and timerange_startup.stoptype:
+            # Detecting the incomplete candle requires loading up to the end of the file.
+            timerange_load = TimeRange(timerange_startup.starttype, None, timerange_startup.startts)
+        pairdf = DataFrame()
+        if candle_type in (CandleType.SPOT, CandleType.FUTURES) and can_resample_timeframe(
+            base_timeframe, timeframe
+        ):
+            pairdf = self._ohlcv_load_resampled(
+                pair, timeframe, timerange_load, candle_type, str(base_timeframe), candle_offset
+            )
+        if pairdf.empty:
+            pairdf = self._ohlcv_load_cached(pair, timeframe, timerange_load, candle_type)
         if self._check_empty_df(pairdf, pair, timeframe, candle_type, warn_no_data):
             return pairdf
         else:
@@ -419,6 +554,56 @@ class IDataHandler(ABC):
             self._check_empty_df(pairdf, pair, timeframe, candle_type, warn_no_data)
             return pairdf
 
+    def _ohlcv_load_cached(
+        self, pair: str, timeframe: str, timerange: TimeRange | None, candle_type: CandleType
+    ) -> DataFrame:
+        """
+        Load data through the process-wide candle cache, if it's enabled.
+        """
+        if not ohlcv_cache_enabled():
+            return self._ohlcv_load(pair, timeframe, timerange=timerange, candle_type=candle_type)
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        return cached_ohlcv_load(
+            [filename, *self._segment_files(filename)],
+            timerange,
+            lambda: self._ohlcv_load(pair, timeframe, timerange=timerange, candle_type=candle_type),
+        )
+
+    def _ohlcv_load_resampled(
+        self,
+        pair: str,
+        timeframe: str,
+        timerange: TimeRange | None,
+        candle_type: CandleType,
+        base_timeframe: str,
+        candle_offset: str | None,
+    ) -> DataFrame:
+        """
+        Load data by aggregating the stored data of the base timeframe.
+        Aggregated data is kept in the process-wide candle cache, if it's enabled.
+        """
+
+        def load() -> DataFrame:
+            base = self._ohlcv_load(
+                pair, base_timeframe, timerange=timerange, candle_type=candle_type
+            )
+            if base.empty:
+                return base
+            base = clean_ohlcv_dataframe(
+                base, base_timeframe, pair, fill_missing=True, drop_incomplete=False
+            )
+            return ohlcv_resample(base, base_timeframe, timeframe, offset=candle_offset)
+
+        if not ohlcv_cache_enabled():
+            return load()
+        filename = self._pair_data_filename(self._datadir, pair, base_timeframe, candle_type)
+        return cached_ohlcv_load(
+            [filename, *self._segment_files(filename)],
+            timerange,
+            load,
+            variant=f"{timeframe}-{candle_offset}",
+        )
+
     def _check_empty_df(
         self,
         pairdf: DataFrame,
@@ -500,7 +685,7 @@ class IDataHandler(ABC):
         if file_new.exists():
             logger.warning(f"{file_new} exists already, can't migrate {pair}.")
             return
-        file_old.rename(file_new)
+        self._rename_data_file(file_old, file_new)
 
     def fix_funding_fee_timeframe(self, ff_timeframe: str):
         """
@@ -528,8 +713,9 @@ class IDataHandler(ABC):
             if Path(new_name).exists():
                 logger.warning(f"{new_name} already exists, Removing.")
                 Path(new_name).unlink()
+                self._remove_segments(new_name)
 
-            Path(old_name).rename(new_name)
+            self._rename_data_file(old_name, new_name)
 
 
 def get_datahandlerclass(datatype: str) -> type[IDataHandler]:
@@ -42,6 +42,7 @@ class JsonDataHandler(IDataHandler):
         _data.reset_index(drop=True).loc[:, self._columns].to_json(
             filename, orient="values", compression="gzip" if self._use_zip else None
         )
+        self._catalog.update(filename, pair, timeframe, candle_type, data)
 
     def _ohlcv_load(
         self, pair: str, timeframe: str, timerange: TimeRange | None, candle_type: CandleType
@@ -108,12 +109,13 @@ class JsonDataHandler(IDataHandler):
         trades = data.values.tolist()
         misc.file_dump_json(filename, trades, is_zip=self._use_zip)
 
-    def trades_append(self, pair: str, data: DataFrame):
+    def trades_append(self, pair: str, data: DataFrame, trading_mode: TradingMode):
         """
         Append data to existing files
         :param pair: Pair - used for filename
         :param data: Dataframe containing trades
                      column sequence as in DEFAULT_TRADES_COLUMNS
+        :param trading_mode: Trading mode to use (used to determine the filename)
         """
         raise NotImplementedError()
 
@@ -0,0 +1,87 @@
+"""
+Process-wide cache of candle data read from disk.
+Lets repeated backtests in one process (e.g. through the webserver) skip reading unchanged files.
+"""
+
+import logging
+from collections.abc import Callable
+from pathlib import Path
+from threading import Lock
+
+from cachetools import LRUCache
+from pandas import DataFrame
+
+from freqtrade.configuration import TimeRange
+
+
+logger = logging.getLogger(__name__)
+
+_cache: LRUCache | None = None
+_cache_lock = Lock()
+
+
+def _dataframe_size(df: DataFrame) -> int:
+    return int(df.memory_usage(index=True).sum())
+
+
+def set_ohlcv_cache_size(size_mb: int) -> None:
+    """
+    Set the memory budget of the cache. Least recently used data is evicted once it's exceeded.
+    Changing the size clears the cache.
+    :param size_mb: Memory budget in MB - 0 disables the cache.
+    """
+    global _cache
+    size = size_mb * 1024 * 1024
+    with _cache_lock:
+        if size <= 0:
+            _cache = None
+        elif _cache is None or _cache.maxsize != size:
+            logger.info(f"Caching candle data in memory, using up to {size_mb} MB.")
+            _cache = LRUCache(maxsize=size, getsizeof=_dataframe_size)
+
+
+def ohlcv_cache_enabled() -> bool:
+    return _cache is not None
+
+
+def cached_ohlcv_load(
+    files: list[Path],
+    timerange: TimeRange | None,
+    load: Callable[[], DataFrame],
+    variant: str = "",
+) -> DataFrame:
+    """
+    Load candle data through the cache.
+    Cached data is only used while none of the files it was read from changed.
+    :param files: Files the data is read from - the data file and its segments
+    :param timerange: Timerange the data is loaded for
+    :param load: Function loading the data from disk
+    :param variant: Distinguishes different data derived from the same files
+    :return: A copy of the cached data - callers may modify it
+    """
+    try:
+        stats = tuple((f.name, f.stat().st_size, f.stat().st_mtime_ns) for f in files)
+    except OSError:
+        return load()
+    key = (
+        str(files[0]),
+        variant,
+        stats,
+        (timerange.starttype, timerange.stoptype, timerange.startts, timerange.stopts)
+        if timerange
+        else None,
+    )
+    with _cache_lock:
+        data = _cache.get(key) if _cache is not None else None
+    if data is None:
+        data = load()
+        if data.empty:
+            return data
+        with _cache_lock:
+            if _cache is not None:
+                try:
+                    _cache[key] = data
+                except ValueError:
+                    # Larger than the whole cache
+                    pass
+    return data.copy()
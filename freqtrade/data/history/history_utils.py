@@ -1,13 +1,18 @@
+import asyncio
 import logging
 import operator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from joblib import effective_n_jobs
 from pandas import DataFrame, concat
+from rich.progress import TaskID
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import DATETIME_PRINT_FORMAT, DL_DATA_TIMEFRAMES, DOCS_LINK, Config
 from freqtrade.data.converter import (
+    can_resample_timeframe,
     clean_ohlcv_dataframe,
     convert_trades_to_ohlcv,
     trades_df_remove_duplicates,
@@ -38,6 +43,8 @@ def load_pair_history(
     data_format: str | None = None,
     data_handler: IDataHandler | None = None,
     candle_type: CandleType = CandleType.SPOT,
+    base_timeframe: str | None = None,
+    candle_offset: str | None = None,
 ) -> DataFrame:
     """
     Load cached ohlcv history for the given pair.
@@ -53,6 +60,8 @@ def load_pair_history(
     :param data_handler: Initialized data-handler to use.
                          Will be initialized from data_format if not set
     :param candle_type: Any of the enum CandleType (must match trading mode!)
+    :param base_timeframe: Aggregate higher timeframes from the stored data of this timeframe
+    :param candle_offset: Shift the boundaries of aggregated candles by this duration
     :return: DataFrame with ohlcv data, or empty DataFrame
     """
     data_handler = get_datahandler(datadir, data_format, data_handler)
@@ -65,6 +74,8 @@ def load_pair_history(
         drop_incomplete=drop_incomplete,
         startup_candles=startup_candles,
         candle_type=candle_type,
+        base_timeframe=base_timeframe,
+        candle_offset=candle_offset,
     )
 
 
@@ -80,6 +91,9 @@ def load_data(
     data_format: str = "feather",
     candle_type: CandleType = CandleType.SPOT,
     user_futures_funding_rate: int | None = None,
+    n_jobs: int = 1,
+    base_timeframe: str | None = None,
+    candle_offset: str | None = None,
 ) -> dict[str, DataFrame]:
     """
     Load ohlcv history data for a list of pairs.
@@ -93,6 +107,10 @@ def load_data(
     :param fail_without_data: Raise OperationalException if no data is found.
     :param data_format: Data format which should be used. Defaults to json
     :param candle_type: Any of the enum CandleType (must match trading mode!)
+    :param n_jobs: Number of threads loading pairs concurrently.
+                   Reading and decompressing the files releases the GIL.
+    :param base_timeframe: Aggregate higher timeframes from the stored data of this timeframe
+    :param candle_offset: Shift the boundaries of aggregated candles by this duration
     :return: dict(<pair>:<Dataframe>)
     """
     result: dict[str, DataFrame] = {}
@@ -101,8 +119,8 @@ def load_data(
 
     data_handler = get_datahandler(datadir, data_format)
 
-    for pair in pairs:
-        hist = load_pair_history(
+    def load_pair(pair: str) -> DataFrame:
+        return load_pair_history(
             pair=pair,
             timeframe=timeframe,
             datadir=datadir,
@@ -111,7 +129,18 @@ def load_data(
             startup_candles=startup_candles,
             data_handler=data_handler,
             candle_type=candle_type,
+            base_timeframe=base_timeframe,
+            candle_offset=candle_offset,
         )
+
+    n_jobs = min(effective_n_jobs(n_jobs), len(pairs))
+    if n_jobs > 1:
+        with ThreadPoolExecutor(max_workers=n_jobs, thread_name_prefix="load_data") as executor:
+            histories = list(executor.map(load_pair, pairs))
+    else:
+        histories = [load_pair(pair) for pair in pairs]
+
+    for pair, hist in zip(pairs, histories, strict=True):
         if not hist.empty:
             result[pair] = hist
         else:
@@ -243,72 +272,84 @@ def _download_pair_history(
     data_handler = get_datahandler(datadir, data_handler=data_handler)
 
     try:
-        if erase:
-            if data_handler.ohlcv_purge(pair, timeframe, candle_type=candle_type):
-                logger.info(f"Deleting existing data for pair {pair}, {timeframe}, {candle_type}.")
-
-        data, since_ms, until_ms = _load_cached_data_for_updating(
-            pair,
-            timeframe,
-            timerange,
-            data_handler=data_handler,
+        data, since_ms, until_ms = _prepare_pair_download(
+            pair, timeframe, datadir, data_handler, timerange, candle_type, erase, prepend
+        )
+        # Default since_ms to 30 days if nothing is given
+        new_dataframe = exchange.get_historic_ohlcv(
+            pair=pair,
+            timeframe=timeframe,
+            since_ms=since_ms if since_ms else _new_pair_since_ms(new_pairs_days),
+            is_new_pair=data.empty,
             candle_type=candle_type,
-            prepend=prepend,
+            until_ms=until_ms if until_ms else None,
         )
-
-        logger.info(
-            f'Download history data for "{pair}", {timeframe}, '
-            f"{candle_type} and store in {datadir}. "
-            f"From {format_ms_time(since_ms) if since_ms else 'start'} to "
-            f"{format_ms_time(until_ms) if until_ms else 'now'}"
+        _store_pair_download(
+            pair, timeframe, data_handler, candle_type, data, new_dataframe, prepend
         )
+        return True
 
-        logger.debug(
-            "Current Start: %s",
-            f"{data.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
-        )
-        logger.debug(
-            "Current End: %s",
-            f"{data.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
+    except Exception:
+        logger.exception(
+            f'Failed to download history data for pair: "{pair}", timeframe: {timeframe}.'
         )
+        return False
 
-        # Default since_ms to 30 days if nothing is given
-        new_dataframe = exchange.get_historic_ohlcv(
+
+async def _async_download_pair_history(
+    pair: str,
+    *,
+    datadir: Path,
+    exchange: Exchange,
+    timeframe: str,
+    new_pairs_days: int,
+    data_handler: IDataHandler,
+    timerange: TimeRange | None,
+    candle_type: CandleType,
+    erase: bool,
+    prepend: bool,
+    storage: ThreadPoolExecutor,
+) -> bool:
+    """
+    Async variant of _download_pair_history(), running on the exchange's event loop.
+    Loading and storing data happens in the storage thread, so other downloads can
+    continue in the meantime.
+    :param storage: Executor used for all reads and writes of stored data
+    :return: bool with success state
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        data, since_ms, until_ms = await loop.run_in_executor(
+            storage,
+            _prepare_pair_download,
+            pair,
+            timeframe,
+            datadir,
+            data_handler,
+            timerange,
+            candle_type,
+            erase,
+            prepend,
+        )
+        new_dataframe = await exchange._async_get_historic_ohlcv_df(
             pair=pair,
             timeframe=timeframe,
-            since_ms=(
-                since_ms
-                if since_ms
-                else int((datetime.now() - timedelta(days=new_pairs_days)).timestamp()) * 1000
-            ),
+            since_ms=since_ms if since_ms else _new_pair_since_ms(new_pairs_days),
             is_new_pair=data.empty,
             candle_type=candle_type,
             until_ms=until_ms if until_ms else None,
         )
-        logger.info(f"Downloaded data for {pair} with length {len(new_dataframe)}.")
-        if data.empty:
-            data = new_dataframe
-        else:
-            # Run cleaning again to ensure there were no duplicate candles
-            # Especially between existing and new data.
-            data = clean_ohlcv_dataframe(
-                concat([data, new_dataframe], axis=0),
-                timeframe,
-                pair,
-                fill_missing=False,
-                drop_incomplete=False,
-            )
-
-        logger.debug(
-            "New Start: %s",
-            f"{data.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
-        )
-        logger.debug(
-            "New End: %s",
-            f"{data.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
+        await loop.run_in_executor(
+            storage,
+            _store_pair_download,
+            pair,
+            timeframe,
+            data_handler,
+            candle_type,
+            data,
+            new_dataframe,
+            prepend,
         )
-
-        data_handler.ohlcv_store(pair, timeframe, data=data, candle_type=candle_type)
         return True
 
     except Exception:
@@ -318,6 +359,132 @@ def _download_pair_history(
         return False
 
 
+def _new_pair_since_ms(new_pairs_days: int) -> int:
+    return int((datetime.now() - timedelta(days=new_pairs_days)).timestamp()) * 1000
+
+
+def _prepare_pair_download(
+    pair: str,
+    timeframe: str,
+    datadir: Path,
+    data_handler: IDataHandler,
+    timerange: TimeRange | None,
+    candle_type: CandleType,
+    erase: bool,
+    prepend: bool,
+) -> tuple[DataFrame, int | None, int | None]:
+    """
+    Erase or load the stored data of a pair before downloading.
+    :return: Tuple of stored data, start and end of the download (in ms)
+    """
+    if erase:
+        if data_handler.ohlcv_purge(pair, timeframe, candle_type=candle_type):
+            logger.info(f"Deleting existing data for pair {pair}, {timeframe}, {candle_type}.")
+
+    data, since_ms, until_ms = _load_cached_data_for_updating(
+        pair,
+        timeframe,
+        timerange,
+        data_handler=data_handler,
+        candle_type=candle_type,
+        prepend=prepend,
+    )
+
+    logger.info(
+        f'Download history data for "{pair}", {timeframe}, '
+        f"{candle_type} and store in {datadir}. "
+        f"From {format_ms_time(since_ms) if since_ms else 'start'} to "
+        f"{format_ms_time(until_ms) if until_ms else 'now'}"
+    )
+
+    logger.debug(
+        "Current Start: %s",
+        f"{data.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
+    )
+    logger.debug(
+        "Current End: %s",
+        f"{data.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
+    )
+    return data, since_ms, until_ms
+
+
+def _store_pair_download(
+    pair: str,
+    timeframe: str,
+    data_handler: IDataHandler,
+    candle_type: CandleType,
+    data: DataFrame,
+    new_dataframe: DataFrame,
+    prepend: bool,
+) -> None:
+    """
+    Store downloaded candles, combined with the previously stored data.
+    """
+    logger.info(f"Downloaded data for {pair} with length {len(new_dataframe)}.")
+    if data.empty:
+        data = new_dataframe
+    else:
+        if not prepend and not new_dataframe.empty:
+            try:
+                # Only write the new candles, replacing stored candles of the same date.
+                data_handler.ohlcv_append(pair, timeframe, new_dataframe, candle_type)
+                logger.debug(
+                    "New End: %s",
+                    f"{new_dataframe.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}",
+                )
+                return
+            except NotImplementedError:
+                pass
+        # Run cleaning again to ensure there were no duplicate candles
+        # Especially between existing and new data.
+        data = clean_ohlcv_dataframe(
+            concat([data, new_dataframe], axis=0),
+            timeframe,
+            pair,
+            fill_missing=False,
+            drop_incomplete=False,
+        )
+
+    logger.debug(
+        "New Start: %s",
+        f"{data.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
+    )
+    logger.debug(
+        "New End: %s",
+        f"{data.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
+    )
+
+    data_handler.ohlcv_store(pair, timeframe, data=data, candle_type=candle_type)
+
+
+def _pair_download_jobs(
+    exchange: Exchange, timeframes: list[str], trading_mode: str
+) -> list[tuple[str, CandleType]]:
+    """
+    Get the (timeframe, candle type) combinations to download for every pair.
+    """
+    candle_type = CandleType.get_default(trading_mode)
+    jobs = [(str(timeframe), candle_type) for timeframe in timeframes]
+    if trading_mode == "futures":
+        # Predefined candletype (and timeframe) depending on exchange
+        # Downloads what is necessary to backtest based on futures data.
+        tf_mark = exchange.get_option("mark_ohlcv_timeframe")
+        tf_funding_rate = exchange.get_option("funding_fee_timeframe")
+
+        fr_candle_type = CandleType.from_string(exchange.get_option("mark_ohlcv_price"))
+        # All exchanges need FundingRate for futures trading.
+        # The timeframe is aligned to the mark-price timeframe.
+        jobs.append((str(tf_funding_rate), CandleType.FUNDING_RATE))
+        jobs.append((str(tf_mark), fr_candle_type))
+    return jobs
+
+
+def _job_description(timeframe: str, candle_type: CandleType, trading_mode: str) -> str:
+    if candle_type == CandleType.get_default(trading_mode):
+        return f"Timeframe {timeframe}"
+    return f"Timeframe {candle_type}, {timeframe}"
+
+
 def refresh_backtest_ohlcv_data(
     exchange: Exchange,
     pairs: list[str],
@@ -330,73 +497,71 @@ def refresh_backtest_ohlcv_data(
     data_format: str | None = None,
     prepend: bool = False,
     progress_tracker: CustomProgress | None = None,
+    download_jobs: int = 1,
 ) -> list[str]:
     """
     Refresh stored ohlcv data for backtesting and hyperopt operations.
     Used by freqtrade download-data subcommand.
+    :param download_jobs: Number of (pair, timeframe, candle type) combinations to
+        download concurrently.
     :return: List of pairs that are not available.
     """
     progress_tracker = retrieve_progress_tracker(progress_tracker)
 
     pairs_not_available = []
     data_handler = get_datahandler(datadir, data_format)
-    candle_type = CandleType.get_default(trading_mode)
+    pair_jobs = _pair_download_jobs(exchange, timeframes, trading_mode)
     with progress_tracker as progress:
-        tf_length = len(timeframes) if trading_mode != "futures" else len(timeframes) + 2
-        timeframe_task = progress.add_task("Timeframe", total=tf_length)
+        timeframe_task = progress.add_task("Timeframe", total=len(pair_jobs))
         pair_task = progress.add_task("Downloading data...", total=len(pairs))
 
+        available_pairs = []
         for pair in pairs:
-            progress.update(pair_task, description=f"Downloading {pair}")
-            progress.update(timeframe_task, completed=0)
-
             if pair not in exchange.markets:
                 pairs_not_available.append(f"{pair}: Pair not available on exchange.")
                 logger.info(f"Skipping pair {pair}...")
                 continue
-            for timeframe in timeframes:
-                progress.update(timeframe_task, description=f"Timeframe {timeframe}")
+            available_pairs.append(pair)
+
+        download_kwargs = {
+            "datadir": datadir,
+            "exchange": exchange,
+            "timerange": timerange,
+            "data_handler": data_handler,
+            "new_pairs_days": new_pairs_days,
+            "erase": erase,
+            "prepend": prepend,
+        }
+        if download_jobs > 1:
+            progress.update(timeframe_task, total=len(available_pairs) * len(pair_jobs))
+            exchange.run_async(
+                _async_download_pairs(
+                    available_pairs,
+                    pair_jobs,
+                    download_jobs=download_jobs,
+                    trading_mode=trading_mode,
+                    progress=progress,
+                    pair_task=pair_task,
+                    timeframe_task=timeframe_task,
+                    **download_kwargs,
+                )
+            )
+            return pairs_not_available
+
+        for pair in available_pairs:
+            progress.update(pair_task, description=f"Downloading {pair}")
+            progress.update(timeframe_task, completed=0)
+
+            for timeframe, candle_type in pair_jobs:
+                progress.update(
+                    timeframe_task,
+                    description=_job_description(timeframe, candle_type, trading_mode),
+                )
                 logger.debug(f"Downloading pair {pair}, {candle_type}, interval {timeframe}.")
                 _download_pair_history(
-                    pair=pair,
-                    datadir=datadir,
-                    exchange=exchange,
-                    timerange=timerange,
-                    data_handler=data_handler,
-                    timeframe=str(timeframe),
-                    new_pairs_days=new_pairs_days,
-                    candle_type=candle_type,
-                    erase=erase,
-                    prepend=prepend,
+                    pair=pair, timeframe=timeframe, candle_type=candle_type, **download_kwargs
                 )
                 progress.update(timeframe_task, advance=1)
-            if trading_mode == "futures":
-                # Predefined candletype (and timeframe) depending on exchange
-                # Downloads what is necessary to backtest based on futures data.
-                tf_mark = exchange.get_option("mark_ohlcv_timeframe")
-                tf_funding_rate = exchange.get_option("funding_fee_timeframe")
-
-                fr_candle_type = CandleType.from_string(exchange.get_option("mark_ohlcv_price"))
-                # All exchanges need FundingRate for futures trading.
-                # The timeframe is aligned to the mark-price timeframe.
-                combs = ((CandleType.FUNDING_RATE, tf_funding_rate), (fr_candle_type, tf_mark))
-                for candle_type_f, tf in combs:
-                    logger.debug(f"Downloading pair {pair}, {candle_type_f}, interval {tf}.")
-                    _download_pair_history(
-                        pair=pair,
-                        datadir=datadir,
-                        exchange=exchange,
-                        timerange=timerange,
-                        data_handler=data_handler,
-                        timeframe=str(tf),
-                        new_pairs_days=new_pairs_days,
-                        candle_type=candle_type_f,
-                        erase=erase,
-                        prepend=prepend,
-                    )
-                    progress.update(
-                        timeframe_task, advance=1, description=f"Timeframe {candle_type_f}, {tf}"
-                    )
 
             progress.update(pair_task, advance=1)
             progress.update(timeframe_task, description="Timeframe")
@@ -404,6 +569,54 @@ def refresh_backtest_ohlcv_data(
     return pairs_not_available
 
 
+async def _async_download_pairs(
+    pairs: list[str],
+    pair_jobs: list[tuple[str, CandleType]],
+    *,
+    download_jobs: int,
+    trading_mode: str,
+    progress: CustomProgress,
+    pair_task: TaskID,
+    timeframe_task: TaskID,
+    **download_kwargs,
+) -> None:
+    """
+    Download all pairs, running up to download_jobs downloads concurrently.
+    Requests of all downloads share the exchange's rate limiter.
+    Stored data is read and written in one separate storage thread.
+    """
+    semaphore = asyncio.Semaphore(download_jobs)
+    remaining_jobs = dict.fromkeys(pairs, len(pair_jobs))
+
+    async def download(pair: str, timeframe: str, candle_type: CandleType) -> None:
+        async with semaphore:
+            logger.debug(f"Downloading pair {pair}, {candle_type}, interval {timeframe}.")
+            await _async_download_pair_history(
+                pair=pair,
+                timeframe=timeframe,
+                candle_type=candle_type,
+                storage=storage,
+                **download_kwargs,
+            )
+        progress.update(
+            timeframe_task,
+            advance=1,
+            description=_job_description(timeframe, candle_type, trading_mode),
+        )
+        remaining_jobs[pair] -= 1
+        if not remaining_jobs[pair]:
+            progress.update(pair_task, advance=1, description=f"Downloaded {pair}")
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="storage") as storage:
+        await asyncio.gather(
+            *(
+                download(pair, timeframe, candle_type)
+                for pair in pairs
+                for timeframe, candle_type in pair_jobs
+            )
+        )
+
+
 def _download_trades_history(
     exchange: Exchange,
     pair: str,
@@ -469,10 +682,18 @@ def _download_trades_history(
         from_id=from_id,
     )
     new_trades_df = trades_list_to_df(new_trades[1])
+    stored_count = len(trades)
     trades = concat([trades, new_trades_df], axis=0)
     # Remove duplicates to make sure we're not storing data we don't need
     trades = trades_df_remove_duplicates(trades)
-    data_handler.trades_store(pair, trades, trading_mode)
+    try:
+        if not stored_count:
+            data_handler.trades_store(pair, trades, trading_mode)
+        elif len(trades) > stored_count:
+            # Only write trades which are not stored yet
+            data_handler.trades_append(pair, trades.iloc[stored_count:], trading_mode)
+    except NotImplementedError:
+        data_handler.trades_store(pair, trades, trading_mode)
 
     logger.debug(
         "New Start: %s",
@@ -593,6 +814,30 @@ def download_data_main(config: Config) -> None:
     download_data(config, exchange)
 
 
+def _download_timeframes(config: Config) -> list[str]:
+    """
+    Timeframes to download - only the base timeframe and timeframes which can't be
+    aggregated from it, if a base timeframe is configured.
+    """
+    timeframes = config.get("timeframes", DL_DATA_TIMEFRAMES)
+    if base_timeframe := config.get("ohlcv_base_timeframe"):
+        # Higher timeframes are aggregated from the base timeframe when loading the data
+        aggregated = [
+            tf
+            for tf in timeframes
+            if tf != base_timeframe and can_resample_timeframe(base_timeframe, tf)
+        ]
+        if aggregated:
+            logger.info(
+                f"Not downloading timeframes {', '.join(aggregated)}, as they're aggregated "
+                f"from the base timeframe {base_timeframe} when loading the data."
+            )
+        return [base_timeframe] + [
+            tf for tf in timeframes if tf != base_timeframe and tf not in aggregated
+        ]
+    return timeframes
+
+
 def download_data(
     config: Config,
     exchange: Exchange,
@@ -623,8 +868,7 @@ def download_data(
     ]
 
     expanded_pairs = dynamic_expand_pairlist(config, available_pairs)
-    if "timeframes" not in config:
-        config["timeframes"] = DL_DATA_TIMEFRAMES
+    config["timeframes"] = _download_timeframes(config)
 
     if len(expanded_pairs) == 0:
         logger.warning(
@@ -702,6 +946,7 @@ def download_data(
                 trading_mode=config.get("trading_mode", "spot"),
                 prepend=config.get("prepend_data", False),
                 progress_tracker=progress_tracker,
+                download_jobs=config.get("download_jobs", 1),
             )
     finally:
         if pairs_not_available:
@@ -129,7 +129,7 @@ class Binance(Exchange):
         except ccxt.BaseError as e:
             raise OperationalException(e) from e
 
-    def get_historic_ohlcv(
+    async def _async_get_historic_ohlcv_df(
         self,
         pair: str,
         timeframe: str,
@@ -144,10 +144,7 @@ class Binance(Exchange):
         :param candle_type: Any of the enum CandleType (must match trading mode!)
         """
         if is_new_pair and candle_type in (CandleType.SPOT, CandleType.FUTURES, CandleType.MARK):
-            with self._loop_lock:
-                x = self.loop.run_until_complete(
-                    self._async_get_candle_history(pair, timeframe, candle_type, 0)
-                )
+            x = await self._async_get_candle_history(pair, timeframe, candle_type, 0)
             if x and x[3] and x[3][0] and x[3][0][0] > since_ms:
                 # Set starting date to first available candle.
                 since_ms = x[3][0][0]
@@ -175,7 +172,7 @@ class Binance(Exchange):
                 )
             )
         ):
-            return super().get_historic_ohlcv(
+            return await super()._async_get_historic_ohlcv_df(
                 pair=pair,
                 timeframe=timeframe,
                 since_ms=since_ms,
@@ -185,7 +182,7 @@ class Binance(Exchange):
             )
         else:
             # Download from data.binance.vision
-            return self.get_historic_ohlcv_fast(
+            return await self._async_get_historic_ohlcv_fast(
                 pair=pair,
                 timeframe=timeframe,
                 since_ms=since_ms,
@@ -194,7 +191,7 @@ class Binance(Exchange):
                 until_ms=until_ms,
             )
 
-    def get_historic_ohlcv_fast(
+    async def _async_get_historic_ohlcv_fast(
         self,
         pair: str,
         timeframe: str,
@@ -206,17 +203,14 @@ class Binance(Exchange):
         """
         Fastly fetch OHLCV data by leveraging https://data.binance.vision.
         """
-        with self._loop_lock:
-            df = self.loop.run_until_complete(
-                download_archive_ohlcv(
-                    candle_type=candle_type,
-                    pair=pair,
-                    timeframe=timeframe,
-                    since_ms=since_ms,
-                    until_ms=until_ms,
-                    markets=self.markets,
-                )
-            )
+        df = await download_archive_ohlcv(
+            candle_type=candle_type,
+            pair=pair,
+            timeframe=timeframe,
+            since_ms=since_ms,
+            until_ms=until_ms,
+            markets=self.markets,
+        )
 
         # download the remaining data from rest API
         if df.empty:
@@ -228,7 +222,7 @@ class Binance(Exchange):
         if until_ms and rest_since_ms > until_ms:
             rest_df = DataFrame()
         else:
-            rest_df = super().get_historic_ohlcv(
+            rest_df = await super()._async_get_historic_ohlcv_df(
                 pair=pair,
                 timeframe=timeframe,
                 since_ms=rest_since_ms,
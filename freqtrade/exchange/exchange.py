@@ -10,8 +10,8 @@ import signal
 from collections.abc import Coroutine, Generator
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
-from math import floor, isnan
-from threading import Lock
+from math import ceil, floor, isnan
+from threading import Event, Lock
 from typing import Any, Literal, TypeGuard, TypeVar
 
 import ccxt
@@ -36,7 +36,7 @@ from freqtrade.constants import (
     PairWithTimeframe,
 )
 from freqtrade.data.converter import (
-    clean_ohlcv_dataframe,
+    merge_ohlcv_dataframes,
     ohlcv_to_dataframe,
     trades_df_remove_duplicates,
     trades_dict_to_list,
@@ -108,7 +108,6 @@ from freqtrade.misc import (
 )
 from freqtrade.util import dt_from_ts, dt_now
 from freqtrade.util.datetime_helpers import dt_humanize_delta, dt_ts, format_ms_time
-from freqtrade.util.periodic_cache import PeriodicCache
 
 
 logger = logging.getLogger(__name__)
@@ -214,7 +213,9 @@ class Exchange:
 
         # Holds candles
         self._klines: dict[PairWithTimeframe, DataFrame] = {}
-        self._expiring_candle_cache: dict[tuple[str, int], PeriodicCache] = {}
+        # Candles shared by pairlists - lookback in ms, open date of the candle they were
+        # refreshed in, and the candles.
+        self._pairlist_candles: dict[PairWithTimeframe, tuple[int, int, DataFrame]] = {}
 
         # Holds public_trades
         self._trades: dict[PairWithTimeframe, DataFrame] = {}
@@ -302,6 +303,35 @@ class Exchange:
         """
         self.close()
 
+    def __getstate__(self):
+        """
+        Drop ccxt clients, the event loop and locks, which can't be pickled.
+        Pickled copies (e.g. in backtesting worker processes) keep markets and leverage tiers,
+        but can't communicate with the exchange.
+        """
+        state = self.__dict__.copy()
+        for attr in (
+            "_api",
+            "_api_async",
+            "_ws_async",
+            "_exchange_ws",
+            "loop",
+            "_loop_lock",
+            "_cache_lock",
+        ):
+            state.pop(attr, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._api = None
+        self._api_async = None
+        self._ws_async = None
+        self._exchange_ws = None
+        self._loop_lock = Lock()
+        self._cache_lock = Lock()
+        self.loop = self._init_async_loop()
+
     def close(self):
         if self._exchange_ws:
             self._exchange_ws.cleanup()
@@ -441,6 +471,14 @@ class Exchange:
         """
         return self._api.precisionMode
 
+    @property
+    def candle_closed(self) -> Event | None:
+        """
+        Event set by the websocket connection whenever a watched candle closed.
+        None if websockets are not used.
+        """
+        return self._exchange_ws.candle_closed if self._exchange_ws else None
+
     def additional_exchange_init(self) -> None:
         """
         Additional exchange initialization logic.
@@ -2354,17 +2392,47 @@ class Exchange:
         :param until_ms: Timestamp in milliseconds to get history up to
         :return: Dataframe with candle (OHLCV) data
         """
-        with self._loop_lock:
-            pair, _, _, data, _ = self.loop.run_until_complete(
-                self._async_get_historic_ohlcv(
-                    pair=pair,
-                    timeframe=timeframe,
-                    since_ms=since_ms,
-                    until_ms=until_ms,
-                    candle_type=candle_type,
-                    raise_=True,
-                )
+        return self.run_async(
+            self._async_get_historic_ohlcv_df(
+                pair=pair,
+                timeframe=timeframe,
+                since_ms=since_ms,
+                candle_type=candle_type,
+                is_new_pair=is_new_pair,
+                until_ms=until_ms,
             )
+        )
+
+    def run_async(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Run a coroutine on the exchange's event loop and wait for its result.
+        Multiple downloads can be combined into one coroutine (e.g. with asyncio.gather)
+        to run them concurrently - limited by the ccxt rate limiter.
+        """
+        with self._loop_lock:
+            return self.loop.run_until_complete(coro)
+
+    async def _async_get_historic_ohlcv_df(
+        self,
+        pair: str,
+        timeframe: str,
+        since_ms: int,
+        candle_type: CandleType,
+        is_new_pair: bool = False,
+        until_ms: int | None = None,
+    ) -> DataFrame:
+        """
+        Async implementation of get_historic_ohlcv() - to be overridden by subclasses.
+        :return: Dataframe with candle (OHLCV) data
+        """
+        pair, _, _, data, _ = await self._async_get_historic_ohlcv(
+            pair=pair,
+            timeframe=timeframe,
+            since_ms=since_ms,
+            until_ms=until_ms,
+            candle_type=candle_type,
+            raise_=True,
+        )
         logger.debug(f"Downloaded data for {pair} from ccxt with length {len(data)}.")
         return ohlcv_to_dataframe(data, timeframe, pair, fill_missing=False, drop_incomplete=True)
 
@@ -2545,13 +2613,7 @@ class Exchange:
             if (pair, timeframe, c_type) in self._klines:
                 old = self._klines[(pair, timeframe, c_type)]
                 # Reassign so we return the updated, combined df
-                ohlcv_df = clean_ohlcv_dataframe(
-                    concat([old, ohlcv_df], axis=0),
-                    timeframe,
-                    pair,
-                    fill_missing=True,
-                    drop_incomplete=False,
-                )
+                ohlcv_df = merge_ohlcv_dataframes(old, ohlcv_df, timeframe, pair)
                 candle_limit = self.ohlcv_candle_limit(timeframe, self._config["candle_type_def"])
                 # Age out old candles
                 ohlcv_df = ohlcv_df.tail(candle_limit + self._startup_candle_count)
@@ -2621,31 +2683,59 @@ class Exchange:
     ) -> dict[PairWithTimeframe, DataFrame]:
         """
         Refresh ohlcv data for all pairs in needed_pairs if necessary.
-        Caches data with expiring per timeframe.
+        Candles are stored once per pair and timeframe, shared by all callers independent of
+        since_ms, and extended by only the new candles once per candle.
         Should only be used for pairlists which need "on time" expirarion, and no longer cache.
-        """
-
-        timeframes = {p[1] for p in pairs}
-        for timeframe in timeframes:
-            if (timeframe, since_ms) not in self._expiring_candle_cache:
-                timeframe_in_sec = timeframe_to_seconds(timeframe)
-                # Initialise cache
-                self._expiring_candle_cache[(timeframe, since_ms)] = PeriodicCache(
-                    ttl=timeframe_in_sec, maxsize=1000
-                )
-
-        # Get candles from cache
-        candles = {
-            c: self._expiring_candle_cache[(c[1], since_ms)].get(c, None)
-            for c in pairs
-            if c in self._expiring_candle_cache[(c[1], since_ms)]
-        }
-        pairs_to_download = [p for p in pairs if p not in candles]
-        if pairs_to_download:
-            candles = self.refresh_latest_ohlcv(pairs_to_download, since_ms=since_ms, cache=False)
-            for c, val in candles.items():
-                self._expiring_candle_cache[(c[1], since_ms)][c] = val
-        return candles
+        :param since_ms: Start of the returned candles
+        :return: Dict of [{(pair, timeframe): Dataframe}] - with the candles since since_ms
+        """
+        downloads: dict[int, list[PairWithTimeframe]] = {}
+        lookbacks: dict[PairWithTimeframe, int] = {}
+        for p in pairs:
+            current = dt_ts(timeframe_to_prev_date(p[1]))
+            lookbacks[p] = current - since_ms
+            lookback, refreshed, candles = self._pairlist_candles.get(p, (0, 0, DataFrame()))
+            if lookbacks[p] > lookback or (refreshed < current and candles.empty):
+                # Not stored for this lookback yet - download all candles
+                downloads.setdefault(since_ms, []).append(p)
+            elif refreshed < current:
+                # Download only candles newer than the stored candles
+                downloads.setdefault(dt_ts(candles["date"].iat[-1]), []).append(p)
+
+        for download_since, download_pairs in downloads.items():
+            results = self.refresh_latest_ohlcv(
+                download_pairs, since_ms=download_since, cache=False
+            )
+            for p in download_pairs:
+                if (candles := results.get(p)) is None:
+                    # Download failed - keep the stored candles
+                    continue
+                current = dt_ts(timeframe_to_prev_date(p[1]))
+                lookback, _, stored = self._pairlist_candles.get(p, (0, 0, DataFrame()))
+                if candles.empty:
+                    candles = stored
+                elif not stored.empty:
+                    # Downloaded candles replace stored candles from their first date on
+                    candles = concat(
+                        [stored.loc[stored["date"] < candles["date"].iat[0]], candles],
+                        axis=0,
+                        ignore_index=True,
+                    )
+                lookback = max(lookback, lookbacks[p])
+                # Age out candles no caller requires anymore
+                candles = candles.tail(ceil(lookback / timeframe_to_msecs(p[1])))
+                self._pairlist_candles[p] = (lookback, current, candles.reset_index(drop=True))
+
+        result = {}
+        for p in pairs:
+            if p not in self._pairlist_candles:
+                continue
+            candles = self._pairlist_candles[p][2]
+            # Only the candles requested - stored candles may cover a longer lookback
+            result[p] = candles.tail(ceil(lookbacks[p] / timeframe_to_msecs(p[1]))).reset_index(
+                drop=True
+            )
+        return result
 
     def _now_is_time_to_refresh(self, pair: str, timeframe: str, candle_type: CandleType) -> bool:
         # Timeframe in seconds
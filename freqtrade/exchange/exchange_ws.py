@@ -3,7 +3,7 @@ import logging
 import time
 from copy import deepcopy
 from functools import partial
-from threading import Thread
+from threading import Event, Thread
 
 import ccxt
 
@@ -29,6 +29,10 @@ class ExchangeWS:
         self._klines_scheduled: set[PairWithTimeframe] = set()
         self.klines_last_refresh: dict[PairWithTimeframe, float] = {}
         self.klines_last_request: dict[PairWithTimeframe, float] = {}
+        # Open time of the latest candle received per pair/timeframe combination
+        self._klines_last_candle: dict[PairWithTimeframe, int] = {}
+        # Set whenever a new candle started - meaning the previous candle closed
+        self.candle_closed = Event()
         self._thread = Thread(name="ccxt_ws", target=self._start_forever)
         self._thread.start()
         self.__cleanup_called = False
@@ -85,6 +89,7 @@ class ExchangeWS:
         """
         self._ccxt_object.ohlcvs.get(paircomb[0], {}).pop(paircomb[1], None)
         self.klines_last_refresh.pop(paircomb, None)
+        self._klines_last_candle.pop(paircomb, None)
 
     @retrier(retries=3)
     def ohlcvs(self, pair: str, timeframe: str) -> list[list]:
@@ -175,6 +180,7 @@ class ExchangeWS:
                 start = dt_ts()
                 data = await self._ccxt_object.watch_ohlcv(pair, timeframe)
                 self.klines_last_refresh[(pair, timeframe, candle_type)] = dt_ts()
+                self._register_candle((pair, timeframe, candle_type), data)
                 logger.debug(
                     f"watch done {pair}, {timeframe}, data {len(data)} "
                     f"in {(dt_ts() - start) / 1000:.3f}s"
@@ -186,6 +192,19 @@ class ExchangeWS:
         finally:
             self._klines_watching.discard((pair, timeframe, candle_type))
 
+    def _register_candle(self, paircomb: PairWithTimeframe, data: list[list]) -> None:
+        """
+        Signal candle_closed once a candle newer than the previously received candle arrives.
+        Only candles of the strategy timeframe trigger a new bot iteration.
+        """
+        if not data or paircomb[1] != self.config.get("timeframe"):
+            return
+        candle_ts = data[-1][0]
+        previous_ts = self._klines_last_candle.get(paircomb)
+        self._klines_last_candle[paircomb] = candle_ts
+        if previous_ts is not None and candle_ts > previous_ts:
+            self.candle_closed.set()
+
     def schedule_ohlcv(self, pair: str, timeframe: str, candle_type: CandleType) -> None:
         """
         Schedule a pair/timeframe combination to be watched
@@ -282,6 +282,21 @@ class FreqtradeBot(LoggingMixin):
         with self._measure_execution:
             self.strategy.analyze(self.active_pair_whitelist)
 
+        self._process_trades()
+
+    def process_trades(self) -> None:
+        """
+        Handles open orders and trades based on the last analysis, and enters new trades.
+        Lighter version of process() - doesn't reload markets, refresh the pairlist or candles
+        and doesn't analyze pairs.
+        Used between two candles when the bot loop is event driven.
+        """
+        strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)(
+            current_time=datetime.now(timezone.utc)
+        )
+        self._process_trades()
+
+    def _process_trades(self) -> None:
         with self._exit_lock:
             # Check for exchange cancellations, timeouts and user requested replace
             self.manage_open_orders()
@@ -1,22 +1,49 @@
 import hashlib
+import logging
 from copy import deepcopy
+from datetime import datetime
 from pathlib import Path
+from typing import Any
 
 import rapidjson
+from joblib import dump, load
+from pandas import DataFrame
+from pandas.util import hash_pandas_object
 
+from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS
 
-def get_strategy_run_id(strategy) -> str:
+
+logger = logging.getLogger(__name__)
+
+
+def get_strategy_run_id(strategy, ignore_timerange: bool = False) -> str:
     """
     Generate unique identification hash for a backtest run. Identical config and strategy file will
     always return an identical hash.
     :param strategy: strategy object.
+    :param ignore_timerange: Exclude the timerange from the hash (for incremental backtests).
     :return: hex string id.
     """
     digest = hashlib.sha1()  # noqa: S324
     config = deepcopy(strategy.config)
 
     # Options that have no impact on results of individual backtest.
-    not_important_keys = ("strategy_list", "original_config", "telegram", "api_server")
+    not_important_keys: tuple[str, ...] = (
+        "strategy_list",
+        "original_config",
+        "telegram",
+        "api_server",
+        # Settings which only affect speed
+        "backtest_incremental_cache",
+        "backtest_strategy_jobs",
+        "indicator_jobs",
+        "analyze_jobs",
+        "data_load_jobs",
+        "download_jobs",
+        "ohlcv_cache_size",
+    )
+    if ignore_timerange:
+        not_important_keys += ("timerange",)
     for k in not_important_keys:
         if k in config:
             del config[k]
@@ -41,3 +68,92 @@ def get_backtest_metadata_filename(filename: Path | str) -> Path:
     """Return metadata filename for specified backtest results file."""
     filename = Path(filename)
     return filename.parent / Path(f"{filename.stem}.meta.json")
+
+
+def get_data_fingerprint(data: dict[str, DataFrame], end_date: datetime) -> dict[str, Any]:
+    """
+    Fingerprint the candle data before end_date, per pair.
+    Two datasets with identical fingerprints produce identical backtests up to end_date.
+    :param data: Dictionary of {pair: OHLCV dataframe}
+    :param end_date: Only candles before this date are considered
+    :return: dict of {pair: {"start": timestamp, "end": timestamp, "hash": hex string}}
+    """
+    fingerprint = {}
+    for pair, df in sorted(data.items()):
+        candles = df.loc[df["date"] < end_date, DEFAULT_DATAFRAME_COLUMNS]
+        if candles.empty:
+            fingerprint[pair] = None
+            continue
+        digest = hashlib.sha1(  # noqa: S324
+            hash_pandas_object(candles, index=False).to_numpy().tobytes()
+        )
+        fingerprint[pair] = {
+            "start": int(candles["date"].iloc[0].timestamp()),
+            "end": int(candles["date"].iloc[-1].timestamp()),
+            "hash": digest.hexdigest(),
+        }
+    return fingerprint
+
+
+def get_backtest_state_filename(directory: Path, cache_key: str) -> Path:
+    """Return the state cache filename for the specified cache key."""
+    return directory / f"backtest-state-{cache_key}.pkl"
+
+
+def load_backtest_state(
+    directory: Path,
+    cache_key: str,
+    start_date: datetime,
+    end_date: datetime,
+    data: dict[str, DataFrame],
+) -> dict[str, Any] | None:
+    """
+    Load the stored backtest state for cache_key, if it can be used to continue
+    a backtest from start_date to end_date on the given data.
+    :param directory: Directory containing the state cache
+    :param cache_key: Strategy run id, ignoring the timerange
+    :param start_date: Start date of the new backtest
+    :param end_date: End date of the new backtest
+    :param data: Dictionary of {pair: OHLCV dataframe} of the new backtest
+    :return: Stored state, or None if no matching state is available.
+    """
+    filename = get_backtest_state_filename(directory, cache_key)
+    if not filename.is_file():
+        return None
+    try:
+        with filename.open("rb") as f:
+            cached = load(f)
+    except Exception as e:
+        logger.warning(f"Could not load backtest state from {filename}: {e}")
+        return None
+    if cached["start_date"] != start_date or cached["date"] > end_date:
+        logger.info("Backtest state cache doesn't match the timerange, ignoring.")
+        return None
+    if cached["fingerprint"] != get_data_fingerprint(data, cached["date"]):
+        logger.info("Candle data changed since the backtest state was cached, ignoring.")
+        return None
+    return cached
+
+
+def store_backtest_state(
+    directory: Path,
+    cache_key: str,
+    start_date: datetime,
+    data: dict[str, DataFrame],
+    state: dict[str, Any],
+) -> None:
+    """
+    Store the backtest state so a later backtest can continue from state["date"].
+    :param directory: Directory containing the state cache
+    :param cache_key: Strategy run id, ignoring the timerange
+    :param start_date: Start date of the backtest
+    :param data: Dictionary of {pair: OHLCV dataframe} used for the backtest
+    :param state: Backtest state, as returned by Backtesting
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    cached = {
+        **state,
+        "start_date": start_date,
+        "fingerprint": get_data_fingerprint(data, state["date"]),
+    }
+    dump(cached, get_backtest_state_filename(directory, cache_key))
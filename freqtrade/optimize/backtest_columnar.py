@@ -0,0 +1,252 @@
+"""
+Columnar (numpy backed) data containers for the backtesting engine.
+"""
+
+import sys
+from collections.abc import Iterable
+
+import numpy as np
+from pandas import DataFrame, Timestamp
+
+from freqtrade.persistence import LocalTrade
+from freqtrade.strategy.interface import IStrategy
+
+
+# Numeric columns, in the order of the backtesting HEADERS (excluding date and tags)
+NUMERIC_COLUMNS = [
+    "open",
+    "high",
+    "low",
+    "close",
+    "enter_long",
+    "exit_long",
+    "enter_short",
+    "exit_short",
+]
+
+# Relative safety margin for the exit pre-scan. Waking a trade too early is always safe.
+PRESCAN_TOLERANCE = 1e-9
+
+
+def strategy_overrides(strategy: IStrategy, callback: str) -> bool:
+    """
+    Check if the strategy (or the instance) replaces the IStrategy default for a callback.
+    :param strategy: Strategy instance to check
+    :param callback: Name of the callback, e.g. "bot_loop_start"
+    :return: True if the callback is implemented by the strategy
+    """
+    return getattr(getattr(strategy, callback), "__func__", None) is not getattr(
+        IStrategy, callback
+    )
+
+
+class ColumnarPairData:
+    """
+    OHLCV and signal columns of one pair, stored as contiguous numpy arrays.
+    Rows are materialized on demand, in the same layout the list based backtest uses.
+    """
+
+    __slots__ = ("candle_idx", "dates", "enter_tags", "exit_tags", "values")
+
+    def __init__(self, df: DataFrame, start_date: Timestamp, timeframe_secs: int) -> None:
+        """
+        :param df: Analyzed and shifted dataframe, containing all backtesting HEADERS
+        :param start_date: Backtest start date. Candle indexes are counted from this date.
+        :param timeframe_secs: Timeframe of the main candles in seconds
+        """
+        if df.empty:
+            df = df.reindex(columns=["date", *NUMERIC_COLUMNS, "enter_tag", "exit_tag"])
+        self.dates: np.ndarray = df["date"].to_numpy(dtype="datetime64[ns]").view("int64")
+        self.values: np.ndarray = df[NUMERIC_COLUMNS].to_numpy(dtype=np.float64)
+        self.enter_tags: np.ndarray = df["enter_tag"].to_numpy(dtype=object)
+        self.exit_tags: np.ndarray = df["exit_tag"].to_numpy(dtype=object)
+        self.candle_idx: np.ndarray = self._align_candles(
+            self.dates, Timestamp(start_date).value, timeframe_secs * 1_000_000_000
+        )
+
+    @staticmethod
+    def _align_candles(dates: np.ndarray, start_ns: int, timeframe_ns: int) -> np.ndarray:
+        """
+        Calculate the main-loop candle (counted from start_ns, starting at 1) each row is
+        processed at.
+        Mirrors the list based loop, which consumes at most one row per candle, and only once
+        the candle date has been reached.
+        """
+        if len(dates) == 0:
+            return np.empty(0, dtype=np.int64)
+        # First candle at or after the row date - rounded up.
+        first_candle = np.maximum(-((start_ns - dates) // timeframe_ns), 1)
+        offset = np.arange(len(dates), dtype=np.int64)
+        return np.maximum.accumulate(first_candle - offset) + offset
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __getitem__(self, idx: int) -> list:
+        return [
+            Timestamp(self.dates[idx], tz="UTC"),
+            *self.values[idx].tolist(),
+            self.enter_tags[idx],
+            self.exit_tags[idx],
+        ]
+
+    def row_index_at(self, candle: int) -> int | None:
+        """
+        Get the row index processed at the given candle, or None if the pair has no row there.
+        """
+        idx = int(np.searchsorted(self.candle_idx, candle))
+        if idx < len(self.candle_idx) and self.candle_idx[idx] == candle:
+            return idx
+        return None
+
+    def rows_until(self, candle: int) -> int:
+        """
+        Number of rows processed up to (and including) the given candle.
+        """
+        return int(np.searchsorted(self.candle_idx, candle, side="right"))
+
+    def entry_signal_mask(self, can_short: bool) -> np.ndarray:
+        """
+        Vectorized equivalent of Backtesting.check_for_trade_entry.
+        """
+        enter_long = self.values[:, 4] == 1
+        exit_long = self.values[:, 5] == 1
+        enter_short = (self.values[:, 6] == 1) & can_short
+        exit_short = (self.values[:, 7] == 1) & can_short
+        return (enter_long & ~(exit_long | enter_short)) | (
+            enter_short & ~(exit_short | enter_long)
+        )
+
+
+def build_signal_index(
+    data: dict[str, ColumnarPairData], pairs: list[str], can_short: bool, max_candle: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Build a sorted index of all candles with entry signals.
+    :param data: Columnar data per pair
+    :param pairs: Pairs, in processing order
+    :param can_short: Whether short signals are considered
+    :param max_candle: Last candle of the backtest
+    :return: Tuple of (candle index, pair index into pairs), sorted by candle, then pair.
+    """
+    candles: list[np.ndarray] = []
+    pair_idx: list[np.ndarray] = []
+    for idx, pair in enumerate(pairs):
+        pair_data = data[pair]
+        if len(pair_data) == 0:
+            continue
+        signal_candles = pair_data.candle_idx[pair_data.entry_signal_mask(can_short)]
+        signal_candles = signal_candles[signal_candles <= max_candle]
+        candles.append(signal_candles)
+        pair_idx.append(np.full(len(signal_candles), idx, dtype=np.int64))
+
+    if not candles:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    all_candles = np.concatenate(candles)
+    all_pairs = np.concatenate(pair_idx)
+    order = np.lexsort((all_pairs, all_candles))
+    return all_candles[order], all_pairs[order]
+
+
+def signal_pairs_at(
+    signal_candles: np.ndarray, signal_pairs: np.ndarray, candle: int
+) -> np.ndarray:
+    """
+    Get the pair indexes with an entry signal at the given candle, in processing order.
+    """
+    return signal_pairs[
+        np.searchsorted(signal_candles, candle) : np.searchsorted(
+            signal_candles, candle, side="right"
+        )
+    ]
+
+
+def next_active_candle(
+    signal_candles: np.ndarray, candle: int, dormant: Iterable[tuple[int, int]]
+) -> int:
+    """
+    Get the next candle (at or after candle) with an entry signal or a waking trade.
+    :param signal_candles: Sorted signal candles, as returned by build_signal_index
+    :param dormant: (dormant_from, wake) tuples of dormant trades
+    :return: candle index - or sys.maxsize if there's no further activity.
+    """
+    next_signal = int(np.searchsorted(signal_candles, candle))
+    return min(
+        [wake for _, wake in dormant]
+        + signal_candles[next_signal : next_signal + 1].tolist()
+        + [sys.maxsize]
+    )
+
+
+def roi_to_rate_threshold(trade: LocalTrade, roi: float) -> float:
+    """
+    Lowest rate at which a (long, spot) trade could reach the given ROI.
+    Kept slightly conservative to account for rounding of the profit ratio.
+    """
+    if not trade.amount:
+        return 0.0
+    threshold = (
+        trade.open_trade_value * (1 + roi - 1e-7) / (trade.amount * (1 - (trade.fee_close or 0.0)))
+    )
+    return threshold * (1 - PRESCAN_TOLERANCE)
+
+
+def trailing_to_rate_threshold(
+    trade: LocalTrade, stoploss: float, trailing_stop_positive: float | None
+) -> float:
+    """
+    Lowest candle high which could move the trailing stop of a (long, spot) trade.
+    Ignores trailing offsets - which can only delay the stop movement.
+    """
+    distance = min(abs(stoploss), abs(trailing_stop_positive or stoploss))
+    if distance >= 1:
+        return np.inf
+    return trade.stop_loss / (1 - distance) * (1 - PRESCAN_TOLERANCE)
+
+
+def find_exit_candidate(
+    pair_data: ColumnarPairData,
+    start_row: int,
+    *,
+    open_date_ns: int,
+    stop_loss: float,
+    roi_thresholds: list[tuple[int, float]],
+    trailing_threshold: float | None,
+    use_exit_signal: bool,
+) -> int:
+    """
+    Find the first row at which a (long, spot) trade may exit, or may adjust its stoploss.
+    Rows before that can't change the trade - apart from max_rate / min_rate.
+    Scans in growing chunks, so short trades don't pay for a scan of the full data.
+    :param start_row: First row to consider
+    :param open_date_ns: Trade open date as epoch nanoseconds
+    :param stop_loss: Current stoploss rate of the trade
+    :param roi_thresholds: List of (minutes, rate threshold), sorted by minutes
+    :param trailing_threshold: Candle high which could move the trailing stop (None to disable)
+    :param use_exit_signal: Consider exit signals
+    :return: row index - or len(pair_data) if no such row exists.
+    """
+    roi_minutes = np.array([minutes for minutes, _ in roi_thresholds], dtype=np.int64)
+    roi_rates = np.array([rate for _, rate in roi_thresholds] + [np.inf], dtype=np.float64)
+
+    length = len(pair_data)
+    chunk = 256
+    pos = start_row
+    while pos < length:
+        end = min(length, pos + chunk)
+        high = pair_data.values[pos:end, 1]
+        event = pair_data.values[pos:end, 2] <= stop_loss
+        if len(roi_minutes):
+            duration = (pair_data.dates[pos:end] - open_date_ns) // 60_000_000_000
+            # Index -1 (no roi entry reached yet) maps to the trailing np.inf
+            event |= high >= roi_rates[np.searchsorted(roi_minutes, duration, side="right") - 1]
+        if trailing_threshold is not None:
+            event |= high >= trailing_threshold
+        if use_exit_signal:
+            event |= pair_data.values[pos:end, 5] != 0
+        hits = np.flatnonzero(event)
+        if len(hits):
+            return pos + int(hits[0])
+        pos = end
+        chunk *= 4
+    return length
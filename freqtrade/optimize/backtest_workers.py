@@ -0,0 +1,86 @@
+"""
+Worker processes backtesting the strategies of --strategy-list in parallel.
+The Backtesting instance is sent to every worker once, when the worker starts.
+Candle data is loaded from a SharedDataStore, so all workers map the same files.
+"""
+
+import logging
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from joblib.externals import cloudpickle
+from joblib.externals.loky import ProcessPoolExecutor
+
+from freqtrade.configuration import TimeRange
+from freqtrade.optimize.shared_data_store import SharedDataStore
+
+
+if TYPE_CHECKING:
+    from freqtrade.optimize.backtesting import Backtesting
+
+
+logger = logging.getLogger(__name__)
+
+# Backtesting instance of this worker process
+_backtesting: "Backtesting | None" = None
+_data_store: SharedDataStore | None = None
+
+
+def register_strategy_modules(bases: tuple[type, ...]) -> None:
+    """
+    Register the modules of strategy base classes to be pickled by value,
+    so strategies inheriting from classes in other files work in the workers.
+    """
+    for base in bases:
+        if base.__name__ != "IStrategy":
+            if mod := sys.modules.get(base.__module__):
+                cloudpickle.register_pickle_by_value(mod)
+            register_strategy_modules(base.__bases__)
+
+
+def init_worker(backtesting: "Backtesting", data_dir: Path, detail_dir: Path | None) -> None:
+    """
+    Initialize a worker process. Called once per worker, in the worker process.
+    """
+    global _backtesting, _data_store
+    _backtesting = backtesting
+    _data_store = SharedDataStore(data_dir)
+    if detail_dir is not None:
+        _backtesting.detail_data = SharedDataStore(detail_dir).load()
+
+
+def run_strategy(strategy_idx: int, timerange: TimeRange) -> dict[str, Any]:
+    """
+    Backtest one strategy of the strategy list in a worker process.
+    :return: Backtest content, analysis results and date range of this strategy.
+    """
+    if _backtesting is None or _data_store is None:
+        raise RuntimeError("Backtest worker has not been initialized.")
+    strat = _backtesting.strategylist[strategy_idx]
+    strategy_name = strat.get_strategy_name()
+    min_date, max_date = _backtesting.backtest_one_strategy(strat, _data_store.load(), timerange)
+    return {
+        "strategy_name": strategy_name,
+        "content": _backtesting.all_bt_content.pop(strategy_name),
+        "analysis": {
+            key: results.pop(strategy_name)
+            for key, results in _backtesting.analysis_results.items()
+            if strategy_name in results
+        },
+        "min_date": min_date,
+        "max_date": max_date,
+    }
+
+
+def get_worker_pool(
+    backtesting: "Backtesting", n_jobs: int, data_dir: Path, detail_dir: Path | None
+) -> ProcessPoolExecutor:
+    """
+    Start a pool of n_jobs worker processes, each holding its own copy of backtesting.
+    """
+    return ProcessPoolExecutor(
+        max_workers=n_jobs,
+        initializer=init_worker,
+        initargs=(backtesting, data_dir, detail_dir),
+    )
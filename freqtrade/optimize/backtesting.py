@@ -5,12 +5,21 @@ This module contains the backtesting logic
 """
 
 import logging
+from bisect import bisect_left
 from collections import defaultdict
+from collections.abc import Callable
 from copy import deepcopy
 from datetime import datetime, timedelta
+from itertools import repeat
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any
 
+import numpy as np
+from joblib import effective_n_jobs
 from numpy import nan
-from pandas import DataFrame
+from pandas import DataFrame, Timestamp
+from pandas.arrays import DatetimeArray
 
 from freqtrade import constants
 from freqtrade.configuration import TimeRange, validate_config_consistency
@@ -44,7 +53,26 @@ from freqtrade.ft_types import (
 )
 from freqtrade.leverage.liquidation_price import update_liquidation_prices
 from freqtrade.mixins import LoggingMixin
-from freqtrade.optimize.backtest_caching import get_strategy_run_id
+from freqtrade.optimize.backtest_caching import (
+    get_strategy_run_id,
+    load_backtest_state,
+    store_backtest_state,
+)
+from freqtrade.optimize.backtest_columnar import (
+    ColumnarPairData,
+    build_signal_index,
+    find_exit_candidate,
+    next_active_candle,
+    roi_to_rate_threshold,
+    signal_pairs_at,
+    strategy_overrides,
+    trailing_to_rate_threshold,
+)
+from freqtrade.optimize.backtest_workers import (
+    get_worker_pool,
+    register_strategy_modules,
+    run_strategy,
+)
 from freqtrade.optimize.bt_progress import BTProgress
 from freqtrade.optimize.optimize_reports import (
     generate_backtest_stats,
@@ -53,6 +81,7 @@ from freqtrade.optimize.optimize_reports import (
     show_backtest_results,
     store_backtest_results,
 )
+from freqtrade.optimize.shared_data_store import SharedDataStore
 from freqtrade.persistence import (
     CustomDataWrapper,
     LocalTrade,
@@ -131,6 +160,7 @@ class Backtesting:
         }
         self.rejected_dict: dict[str, list] = {}
 
+        history.set_ohlcv_cache_size(self.config.get("ohlcv_cache_size", 0))
         self._exchange_name = self.config["exchange"]["name"]
         if not exchange:
             exchange = ExchangeResolver.load_exchange(self.config, load_leverage_tiers=True)
@@ -217,6 +247,10 @@ class Backtesting:
         # strategies which define "can_short=True" will fail to load in Spot mode.
         self._can_short = self.trading_mode != TradingMode.SPOT
         self._position_stacking: bool = self.config.get("position_stacking", False)
+        self.backtest_engine: str = self.config.get("backtest_engine", "classic")
+        self.incremental_cache: bool = self.config.get("backtest_incremental_cache", False)
+        # Backtest state taken before the last candle - used to extend a backtest later on
+        self._state_snapshot: dict[str, Any] | None = None
         self.enable_protections: bool = self.config.get("enable_protections", False)
         migrate_data(config, self.exchange)
 
@@ -252,6 +286,8 @@ class Backtesting:
         else:
             self.timeframe_detail_td = timedelta(seconds=0)
         self.detail_data: dict[str, DataFrame] = {}
+        # {pair: (detail dataframe, dates, ohlc values)} - see _get_detail_index()
+        self._detail_index: dict[str, tuple[DataFrame, DatetimeArray, np.ndarray]] = {}
         self.futures_data: dict[str, DataFrame] = {}
 
     def init_backtest(self):
@@ -299,6 +335,9 @@ class Backtesting:
             fail_without_data=True,
             data_format=self.config["dataformat_ohlcv"],
             candle_type=self.config.get("candle_type_def", CandleType.SPOT),
+            n_jobs=self.config.get("data_load_jobs", 1),
+            base_timeframe=self.config.get("ohlcv_base_timeframe"),
+            candle_offset=self.config.get("ohlcv_candle_offset"),
         )
 
         min_date, max_date = history.get_timerange(data)
@@ -331,6 +370,9 @@ class Backtesting:
                 fail_without_data=True,
                 data_format=self.config["dataformat_ohlcv"],
                 candle_type=self.config.get("candle_type_def", CandleType.SPOT),
+                n_jobs=self.config.get("data_load_jobs", 1),
+                base_timeframe=self.config.get("ohlcv_base_timeframe"),
+                candle_offset=self.config.get("ohlcv_candle_offset"),
             )
         else:
             self.detail_data = {}
@@ -349,6 +391,7 @@ class Backtesting:
                 fail_without_data=True,
                 data_format=self.config["dataformat_ohlcv"],
                 candle_type=CandleType.FUNDING_RATE,
+                n_jobs=self.config.get("data_load_jobs", 1),
             )
 
             # For simplicity, assign to CandleType.Mark (might contain index candles!)
@@ -361,6 +404,7 @@ class Backtesting:
                 fail_without_data=True,
                 data_format=self.config["dataformat_ohlcv"],
                 candle_type=CandleType.from_string(self.exchange.get_option("mark_ohlcv_price")),
+                n_jobs=self.config.get("data_load_jobs", 1),
             )
             # Combine data to avoid combining the data per trade.
             unavailable_pairs = []
@@ -407,6 +451,54 @@ class Backtesting:
         if enable_protections:
             self._load_protections(self.strategy)
 
+    def _get_backtest_state(self, current_time: datetime) -> dict[str, Any]:
+        """
+        Copy of the simulation state before processing the candle at current_time.
+        """
+        return deepcopy(
+            {
+                "date": current_time,
+                "trades": LocalTrade.bt_trades,
+                "trades_open": LocalTrade.bt_trades_open,
+                "trades_open_pp": LocalTrade.bt_trades_open_pp,
+                "open_trade_count": LocalTrade.bt_open_open_trade_count,
+                "total_profit": LocalTrade.bt_total_profit,
+                "locks": PairLocks.locks,
+                "custom_data": CustomDataWrapper.custom_data,
+                "trade_id_counter": self.trade_id_counter,
+                "order_id_counter": self.order_id_counter,
+                "counters": {
+                    "rejected_trades": self.rejected_trades,
+                    "timedout_entry_orders": self.timedout_entry_orders,
+                    "timedout_exit_orders": self.timedout_exit_orders,
+                    "canceled_trade_entries": self.canceled_trade_entries,
+                    "canceled_entry_orders": self.canceled_entry_orders,
+                    "replaced_entry_orders": self.replaced_entry_orders,
+                    "canceled_exit_orders": self.canceled_exit_orders,
+                    "replaced_exit_orders": self.replaced_exit_orders,
+                },
+            }
+        )
+
+    def _restore_backtest_state(self, state: dict[str, Any]) -> None:
+        """
+        Restore a simulation state taken by _get_backtest_state().
+        Must be called after prepare_backtest().
+        """
+        state = deepcopy(state)
+        LocalTrade.bt_trades = state["trades"]
+        LocalTrade.bt_trades_open = state["trades_open"]
+        LocalTrade.bt_trades_open_pp = state["trades_open_pp"]
+        LocalTrade.bt_open_open_trade_count = state["open_trade_count"]
+        LocalTrade.bt_total_profit = state["total_profit"]
+        PairLocks.locks = state["locks"]
+        CustomDataWrapper.custom_data = state["custom_data"]
+        # Ids must stay unique if other strategies ran in the meantime.
+        self.trade_id_counter = max(self.trade_id_counter, state["trade_id_counter"])
+        self.order_id_counter = max(self.order_id_counter, state["order_id_counter"])
+        for name, value in state["counters"].items():
+            setattr(self, name, value)
+
     def check_abort(self):
         """
         Check if abort was requested, raise DependencyException if that's the case
@@ -427,9 +519,35 @@ class Backtesting:
         """
 
         data: dict = {}
+        for pair, df_analyzed in self._get_shifted_signals(processed):
+            # Convert from Pandas to list for performance reasons
+            # (Looping Pandas is slow.)
+            data[pair] = df_analyzed[HEADERS].values.tolist() if not df_analyzed.empty else []
+        return data
+
+    def _get_ohlcv_as_arrays(
+        self, processed: dict[str, DataFrame], start_date: datetime
+    ) -> dict[str, ColumnarPairData]:
+        """
+        Helper function to convert processed dataframes into columnar numpy arrays.
+        Used by the columnar backtest engine.
+
+        :param processed: a processed dictionary with format {pair, data}, which gets cleared to
+        optimize memory usage!
+        :param start_date: backtesting timerange start datetime
+        """
+        return {
+            pair: ColumnarPairData(df_analyzed, start_date, self.timeframe_secs)
+            for pair, df_analyzed in self._get_shifted_signals(processed)
+        }
+
+    def _get_shifted_signals(self, processed: dict[str, DataFrame]):
+        """
+        Populate signals for all pairs and shift them by one candle.
+        :return: generator of (pair, dataframe) tuples
+        """
         self.progress.init_step(BacktestState.CONVERT, len(processed))
 
-        # Create dict with data
         for pair in processed.keys():
             pair_data = processed[pair]
             self.check_abort()
@@ -467,11 +585,7 @@ class Backtesting:
                     df_analyzed[col] = 0 if not tag_col else None
 
             df_analyzed = df_analyzed.drop(df_analyzed.head(1).index)
-
-            # Convert from Pandas to list for performance reasons
-            # (Looping Pandas is slow.)
-            data[pair] = df_analyzed[HEADERS].values.tolist() if not df_analyzed.empty else []
-        return data
+            yield pair, df_analyzed
 
     def _get_close_rate(
         self, row: tuple, trade: LocalTrade, exit_: ExitCheckTuple, trade_dur: int
@@ -1455,26 +1569,37 @@ class Backtesting:
             return exiting_dir
         return None
 
+    def _get_detail_index(self, pair: str) -> tuple[DatetimeArray, np.ndarray]:
+        """
+        Dates and OHLC values of the detail data of this pair, as arrays.
+        Built once per detail dataframe.
+        """
+        detail_data = self.detail_data[pair]
+        cached = self._detail_index.get(pair)
+        if cached is None or cached[0] is not detail_data:
+            cached = (
+                detail_data,
+                detail_data["date"].array,
+                detail_data[HEADERS[OPEN_IDX : CLOSE_IDX + 1]].to_numpy(),
+            )
+            self._detail_index[pair] = cached
+        return cached[1], cached[2]
+
     def get_detail_data(self, pair: str, row: tuple) -> list[tuple] | None:
         """
         Spread into detail data
         """
-        current_detail_time: datetime = row[DATE_IDX].to_pydatetime()
-        exit_candle_end = current_detail_time + self.timeframe_td
-        detail_data = self.detail_data[pair]
-        detail_data = detail_data.loc[
-            (detail_data["date"] >= current_detail_time) & (detail_data["date"] < exit_candle_end)
-        ].copy()
+        dates, ohlc = self._get_detail_index(pair)
+        start = dates.searchsorted(row[DATE_IDX], side="left")
+        end = dates.searchsorted(row[DATE_IDX] + self.timeframe_td, side="left")
 
-        if len(detail_data) == 0:
+        if start == end:
             return None
-        detail_data.loc[:, "enter_long"] = row[LONG_IDX]
-        detail_data.loc[:, "exit_long"] = row[ELONG_IDX]
-        detail_data.loc[:, "enter_short"] = row[SHORT_IDX]
-        detail_data.loc[:, "exit_short"] = row[ESHORT_IDX]
-        detail_data.loc[:, "enter_tag"] = row[ENTER_TAG_IDX]
-        detail_data.loc[:, "exit_tag"] = row[EXIT_TAG_IDX]
-        return detail_data[HEADERS].values.tolist()
+        signals = row[LONG_IDX : EXIT_TAG_IDX + 1]
+        return [
+            [date, *values, *signals]
+            for date, values in zip(dates[start:end], ohlc[start:end].tolist(), strict=True)
+        ]
 
     def _time_generator(self, start_date: datetime, end_date: datetime):
         current_time = start_date + self.timeframe_td
@@ -1513,110 +1638,342 @@ class Backtesting:
         end_date: datetime,
         pairs: list[str],
         data: dict[str, list[tuple]],
+        resume_date: datetime | None = None,
+        snapshot_date: datetime | None = None,
     ):
         """
         Backtest time and pair generator
+        :param resume_date: Continue a backtest at this candle (state must be restored already)
+        :param snapshot_date: Take a state snapshot before processing this candle
         :returns: generator of (current_time, pair, row, is_last_row, trade_dir)
             where is_last_row is a boolean indicating if this is the data end date.
         """
-        current_time = start_date + self.timeframe_td
         self.progress.init_step(
             BacktestState.BACKTEST, int((end_date - start_date) / self.timeframe_td)
         )
         # Indexes per pair, so some pairs are allowed to have a missing start.
         indexes: dict = defaultdict(int)
+        if resume_date:
+            for pair in pairs:
+                indexes[pair] = bisect_left(data[pair], resume_date, key=lambda r: r[DATE_IDX])
+            self.progress.set_new_value(int((resume_date - start_date) / self.timeframe_td) - 1)
+            start_date = resume_date - self.timeframe_td
+
+        def get_row(pair: str, current_time: datetime) -> tuple | None:
+            row_index = indexes[pair]
+            row = self.validate_row(data, pair, row_index, current_time)
+            if not row:
+                return None
+            row_index += 1
+            indexes[pair] = row_index
+            self.dataprovider._set_dataframe_max_index(pair, self.required_startup + row_index)
+            return row
 
         for current_time in self._time_generator(start_date, end_date):
             # Loop for each main candle.
             self.check_abort()
+            if current_time == snapshot_date:
+                self._state_snapshot = self._get_backtest_state(current_time)
             # Reset open trade count for this candle
             # Critical to avoid exceeding max_open_trades in backtesting
             # when timeframe-detail is used and trades close within the opening candle.
             strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)(
                 current_time=current_time
             )
-            pair_detail_cache: dict[str, list[tuple]] = {}
-            pair_tradedir_cache: dict[str, LongShort | None] = {}
-            pairs_with_open_trades = [t.pair for t in LocalTrade.bt_trades_open]
+            yield from self._candle_pair_generator(current_time, end_date, pairs, get_row)
+            self.progress.increment()
 
-            for current_time_det, is_first, has_detail, idx, pair in self._time_pair_generator_det(
-                current_time, pairs
-            ):
-                # Loop for each detail candle (if necessary) and pair
-                # Yields only the main date if no detail timeframe is set.
-
-                # Pairs that have open trades should be processed first
-                trade_dir: LongShort | None = None
-                if is_first:
-                    # Main candle
-                    row_index = indexes[pair]
-                    row = self.validate_row(data, pair, row_index, current_time)
-                    if not row:
-                        continue
-
-                    row_index += 1
-                    indexes[pair] = row_index
-                    is_last_row = current_time == end_date
-                    self.dataprovider._set_dataframe_max_index(
-                        pair, self.required_startup + row_index
-                    )
-                    trade_dir = self.check_for_trade_entry(row)
-                    pair_tradedir_cache[pair] = trade_dir
+    def _candle_number(self, start_date: datetime, date: datetime | None, default: int) -> int:
+        """
+        Number of the candle at date, counted from start_date (default if date is not set).
+        """
+        return (date - start_date) // self.timeframe_td if date else default
 
-                else:
-                    # Detail candle - from cache.
-                    detail_data = pair_detail_cache.get(pair)
-                    if detail_data is None or len(detail_data) <= idx:
-                        # logger.info(f"skipping {pair}, {current_time_det}, {trade_dir}")
-                        continue
-                    row = detail_data[idx]
-                    trade_dir = pair_tradedir_cache.get(pair)
-
-                    if self.strategy.ignore_expired_candle(
-                        current_time - self.timeframe_td,  # last closed candle is 1 timeframe away.
-                        current_time_det,
-                        self.timeframe_secs,
-                        trade_dir is not None,
-                    ):
-                        # Ignore late entries eventually
-                        trade_dir = None
-
-                self.dataprovider._set_dataframe_max_date(current_time_det)
-
-                pair_has_open_trades = len(LocalTrade.bt_trades_open_pp[pair]) > 0
-                if pair in pairs_with_open_trades and not pair_has_open_trades:
-                    # Pair has had open trades which closed in the current main candle.
-                    # Skip this pair for this timeframe
+    def time_pair_generator_columnar(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        pairs: list[str],
+        data: dict[str, ColumnarPairData],
+        resume_date: datetime | None = None,
+        snapshot_date: datetime | None = None,
+    ):
+        """
+        Columnar backtest time and pair generator.
+        Only visits candles with an entry signal or open trades - and within these candles,
+        only pairs with an entry signal or open trades.
+        All other (pair, candle) combinations are no-ops in backtest_loop.
+        :param resume_date: Continue a backtest at this candle (state must be restored already)
+        :param snapshot_date: Take a state snapshot before processing this candle
+        :returns: generator of (current_time, pair, row, is_last_row, trade_dir)
+            where is_last_row is a boolean indicating if this is the data end date.
+        """
+        num_candles = int((end_date - start_date) / self.timeframe_td)
+        self.progress.init_step(BacktestState.BACKTEST, num_candles)
+        signal_candles, signal_pairs = build_signal_index(data, pairs, self._can_short, num_candles)
+        # bot_loop_start must see every candle if the strategy implements it.
+        visit_all = strategy_overrides(self.strategy, "bot_loop_start")
+        use_exit_prescan = self._exit_prescan_available()
+        # Pairs whose open trade can't exit before a given candle - {pair: (from, wake)}
+        dormant: dict[str, tuple[int, int]] = {}
+
+        def get_row(pair: str, current_time: datetime) -> tuple | None:
+            if pair in dormant:
+                return None
+            pair_data = data[pair]
+            row_index = pair_data.row_index_at((current_time - start_date) // self.timeframe_td)
+            if row_index is None:
+                return None
+            self.dataprovider._set_dataframe_max_index(pair, self.required_startup + row_index + 1)
+            return pair_data[row_index]
+
+        snapshot_candle = self._candle_number(start_date, snapshot_date, num_candles + 1)
+        candle = self._candle_number(start_date, resume_date, 1)
+        self.progress.set_new_value(candle - 1)
+        while candle <= num_candles:
+            self.check_abort()
+            if not visit_all and len(dormant) == len(LocalTrade.bt_trades_open):
+                # Nothing can happen until the next entry signal or until a
+                # dormant trade wakes up - skip ahead.
+                # Stop at the snapshot candle if it's still ahead.
+                candle = min(
+                    next_active_candle(signal_candles, candle, dormant.values()),
+                    max(candle, snapshot_candle),
+                )
+                if candle > num_candles:
+                    break
+                self.progress.set_new_value(candle - 1)
+
+            if candle == snapshot_candle:
+                # Trades must be up to date, so the snapshot doesn't depend on the pre-scan.
+                self._wake_dormant_trades(dormant, data, candle, wake_all=True)
+                self._state_snapshot = self._get_backtest_state(
+                    start_date + self.timeframe_td * candle
+                )
+            self._wake_dormant_trades(dormant, data, candle)
+
+            current_time = start_date + self.timeframe_td * candle
+            strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)(
+                current_time=current_time
+            )
+            candle_pairs = [
+                pairs[idx] for idx in signal_pairs_at(signal_candles, signal_pairs, candle)
+            ]
+            if candle_pairs or len(dormant) < len(LocalTrade.bt_trades_open):
+                visited: list[str] = []
+                for item in self._candle_pair_generator(
+                    current_time, end_date, candle_pairs, get_row
+                ):
+                    visited.append(item[1])
+                    yield item
+                if use_exit_prescan:
+                    dormant.update(self._exit_prescan(visited, data, candle, num_candles))
+            self.progress.increment()
+            candle += 1
+
+        self._wake_dormant_trades(dormant, data, num_candles + 1, wake_all=True)
+
+        self.progress.set_new_value(num_candles)
+        self._set_columnar_max_index(pairs, data, num_candles)
+
+    def _set_columnar_max_index(
+        self, pairs: list[str], data: dict[str, ColumnarPairData], num_candles: int
+    ) -> None:
+        """
+        Leave the dataprovider in the same state as the list based loop.
+        """
+        for pair in pairs:
+            if processed_rows := data[pair].rows_until(num_candles):
+                self.dataprovider._set_dataframe_max_index(
+                    pair, self.required_startup + processed_rows
+                )
+
+    def _exit_prescan_available(self) -> bool:
+        """
+        The exit pre-scan is only exact if exits depend solely on candle data -
+        so no callbacks influencing exits, no detail data and no futures funding / liquidation.
+        """
+        return (
+            self.trading_mode == TradingMode.SPOT
+            and not self.timeframe_detail
+            and not self._position_stacking
+            and not self.strategy.position_adjustment_enable
+            and not self.strategy.use_custom_stoploss
+            and not any(
+                strategy_overrides(self.strategy, callback)
+                for callback in (
+                    "custom_stoploss",
+                    "custom_exit",
+                    "custom_exit_price",
+                    "adjust_trade_position",
+                )
+            )
+        )
+
+    def _exit_prescan(
+        self, pairs: list[str], data: dict[str, ColumnarPairData], candle: int, num_candles: int
+    ) -> dict[str, tuple[int, int]]:
+        """
+        Determine which of the given pairs' open trades can't exit in the next candle(s).
+        :return: dict of {pair: (dormant_from, wake)} for trades which can skip candles
+        """
+        dormant = {}
+        for pair in pairs:
+            wake = self._exit_prescan_pair(pair, data[pair], candle, num_candles)
+            if wake > candle + 1:
+                dormant[pair] = (candle + 1, wake)
+        return dormant
+
+    def _exit_prescan_pair(
+        self, pair: str, pair_data: ColumnarPairData, candle: int, num_candles: int
+    ) -> int:
+        """
+        Find the first candle after the current candle where the open trade of this pair
+        could exit or adjust its stoploss.
+        :return: candle to wake up the trade at (num_candles + 1 if the trade never exits)
+        """
+        open_trades = LocalTrade.bt_trades_open_pp[pair]
+        if len(open_trades) != 1:
+            return candle + 1
+        trade = open_trades[0]
+        if trade.has_open_orders or not trade.has_open_position or trade.is_short:
+            return candle + 1
+
+        roi_thresholds = [
+            (minutes, roi_to_rate_threshold(trade, roi))
+            for minutes, roi in sorted(self.strategy.minimal_roi.items())
+        ]
+        trailing_threshold = None
+        if self.strategy.trailing_stop:
+            trailing_threshold = trailing_to_rate_threshold(
+                trade, self.strategy.stoploss, self.strategy.trailing_stop_positive
+            )
+        wake_row = find_exit_candidate(
+            pair_data,
+            pair_data.rows_until(candle),
+            open_date_ns=Timestamp(trade.open_date_utc).value,
+            stop_loss=trade.stop_loss,
+            roi_thresholds=roi_thresholds,
+            trailing_threshold=trailing_threshold,
+            use_exit_signal=self.strategy.use_exit_signal,
+        )
+        if wake_row >= len(pair_data):
+            return num_candles + 1
+        return int(pair_data.candle_idx[wake_row])
+
+    def _wake_dormant_trades(
+        self,
+        dormant: dict[str, tuple[int, int]],
+        data: dict[str, ColumnarPairData],
+        candle: int,
+        wake_all: bool = False,
+    ) -> None:
+        """
+        Wake up dormant trades due at this candle (or all trades, if wake_all is set),
+        applying the candles skipped while the trade was dormant (max_rate / min_rate).
+        """
+        for pair in [p for p, (_, wake) in dormant.items() if wake_all or wake <= candle]:
+            dormant_from, wake = dormant.pop(pair)
+            pair_data = data[pair]
+            start = pair_data.rows_until(dormant_from - 1)
+            end = pair_data.rows_until(min(wake, candle) - 1)
+            if end > start:
+                high = float(pair_data.values[start:end, 1].max())
+                low = float(pair_data.values[start:end, 2].min())
+                for trade in LocalTrade.bt_trades_open_pp[pair]:
+                    trade.adjust_min_max_rates(high, low)
+
+    def _candle_pair_generator(
+        self,
+        current_time: datetime,
+        end_date: datetime,
+        pairs: list[str],
+        get_row: Callable[[str, datetime], tuple | None],
+    ):
+        """
+        Pair generator for one main candle, spreading into detail candles if necessary.
+        :param get_row: Callable returning the main candle row for a pair (or None)
+        :returns: generator of (current_time, pair, row, is_last_row, trade_dir)
+        """
+        pair_detail_cache: dict[str, list[tuple]] = {}
+        pair_tradedir_cache: dict[str, LongShort | None] = {}
+        pairs_with_open_trades = [t.pair for t in LocalTrade.bt_trades_open]
+
+        for current_time_det, is_first, has_detail, idx, pair in self._time_pair_generator_det(
+            current_time, pairs
+        ):
+            # Loop for each detail candle (if necessary) and pair
+            # Yields only the main date if no detail timeframe is set.
+
+            # Pairs that have open trades should be processed first
+            trade_dir: LongShort | None = None
+            if is_first:
+                # Main candle
+                row = get_row(pair, current_time)
+                if not row:
                     continue
-                if pair_has_open_trades and pair not in pairs_with_open_trades:
-                    # auto-lock for pairs that have open trades
-                    # Necessary for detail - to capture trades that open and close within
-                    # the same main candle
-                    pairs_with_open_trades.append(pair)
 
-                if (
-                    is_first
-                    and (trade_dir is not None or pair_has_open_trades)
-                    and has_detail
-                    and pair not in pair_detail_cache
-                    and pair in self.detail_data
-                    and row
+                trade_dir = self.check_for_trade_entry(row)
+                pair_tradedir_cache[pair] = trade_dir
+
+            else:
+                # Detail candle - from cache.
+                detail_data = pair_detail_cache.get(pair)
+                if detail_data is None or len(detail_data) <= idx:
+                    # logger.info(f"skipping {pair}, {current_time_det}, {trade_dir}")
+                    continue
+                row = detail_data[idx]
+                trade_dir = pair_tradedir_cache.get(pair)
+
+                if self.strategy.ignore_expired_candle(
+                    current_time - self.timeframe_td,  # last closed candle is 1 timeframe away.
+                    current_time_det,
+                    self.timeframe_secs,
+                    trade_dir is not None,
                 ):
-                    # Spread candle into detail timeframe and cache that -
-                    # only once per main candle
-                    # and only if we can expect activity.
-                    pair_detail = self.get_detail_data(pair, row)
-                    if pair_detail is not None:
-                        pair_detail_cache[pair] = pair_detail
-                    row = pair_detail_cache[pair][idx]
+                    # Ignore late entries eventually
+                    trade_dir = None
 
-                is_last_row = current_time_det == end_date
+            self.dataprovider._set_dataframe_max_date(current_time_det)
 
-                yield current_time_det, pair, row, is_last_row, trade_dir
-            self.progress.increment()
+            pair_has_open_trades = len(LocalTrade.bt_trades_open_pp[pair]) > 0
+            if pair in pairs_with_open_trades and not pair_has_open_trades:
+                # Pair has had open trades which closed in the current main candle.
+                # Skip this pair for this timeframe
+                continue
+            if pair_has_open_trades and pair not in pairs_with_open_trades:
+                # auto-lock for pairs that have open trades
+                # Necessary for detail - to capture trades that open and close within
+                # the same main candle
+                pairs_with_open_trades.append(pair)
+
+            if (
+                is_first
+                and (trade_dir is not None or pair_has_open_trades)
+                and has_detail
+                and pair not in pair_detail_cache
+                and pair in self.detail_data
+                and row
+            ):
+                # Spread candle into detail timeframe and cache that -
+                # only once per main candle
+                # and only if we can expect activity.
+                pair_detail = self.get_detail_data(pair, row)
+                if pair_detail is not None:
+                    pair_detail_cache[pair] = pair_detail
+                row = pair_detail_cache[pair][idx]
+
+            is_last_row = current_time_det == end_date
+
+            yield current_time_det, pair, row, is_last_row, trade_dir
 
     def backtest(
-        self, processed: dict, start_date: datetime, end_date: datetime
+        self,
+        processed: dict,
+        start_date: datetime,
+        end_date: datetime,
+        resume_state: dict[str, Any] | None = None,
+        snapshot_date: datetime | None = None,
     ) -> BacktestContentTypeIcomplete:
         """
         Implement backtesting functionality
@@ -1629,14 +1986,27 @@ class Backtesting:
         optimize memory usage!
         :param start_date: backtesting timerange start datetime
         :param end_date: backtesting timerange end datetime
+        :param resume_state: State snapshot of a previous backtest to continue from
+        :param snapshot_date: Take a state snapshot before processing this candle
         :return: DataFrame with trades (results of backtesting)
         """
         self.prepare_backtest(self.enable_protections)
+        self._state_snapshot = None
+        resume_date = None
+        if resume_state:
+            self._restore_backtest_state(resume_state)
+            resume_date = resume_state["date"]
         # Ensure wallets are up-to-date (important for --strategy-list)
         self.wallets.update()
-        # Use dict of lists with data for performance
-        # (looping lists is a lot faster than pandas DataFrames)
-        data: dict = self._get_ohlcv_as_lists(processed)
+        if self.backtest_engine == "columnar":
+            # Contiguous numpy arrays, only candles with activity are visited.
+            data: dict = self._get_ohlcv_as_arrays(processed, start_date)
+            generator = self.time_pair_generator_columnar
+        else:
+            # Use dict of lists with data for performance
+            # (looping lists is a lot faster than pandas DataFrames)
+            data = self._get_ohlcv_as_lists(processed)
+            generator = self.time_pair_generator
 
         # Loop timerange and get candle for each pair at that point in time
         for (
@@ -1645,7 +2015,7 @@ class Backtesting:
             row,
             is_last_row,
             trade_dir,
-        ) in self.time_pair_generator(start_date, end_date, list(data.keys()), data):
+        ) in generator(start_date, end_date, list(data.keys()), data, resume_date, snapshot_date):
             if not self._can_short or trade_dir is None:
                 # No need to reverse position if shorting is disabled or there's no new signal
                 self.backtest_loop(row, pair, current_time, trade_dir, not is_last_row)
@@ -1703,12 +2073,30 @@ class Backtesting:
             f"up to {max_date.strftime(DATETIME_PRINT_FORMAT)} "
             f"({(max_date - min_date).days} days)."
         )
+        resume_state = None
+        use_state_cache = self._use_state_cache()
+        if use_state_cache:
+            cache_key = get_strategy_run_id(strat, ignore_timerange=True)
+            resume_state = load_backtest_state(
+                self._state_cache_dir, cache_key, min_date, max_date, data
+            )
+            if resume_state:
+                logger.info(
+                    "Continuing cached backtest from "
+                    f"{resume_state['date'].strftime(DATETIME_PRINT_FORMAT)}."
+                )
         # Execute backtest and store results
         results = self.backtest(
             processed=preprocessed,
             start_date=min_date,
             end_date=max_date,
+            resume_state=resume_state,
+            snapshot_date=max_date if use_state_cache else None,
         )
+        if use_state_cache and self._state_snapshot:
+            store_backtest_state(
+                self._state_cache_dir, cache_key, min_date, data, self._state_snapshot
+            )
         backtest_end_time = dt_now()
         results.update(
             {
@@ -1733,6 +2121,71 @@ class Backtesting:
 
         return min_date, max_date
 
+    @property
+    def _state_cache_dir(self) -> Path:
+        return self.config["user_data_dir"] / "backtest_results" / "state_cache"
+
+    def _use_state_cache(self) -> bool:
+        """
+        Incremental backtests can't be combined with FreqAI (models depend on the timerange)
+        or with signal export (rejected signals are not part of the cached state).
+        """
+        return (
+            self.incremental_cache
+            and not self.config.get("freqai", {}).get("enabled", False)
+            and self.config.get("export", "none") != "signals"
+        )
+
+    def _get_strategy_jobs(self, strategy_count: int) -> int:
+        """
+        Number of worker processes to use for backtesting strategy_count strategies.
+        """
+        if strategy_count < 2 or self.config.get("freqai", {}).get("enabled", False):
+            return 1
+        n_jobs = effective_n_jobs(self.config.get("backtest_strategy_jobs", 1))
+        return min(n_jobs, strategy_count)
+
+    def backtest_strategies_parallel(
+        self,
+        strategies: list[IStrategy],
+        data: dict[str, DataFrame],
+        timerange: TimeRange,
+        n_jobs: int,
+    ) -> tuple[datetime, datetime]:
+        """
+        Backtest strategies in n_jobs worker processes.
+        Candle data is stored once and memory-mapped by all workers.
+        Results are collected in strategy order, matching a sequential run.
+        """
+        logger.info(f"Backtesting {len(strategies)} strategies using {n_jobs} worker processes.")
+        for strat in strategies:
+            register_strategy_modules(strat.__class__.__bases__)
+        strategy_indexes = [self.strategylist.index(strat) for strat in strategies]
+
+        detail_data = self.detail_data
+        with TemporaryDirectory(prefix="freqtrade_backtest_") as tmp_dir:
+            data_dir = Path(tmp_dir) / "data"
+            SharedDataStore(data_dir).dump(data)
+            detail_dir = None
+            if detail_data:
+                detail_dir = Path(tmp_dir) / "detail_data"
+                SharedDataStore(detail_dir).dump(detail_data)
+            # Workers load detail data from the store instead.
+            self.detail_data = {}
+            self._detail_index = {}
+            try:
+                with get_worker_pool(self, n_jobs, data_dir, detail_dir) as pool:
+                    results = list(pool.map(run_strategy, strategy_indexes, repeat(timerange)))
+            finally:
+                self.detail_data = detail_data
+
+        for result in results:
+            strategy_name = result["strategy_name"]
+            self.all_bt_content[strategy_name] = result["content"]
+            for key, value in result["analysis"].items():
+                self.analysis_results[key][strategy_name] = value
+        return results[-1]["min_date"], results[-1]["max_date"]
+
     def _get_min_cached_backtest_date(self):
         min_backtest_date = None
         backtest_cache_age = self.config.get("backtest_cache", constants.BACKTEST_CACHE_DEFAULT)
@@ -1772,12 +2225,22 @@ class Backtesting:
 
         self.load_prior_backtest()
 
+        strategies: list[IStrategy] = []
         for strat in self.strategylist:
             if self.results and strat.get_strategy_name() in self.results["strategy"]:
                 # When previous result hash matches - reuse that result and skip backtesting.
                 logger.info(f"Reusing result of previous backtest for {strat.get_strategy_name()}")
                 continue
-            min_date, max_date = self.backtest_one_strategy(strat, data, timerange)
+            strategies.append(strat)
+
+        n_jobs = self._get_strategy_jobs(len(strategies))
+        if n_jobs > 1:
+            min_date, max_date = self.backtest_strategies_parallel(
+                strategies, data, timerange, n_jobs
+            )
+        else:
+            for strat in strategies:
+                min_date, max_date = self.backtest_one_strategy(strat, data, timerange)
 
         # Update old results with new ones.
         if len(self.all_bt_content) > 0:
@@ -6,6 +6,9 @@ This module contains the hyperopt logic
 
 import logging
 import random
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from contextlib import contextmanager
 from datetime import datetime
 from math import ceil
 from multiprocessing import Manager
@@ -13,7 +16,7 @@ from pathlib import Path
 from typing import Any
 
 import rapidjson
-from joblib import Parallel, cpu_count, delayed, wrap_non_picklable_objects
+from joblib import Parallel, cpu_count, delayed, effective_n_jobs, wrap_non_picklable_objects
 
 from freqtrade.constants import FTHYPT_FILEVERSION, LAST_BT_RESULT_FN, Config
 from freqtrade.enums import HyperoptState
@@ -22,11 +25,13 @@ from freqtrade.misc import file_dump_json, plural
 from freqtrade.optimize.hyperopt.hyperopt_logger import logging_mp_handle, logging_mp_setup
 from freqtrade.optimize.hyperopt.hyperopt_optimizer import HyperOptimizer
 from freqtrade.optimize.hyperopt.hyperopt_output import HyperoptOutput
+from freqtrade.optimize.hyperopt.hyperopt_worker import get_worker_pool, run_epoch
 from freqtrade.optimize.hyperopt_tools import (
     HyperoptStateContainer,
     HyperoptTools,
     hyperopt_serializer,
 )
+from freqtrade.optimize.shared_data_store import SharedDataStore
 from freqtrade.util import get_progress_tracker
 
 
@@ -57,6 +62,8 @@ class Hyperopt:
         self.config = config
 
         self.analyze_per_epoch = self.config.get("analyze_per_epoch", False)
+        self.persistent_workers = self.config.get("hyperopt_persistent_workers", False)
+        self.async_scheduler = self.config.get("hyperopt_async_scheduler", False)
         HyperoptStateContainer.set_state(HyperoptState.STARTUP)
 
         if self.config.get("hyperopt"):
@@ -72,8 +79,8 @@ class Hyperopt:
             / "hyperopt_results"
             / f"strategy_{strategy}_{time_now}.fthypt"
         )
-        self.data_pickle_file = (
-            self.config["user_data_dir"] / "hyperopt_results" / "hyperopt_tickerdata.pkl"
+        self.data_store = SharedDataStore(
+            self.config["user_data_dir"] / "hyperopt_results" / "hyperopt_tickerdata"
         )
         self.total_epochs = config.get("epochs", 0)
 
@@ -100,13 +107,13 @@ class Hyperopt:
 
     def clean_hyperopt(self) -> None:
         """
-        Remove hyperopt pickle files to restart hyperopt.
+        Remove hyperopt data and result files to restart hyperopt.
         """
-        for f in [self.data_pickle_file, self.results_file]:
-            p = Path(f)
-            if p.is_file():
-                logger.info(f"Removing `{p}`.")
-                p.unlink()
+        self.data_store.clean()
+        p = Path(self.results_file)
+        if p.is_file():
+            logger.info(f"Removing `{p}`.")
+            p.unlink()
 
     def _save_result(self, epoch: dict) -> None:
         """
@@ -162,12 +169,107 @@ class Hyperopt:
 
         return parallel(delayed(wrap_non_picklable_objects(optimizer_wrapper))(v) for v in asked)
 
+    @contextmanager
+    def _start_workers(
+        self, config_jobs: int
+    ) -> Iterator[tuple[int, Callable[[list[list]], list[dict[str, Any]]]]]:
+        """
+        Start the hyperopt worker processes.
+        With persistent workers, every worker process receives the hyperopter once,
+        otherwise it's sent to the workers with every epoch.
+        :return: Tuple of (number of workers, function evaluating a list of points)
+        """
+        if self.persistent_workers:
+            jobs = effective_n_jobs(config_jobs)
+            verbosity = logging.INFO if self.config["verbosity"] < 1 else logging.DEBUG
+            with get_worker_pool(self.hyperopter, jobs, log_queue, verbosity) as pool:
+                yield jobs, lambda asked: list(pool.map(run_epoch, asked))
+        else:
+            with Parallel(n_jobs=config_jobs) as parallel:
+                yield (
+                    parallel._effective_n_jobs(),
+                    lambda asked: self.run_optimizer_parallel(parallel, asked),
+                )
+
+    def run_epochs_batched(self, config_jobs: int, start: int, advance: Callable[[], Any]) -> None:
+        """
+        Run the remaining epochs in batches of one epoch per worker.
+        :param start: Number of epochs already evaluated
+        :param advance: Callback advancing the progress bar by one epoch
+        """
+        with self._start_workers(config_jobs) as (jobs, run_epochs):
+            logger.info(f"Effective number of parallel workers used: {jobs}")
+
+            evals = ceil((self.total_epochs - start) / jobs)
+            for i in range(evals):
+                # Correct the number of epochs to be processed for the last
+                # iteration (should not exceed self.total_epochs in total)
+                n_rest = (i + 1) * jobs - (self.total_epochs - start)
+                current_jobs = jobs - n_rest if n_rest > 0 else jobs
+
+                asked, is_random = self.get_asked_points(n_points=current_jobs)
+                f_val = run_epochs(asked)
+                self.opt.tell(asked, [v["loss"] for v in f_val])
+
+                for j, val in enumerate(f_val):
+                    # Use human-friendly indexes here (starting from 1)
+                    current = i * jobs + j + 1 + start
+
+                    self.evaluate_result(val, current, is_random[j])
+                    advance()
+                logging_mp_handle(log_queue)
+
+    def run_epochs_async(self, config_jobs: int, start: int, advance: Callable[[], Any]) -> None:
+        """
+        Run the remaining epochs without waiting for a full batch to complete.
+        Every finished epoch is told to the optimizer right away, and a new point is asked
+        for the idle worker.
+        Results are evaluated (printed and saved) in the order the epochs were started.
+        :param start: Number of epochs already evaluated
+        :param advance: Callback advancing the progress bar by one epoch
+        """
+        jobs = effective_n_jobs(config_jobs)
+        logger.info(f"Effective number of parallel workers used: {jobs}")
+        verbosity = logging.INFO if self.config["verbosity"] < 1 else logging.DEBUG
+
+        # {future: (epoch, point, is_random)}
+        pending: dict[Future, tuple[int, list[Any], bool]] = {}
+        # Finished epochs which can't be evaluated yet, as earlier epochs are still running
+        finished: dict[int, tuple[dict[str, Any], bool]] = {}
+        submitted = start
+        next_epoch = start + 1
+        with get_worker_pool(self.hyperopter, jobs, log_queue, verbosity) as pool:
+            while next_epoch <= self.total_epochs:
+                while len(pending) < jobs and submitted < self.total_epochs:
+                    submitted += 1
+                    asked, is_random = self.get_asked_points(
+                        n_points=1, pending=[point for _, point, _ in pending.values()]
+                    )
+                    pending[pool.submit(run_epoch, asked[0])] = (submitted, asked[0], is_random[0])
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    epoch, point, is_random = pending.pop(future)
+                    val = future.result()
+                    self.opt.tell([point], [val["loss"]])
+                    finished[epoch] = (val, is_random)
+
+                while next_epoch in finished:
+                    val, is_random = finished.pop(next_epoch)
+                    self.evaluate_result(val, next_epoch, is_random)
+                    advance()
+                    next_epoch += 1
+                logging_mp_handle(log_queue)
+
     def _set_random_state(self, random_state: int | None) -> int:
         return random_state or random.randint(1, 2**16 - 1)  # noqa: S311
 
-    def get_asked_points(self, n_points: int) -> tuple[list[list[Any]], list[bool]]:
+    def get_asked_points(
+        self, n_points: int, pending: list[list[Any]] | None = None
+    ) -> tuple[list[list[Any]], list[bool]]:
         """
         Enforce points returned from `self.opt.ask` have not been already evaluated
+        (or are currently being evaluated, if `pending` is given)
 
         Steps:
         1. Try to get points using `self.opt.ask` first
@@ -185,6 +287,7 @@ class Hyperopt:
                     new_list.append(item)
             return new_list
 
+        tried = self.opt.Xi + pending if pending else self.opt.Xi
         i = 0
         asked_non_tried: list[list[Any]] = []
         is_random_non_tried: list[bool] = []
@@ -199,11 +302,9 @@ class Hyperopt:
             is_random_non_tried += [
                 rand
                 for x, rand in zip(asked, is_random, strict=False)
-                if x not in self.opt.Xi and x not in asked_non_tried
-            ]
-            asked_non_tried += [
-                x for x in asked if x not in self.opt.Xi and x not in asked_non_tried
+                if x not in tried and x not in asked_non_tried
             ]
+            asked_non_tried += [x for x in asked if x not in tried and x not in asked_non_tried]
             i += 1
 
         if asked_non_tried:
@@ -263,44 +364,28 @@ class Hyperopt:
         )
         self._setup_logging_mp_workaround()
         try:
-            with Parallel(n_jobs=config_jobs) as parallel:
-                jobs = parallel._effective_n_jobs()
-                logger.info(f"Effective number of parallel workers used: {jobs}")
-
-                # Define progressbar
-                with get_progress_tracker(cust_callables=[self._hyper_out]) as pbar:
-                    task = pbar.add_task("Epochs", total=self.total_epochs)
-
-                    start = 0
-
-                    if self.analyze_per_epoch:
-                        # First analysis not in parallel mode when using --analyze-per-epoch.
-                        # This allows dataprovider to load it's informative cache.
-                        asked, is_random = self.get_asked_points(n_points=1)
-                        f_val0 = self.hyperopter.generate_optimizer(asked[0])
-                        self.opt.tell(asked, [f_val0["loss"]])
-                        self.evaluate_result(f_val0, 1, is_random[0])
-                        pbar.update(task, advance=1)
-                        start += 1
-
-                    evals = ceil((self.total_epochs - start) / jobs)
-                    for i in range(evals):
-                        # Correct the number of epochs to be processed for the last
-                        # iteration (should not exceed self.total_epochs in total)
-                        n_rest = (i + 1) * jobs - (self.total_epochs - start)
-                        current_jobs = jobs - n_rest if n_rest > 0 else jobs
-
-                        asked, is_random = self.get_asked_points(n_points=current_jobs)
-                        f_val = self.run_optimizer_parallel(parallel, asked)
-                        self.opt.tell(asked, [v["loss"] for v in f_val])
-
-                        for j, val in enumerate(f_val):
-                            # Use human-friendly indexes here (starting from 1)
-                            current = i * jobs + j + 1 + start
-
-                            self.evaluate_result(val, current, is_random[j])
-                            pbar.update(task, advance=1)
-                        logging_mp_handle(log_queue)
+            # Define progressbar
+            with get_progress_tracker(cust_callables=[self._hyper_out]) as pbar:
+                task = pbar.add_task("Epochs", total=self.total_epochs)
+
+                start = 0
+
+                if self.analyze_per_epoch:
+                    # First analysis not in parallel mode when using --analyze-per-epoch.
+                    # This allows dataprovider to load it's informative cache.
+                    asked, is_random = self.get_asked_points(n_points=1)
+                    f_val0 = self.hyperopter.generate_optimizer(asked[0])
+                    self.opt.tell(asked, [f_val0["loss"]])
+                    self.evaluate_result(f_val0, 1, is_random[0])
+                    pbar.update(task, advance=1)
+                    start += 1
+
+                if self.async_scheduler:
+                    self.run_epochs_async(config_jobs, start, lambda: pbar.update(task, advance=1))
+                else:
+                    self.run_epochs_batched(
+                        config_jobs, start, lambda: pbar.update(task, advance=1)
+                    )
 
         except KeyboardInterrupt:
             print("User interrupted..")
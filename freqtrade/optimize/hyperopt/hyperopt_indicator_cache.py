@@ -0,0 +1,103 @@
+"""
+Indicator cache for hyperopt with --analyze-per-epoch.
+"""
+
+import logging
+from collections import OrderedDict
+from typing import Any
+from uuid import uuid4
+
+from pandas import DataFrame
+
+from freqtrade.strategy.interface import IStrategy
+from freqtrade.strategy.parameters import record_parameter_reads
+
+
+logger = logging.getLogger(__name__)
+
+
+class _CacheState:
+    def __init__(self) -> None:
+        # {(pair, ((parameter, value), ...)): dataframe} - least recently used first
+        self.entries: OrderedDict[tuple, DataFrame] = OrderedDict()
+        self.sizes: dict[tuple, int] = {}
+        self.total_size = 0
+        # Parameter names read by populate_indicators, per pair
+        self.read_sets: dict[str, set[tuple[str, ...]]] = {}
+
+
+# Cache content of this process, per cache instance.
+# Kept outside of IndicatorCache so the content isn't sent to the hyperopt workers.
+_cache_states: dict[str, _CacheState] = {}
+
+
+class IndicatorCache:
+    """
+    LRU cache for the results of populate_indicators, keyed on the pair and the values of all
+    hyperoptable parameters populate_indicators read for that pair.
+    Assumes populate_indicators only depends on the candle data and these parameters.
+    """
+
+    def __init__(self, max_size_mb: int) -> None:
+        self._id = uuid4().hex
+        self.max_size = max_size_mb * 1024 * 1024
+
+    @property
+    def _state(self) -> _CacheState:
+        if self._id not in _cache_states:
+            _cache_states[self._id] = _CacheState()
+        return _cache_states[self._id]
+
+    def advise_all_indicators(
+        self, strategy: IStrategy, data: dict[str, DataFrame]
+    ) -> dict[str, DataFrame]:
+        """
+        Cached equivalent of strategy.advise_all_indicators().
+        """
+        parameters = dict(strategy.enumerate_parameters())
+        result = {}
+        hits = 0
+        for pair, pair_data in data.items():
+            cached = self._lookup(pair, parameters)
+            if cached is not None:
+                result[pair] = cached.copy()
+                hits += 1
+                continue
+            with record_parameter_reads() as reads:
+                df = strategy.advise_indicators(pair_data.copy(), {"pair": pair}).copy()
+            read_names = tuple(sorted(name for name, p in parameters.items() if p in reads))
+            self._store(pair, read_names, parameters, df)
+            result[pair] = df.copy()
+        logger.debug(f"Indicator cache: {hits} of {len(data)} pairs reused.")
+        return result
+
+    @staticmethod
+    def _key(pair: str, read_names: tuple[str, ...], parameters: dict[str, Any]) -> tuple:
+        return (pair, tuple((name, parameters[name].value) for name in read_names))
+
+    def _lookup(self, pair: str, parameters: dict[str, Any]) -> DataFrame | None:
+        state = self._state
+        for read_names in state.read_sets.get(pair, ()):
+            key = self._key(pair, read_names, parameters)
+            if key in state.entries:
+                state.entries.move_to_end(key)
+                return state.entries[key]
+        return None
+
+    def _store(
+        self, pair: str, read_names: tuple[str, ...], parameters: dict[str, Any], df: DataFrame
+    ) -> None:
+        state = self._state
+        size = int(df.memory_usage(index=True, deep=False).sum())
+        if size > self.max_size:
+            return
+        key = self._key(pair, read_names, parameters)
+        state.read_sets.setdefault(pair, set()).add(read_names)
+        if key in state.entries:
+            state.total_size -= state.sizes[key]
+        state.entries[key] = df
+        state.sizes[key] = size
+        state.total_size += size
+        while state.total_size > self.max_size:
+            old_key, _ = state.entries.popitem(last=False)
+            state.total_size -= state.sizes.pop(old_key)
@@ -9,7 +9,6 @@ import warnings
 from datetime import datetime, timezone
 from typing import Any
 
-from joblib import dump, load
 from joblib.externals import cloudpickle
 from pandas import DataFrame
 
@@ -25,9 +24,11 @@ from freqtrade.optimize.backtesting import Backtesting
 
 # Import IHyperOptLoss to allow unpickling classes from these modules
 from freqtrade.optimize.hyperopt.hyperopt_auto import HyperOptAuto
+from freqtrade.optimize.hyperopt.hyperopt_indicator_cache import IndicatorCache
 from freqtrade.optimize.hyperopt_loss.hyperopt_loss_interface import IHyperOptLoss
 from freqtrade.optimize.hyperopt_tools import HyperoptStateContainer, HyperoptTools
 from freqtrade.optimize.optimize_reports import generate_strategy_stats
+from freqtrade.optimize.shared_data_store import SharedDataStore
 from freqtrade.resolvers.hyperopt_resolver import HyperOptLossResolver
 from freqtrade.util.dry_run_wallet import get_dry_run_wallet
 
@@ -68,6 +69,9 @@ class HyperOptimizer:
         self.pairlist = self.backtesting.pairlists.whitelist
         self.custom_hyperopt: HyperOptAuto
         self.analyze_per_epoch = self.config.get("analyze_per_epoch", False)
+        self.indicator_cache: IndicatorCache | None = None
+        if self.analyze_per_epoch and self.config.get("hyperopt_indicator_cache_size"):
+            self.indicator_cache = IndicatorCache(self.config["hyperopt_indicator_cache_size"])
 
         if not self.config.get("hyperopt"):
             self.custom_hyperopt = HyperOptAuto(self.config)
@@ -86,8 +90,8 @@ class HyperOptimizer:
         )
         self.calculate_loss = self.custom_hyperoptloss.hyperopt_loss_function
 
-        self.data_pickle_file = (
-            self.config["user_data_dir"] / "hyperopt_results" / "hyperopt_tickerdata.pkl"
+        self.data_store = SharedDataStore(
+            self.config["user_data_dir"] / "hyperopt_results" / "hyperopt_tickerdata"
         )
 
         self.market_change = 0.0
@@ -302,11 +306,10 @@ class HyperOptimizer:
 
             self.backtesting.strategy.max_open_trades = updated_max_open_trades
 
-        with self.data_pickle_file.open("rb") as f:
-            processed = load(f, mmap_mode="r")
-            if self.analyze_per_epoch:
-                # Data is not yet analyzed, rerun populate_indicators.
-                processed = self.advise_and_trim(processed)
+        processed = self.data_store.load()
+        if self.analyze_per_epoch:
+            # Data is not yet analyzed, rerun populate_indicators.
+            processed = self.advise_and_trim(processed)
 
         bt_results = self.backtesting.backtest(
             processed=processed, start_date=self.min_date, end_date=self.max_date
@@ -407,7 +410,12 @@ class HyperOptimizer:
         )
 
     def advise_and_trim(self, data: dict[str, DataFrame]) -> dict[str, DataFrame]:
-        preprocessed = self.backtesting.strategy.advise_all_indicators(data)
+        if self.indicator_cache:
+            preprocessed = self.indicator_cache.advise_all_indicators(
+                self.backtesting.strategy, data
+            )
+        else:
+            preprocessed = self.backtesting.strategy.advise_all_indicators(data)
 
         # Trim startup period from analyzed dataframe to get correct dates for output.
         # This is only used to keep track of min/max date after trimming.
@@ -438,6 +446,6 @@ class HyperOptimizer:
                 f"({(self.max_date - self.min_date).days} days).."
             )
             # Store non-trimmed data - will be trimmed after signal generation.
-            dump(preprocessed, self.data_pickle_file)
+            self.data_store.dump(preprocessed)
         else:
-            dump(data, self.data_pickle_file)
+            self.data_store.dump(data)
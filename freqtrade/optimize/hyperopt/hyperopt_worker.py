@@ -0,0 +1,51 @@
+"""
+Long-lived hyperopt worker processes.
+The HyperOptimizer is sent to every worker once, when the worker starts.
+Afterwards, only the parameters and the result of every epoch are exchanged.
+"""
+
+import logging
+from multiprocessing import Queue
+from typing import Any
+
+from joblib.externals.loky import ProcessPoolExecutor
+
+from freqtrade.optimize.hyperopt.hyperopt_logger import logging_mp_setup
+from freqtrade.optimize.hyperopt.hyperopt_optimizer import HyperOptimizer
+
+
+logger = logging.getLogger(__name__)
+
+# HyperOptimizer instance of this worker process
+_hyperopter: HyperOptimizer | None = None
+
+
+def init_worker(hyperopter: HyperOptimizer, log_queue: Queue, verbosity: int) -> None:
+    """
+    Initialize a worker process. Called once per worker, in the worker process.
+    """
+    global _hyperopter
+    logging_mp_setup(log_queue, verbosity)
+    _hyperopter = hyperopter
+
+
+def run_epoch(raw_params: list[Any]) -> dict[str, Any]:
+    """
+    Run one epoch in a worker process, using the worker's HyperOptimizer instance.
+    """
+    if _hyperopter is None:
+        raise RuntimeError("Hyperopt worker has not been initialized.")
+    return _hyperopter.generate_optimizer(raw_params)
+
+
+def get_worker_pool(
+    hyperopter: HyperOptimizer, n_jobs: int, log_queue: Queue, verbosity: int
+) -> ProcessPoolExecutor:
+    """
+    Start a pool of n_jobs worker processes, each holding its own copy of hyperopter.
+    """
+    return ProcessPoolExecutor(
+        max_workers=n_jobs,
+        initializer=init_worker,
+        initargs=(hyperopter, log_queue, verbosity),
+    )
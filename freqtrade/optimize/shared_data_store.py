@@ -0,0 +1,137 @@
+"""
+Candle data store shared between worker processes (hyperopt, parallel backtesting).
+"""
+
+import logging
+import shutil
+from pathlib import Path
+
+import rapidjson
+from joblib import dump, load
+from pandas import DataFrame
+
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover
+    # pyarrow is not available on all platforms (armv7l).
+    pa = None
+
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = "index.json"
+
+# Data already mapped in this process - {directory: (index mtime, {pair: dataframe or file})}
+_mapped_data: dict[Path, tuple[int, dict[str, DataFrame | Path]]] = {}
+
+
+class SharedDataStore:
+    """
+    Stores the (processed) candle data for all pairs as uncompressed Arrow IPC files.
+    Each worker process memory-maps the files once - numeric columns are then read-only,
+    zero-copy views into the page cache, which is shared between all workers.
+    Every load() returns new dataframe wrappers, so changes to the dataframes
+    don't leak into the next epoch.
+    Dataframes which can't be represented in Arrow are stored with joblib instead.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+
+    def exists(self) -> bool:
+        return (self.directory / INDEX_FILE).is_file()
+
+    def clean(self) -> None:
+        """
+        Remove the stored data.
+        """
+        if self.directory.is_dir():
+            logger.info(f"Removing `{self.directory}`.")
+            shutil.rmtree(self.directory)
+
+    def dump(self, data: dict[str, DataFrame]) -> None:
+        """
+        Store dataframes for all pairs, replacing previously stored data.
+        """
+        self.clean()
+        self.directory.mkdir(parents=True)
+        index: dict[str, dict[str, str]] = {}
+        for idx, (pair, df) in enumerate(data.items()):
+            filename = f"pair_{idx}"
+            table = _to_arrow(df) if pa else None
+            if table is not None:
+                filename += ".arrow"
+                with pa.OSFile(str(self.directory / filename), "wb") as sink:
+                    with pa.ipc.new_file(sink, table.schema) as writer:
+                        writer.write_table(table)
+            else:
+                filename += ".pkl"
+                dump(df, self.directory / filename)
+            index[pair] = {"file": filename}
+        # Written last - marks the store as complete.
+        with (self.directory / INDEX_FILE).open("w") as f:
+            rapidjson.dump(index, f)
+
+    def load(self) -> dict[str, DataFrame]:
+        """
+        Load the stored dataframes.
+        Files are mapped once per process, subsequent calls only create new dataframe wrappers.
+        """
+        index_file = self.directory / INDEX_FILE
+        mtime = index_file.stat().st_mtime_ns
+        cached = _mapped_data.get(self.directory)
+        if cached is None or cached[0] != mtime:
+            with index_file.open("r") as f:
+                index = rapidjson.load(f)
+            cached = (mtime, {pair: self._map_file(entry["file"]) for pair, entry in index.items()})
+            _mapped_data[self.directory] = cached
+
+        result = {}
+        for pair, df in cached[1].items():
+            if isinstance(df, Path):
+                with df.open("rb") as f:
+                    result[pair] = load(f, mmap_mode="r")
+            else:
+                result[pair] = _new_wrapper(df)
+        return result
+
+    def _map_file(self, filename: str) -> DataFrame | Path:
+        file = self.directory / filename
+        if file.suffix != ".arrow":
+            return file
+        source = pa.memory_map(str(file))
+        return pa.ipc.open_file(source).read_all().to_pandas(split_blocks=True)
+
+
+def _to_arrow(df: DataFrame) -> "pa.Table | None":
+    """
+    Convert a dataframe to an Arrow table, keeping NaN values as NaN (not as null)
+    so float columns can be mapped without copying.
+    :return: Arrow table, or None if the dataframe can't be converted.
+    """
+    try:
+        table = pa.Table.from_pandas(df)
+        for idx, field in enumerate(table.schema):
+            if pa.types.is_floating(field.type) and field.name in df.columns:
+                table = table.set_column(
+                    idx, field, pa.array(df[field.name].to_numpy(), type=field.type)
+                )
+        return table
+    except (pa.ArrowException, TypeError, ValueError) as e:
+        logger.debug(f"Can't store dataframe as Arrow ({e}), using joblib.")
+        return None
+
+
+def _new_wrapper(df: DataFrame) -> DataFrame:
+    """
+    New dataframe sharing the (read-only) column data with df.
+    Writable columns (objects, booleans) are copied, so in-place changes don't leak.
+    """
+    return DataFrame(
+        {
+            col: series.copy() if series.dtype in (object, bool) else series
+            for col, series in df.items()
+        },
+        copy=False,
+    )
@@ -65,6 +65,8 @@ def init_plotscript(config, markets: list, startup_candles: int = 0):
         startup_candles=startup_candles,
         data_format=config["dataformat_ohlcv"],
         candle_type=config.get("candle_type_def", CandleType.SPOT),
+        base_timeframe=config.get("ohlcv_base_timeframe"),
+        candle_offset=config.get("ohlcv_candle_offset"),
     )
 
     if startup_candles and data:
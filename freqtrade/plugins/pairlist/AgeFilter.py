@@ -112,7 +112,7 @@ class AgeFilter(IPairList):
             -(self._max_days_listed if self._max_days_listed else self._min_days_listed) - 1
         )
         since_ms = dt_ts(dt_floor_day(dt_now()) + timedelta(days=since_days))
-        candles = self._exchange.refresh_latest_ohlcv(needed_pairs, since_ms=since_ms, cache=False)
+        candles = self._exchange.refresh_ohlcv_with_cache(needed_pairs, since_ms)
         if self._enabled:
             for p in deepcopy(pairlist):
                 daily_candles = (
@@ -4,10 +4,11 @@ PairList Handler base class
 
 import logging
 from abc import ABC, abstractmethod
-from copy import deepcopy
 from enum import Enum
 from typing import Any, Literal, TypedDict
 
+from pandas import DataFrame, Series
+
 from freqtrade.constants import Config
 from freqtrade.exceptions import OperationalException
 from freqtrade.exchange import Exchange, market_is_active
@@ -166,6 +167,20 @@ class IPairList(LoggingMixin, ABC):
         """
         raise NotImplementedError()
 
+    def _validate_pairs(self, pairs: DataFrame, tickers: Tickers) -> Series | None:
+        """
+        Check all pairs at once against Pairlist Handler's specific conditions.
+        Vectorized alternative to _validate_pair() - used by the generic filter_pairlist()
+        if implemented.
+
+        :param pairs: Ticker table of the pairs to validate (see build_ticker_table()).
+            Pairs without ticker have NaN values.
+        :param tickers: Tickers (from exchange.get_tickers). May be cached.
+        :return: Boolean Series, True for pairs that can stay -
+            or None to validate pairs one by one using _validate_pair()
+        """
+        return None
+
     def gen_pairlist(self, tickers: Tickers) -> list[str]:
         """
         Generate the pairlist.
@@ -190,8 +205,8 @@ class IPairList(LoggingMixin, ABC):
         Filters and sorts pairlist and returns the whitelist again.
 
         Called on each bot iteration - please use internal caching if necessary
-        This generic implementation calls self._validate_pair() for each pair
-        in the pairlist.
+        This generic implementation calls self._validate_pairs() for all pairs,
+        or self._validate_pair() for each pair in the pairlist if that's not implemented.
 
         Some Pairlist Handlers override this generic implementation and employ
         own filtration.
@@ -201,11 +216,12 @@ class IPairList(LoggingMixin, ABC):
         :return: new whitelist
         """
         if self._enabled:
-            # Copy list since we're modifying this list
-            for p in deepcopy(pairlist):
-                # Filter out assets
-                if not self._validate_pair(p, tickers[p] if p in tickers else None):
-                    pairlist.remove(p)
+            table = self._pairlistmanager.ticker_table(tickers).reindex(pairlist)
+            valid = self._validate_pairs(table, tickers)
+            if valid is not None:
+                return [p for p, keep in zip(pairlist, valid, strict=True) if keep]
+            # Filter out assets
+            pairlist = [p for p in pairlist if self._validate_pair(p, tickers.get(p))]
 
         return pairlist
 
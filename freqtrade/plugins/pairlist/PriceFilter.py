@@ -4,8 +4,11 @@ Price pair list filter
 
 import logging
 
+from ccxt import TICK_SIZE
+from pandas import DataFrame, Series
+
 from freqtrade.exceptions import OperationalException
-from freqtrade.exchange.exchange_types import Ticker
+from freqtrade.exchange.exchange_types import Tickers
 from freqtrade.plugins.pairlist.IPairList import IPairList, PairlistParameter, SupportsBacktesting
 
 
@@ -100,76 +103,74 @@ class PriceFilter(IPairList):
             },
         }
 
-    def _validate_pair(self, pair: str, ticker: Ticker | None) -> bool:
+    def _validate_pairs(self, pairs: DataFrame, tickers: Tickers) -> Series:
         """
         Check if one price-step (pip) is > than a certain barrier.
-        :param pair: Pair that's currently validated
-        :param ticker: ticker dict as returned from ccxt.fetch_ticker
-        :return: True if the pair can stay, false if it should be removed
+        :param pairs: Ticker table of the pairs to validate
+        :param tickers: Tickers (from exchange.get_tickers). May be cached.
+        :return: Boolean Series, True for pairs that can stay
         """
-        if ticker and "last" in ticker and ticker["last"] is not None and ticker.get("last") != 0:
-            price: float = ticker["last"]
-        else:
+        price = pairs["last"]
+        valid = price.notna() & (price != 0)
+        for pair in pairs.index[~valid]:
             self.log_once(
                 f"Removed {pair} from whitelist, because "
                 "ticker['last'] is empty (Usually no trade in the last 24h).",
                 logger.info,
             )
-            return False
 
         # Perform low_price_ratio check.
         if self._low_price_ratio != 0:
-            compare = self._exchange.price_get_one_pip(pair, price)
+            if self._exchange.precisionMode == TICK_SIZE:
+                compare = pairs["price_precision"]
+            else:
+                compare = 1 / 10 ** pairs["price_precision"]
             changeperc = compare / price
-            if changeperc > self._low_price_ratio:
+            removed = valid & (changeperc > self._low_price_ratio)
+            for pair, value in changeperc[removed].items():
                 self.log_once(
-                    f"Removed {pair} from whitelist, because 1 unit is {changeperc:.3%}",
+                    f"Removed {pair} from whitelist, because 1 unit is {value:.3%}",
                     logger.info,
                 )
-                return False
+            valid &= ~removed
 
         # Perform low_amount check
         if self._max_value != 0:
-            market = self._exchange.markets[pair]
-            limits = market["limits"]
-            if limits["amount"]["min"] is not None:
-                min_amount = limits["amount"]["min"]
-                min_precision = market["precision"]["amount"]
-
-                min_value = min_amount * price
-                if self._exchange.precisionMode == 4:
-                    # tick size
-                    next_value = (min_amount + min_precision) * price
-                else:
-                    # Decimal places
-                    min_precision = pow(0.1, min_precision)
-                    next_value = (min_amount + min_precision) * price
-                diff = next_value - min_value
-
-                if diff > self._max_value:
-                    self.log_once(
-                        f"Removed {pair} from whitelist, "
-                        f"because min value change of {diff} > {self._max_value}.",
-                        logger.info,
-                    )
-                    return False
+            min_amount = pairs["amount_min"]
+            if self._exchange.precisionMode == TICK_SIZE:
+                # tick size
+                min_precision = pairs["amount_precision"]
+            else:
+                # Decimal places - using pow() to round like the exchange precision helpers
+                min_precision = pairs["amount_precision"].map(lambda p: pow(0.1, p))
+            diff = (min_amount + min_precision) * price - min_amount * price
+            removed = valid & (diff > self._max_value)
+            for pair, value in diff[removed].items():
+                self.log_once(
+                    f"Removed {pair} from whitelist, "
+                    f"because min value change of {value} > {self._max_value}.",
+                    logger.info,
+                )
+            valid &= ~removed
 
         # Perform min_price check.
         if self._min_price != 0:
-            if price < self._min_price:
+            removed = valid & (price < self._min_price)
+            for pair in pairs.index[removed]:
                 self.log_once(
                     f"Removed {pair} from whitelist, because last price < {self._min_price:.8f}",
                     logger.info,
                 )
-                return False
+            valid &= ~removed
 
         # Perform max_price check.
         if self._max_price != 0:
-            if price > self._max_price:
+            removed = valid & (price > self._max_price)
+            for pair in pairs.index[removed]:
                 self.log_once(
                     f"Removed {pair} from whitelist, because last price > {self._max_price:.8f}",
                     logger.info,
                 )
-                return False
+            valid &= ~removed
 
-        return True
+        return valid
@@ -4,8 +4,10 @@ Spread pair list filter
 
 import logging
 
+from pandas import DataFrame, Series
+
 from freqtrade.exceptions import OperationalException
-from freqtrade.exchange.exchange_types import Ticker
+from freqtrade.exchange.exchange_types import Tickers
 from freqtrade.plugins.pairlist.IPairList import IPairList, PairlistParameter, SupportsBacktesting
 
 
@@ -59,25 +61,27 @@ class SpreadFilter(IPairList):
             },
         }
 
-    def _validate_pair(self, pair: str, ticker: Ticker | None) -> bool:
+    def _validate_pairs(self, pairs: DataFrame, tickers: Tickers) -> Series:
         """
-        Validate spread for the ticker
-        :param pair: Pair that's currently validated
-        :param ticker: ticker dict as returned from ccxt.fetch_ticker
-        :return: True if the pair can stay, false if it should be removed
+        Validate spread for the tickers
+        :param pairs: Ticker table of the pairs to validate
+        :param tickers: Tickers (from exchange.get_tickers). May be cached.
+        :return: Boolean Series, True for pairs that can stay
         """
-        if ticker and "bid" in ticker and "ask" in ticker and ticker["ask"] and ticker["bid"]:
-            spread = 1 - ticker["bid"] / ticker["ask"]
-            if spread > self._max_spread_ratio:
-                self.log_once(
-                    f"Removed {pair} from whitelist, because spread "
-                    f"{spread:.3%} > {self._max_spread_ratio:.3%}",
-                    logger.info,
-                )
-                return False
-            else:
-                return True
-        self.log_once(
-            f"Removed {pair} from whitelist due to invalid ticker data: {ticker}", logger.info
-        )
-        return False
+        bid = pairs["bid"]
+        ask = pairs["ask"]
+        has_data = bid.notna() & (bid != 0) & ask.notna() & (ask != 0)
+        for pair in pairs.index[~has_data]:
+            self.log_once(
+                f"Removed {pair} from whitelist due to invalid ticker data: {tickers.get(pair)}",
+                logger.info,
+            )
+        spread = 1 - bid / ask
+        removed = has_data & (spread > self._max_spread_ratio)
+        for pair, value in spread[removed].items():
+            self.log_once(
+                f"Removed {pair} from whitelist, because spread "
+                f"{value:.3%} > {self._max_spread_ratio:.3%}",
+                logger.info,
+            )
+        return has_data & ~removed
@@ -1,6 +1,10 @@
 import re
+from typing import Any
+
+from pandas import DataFrame
 
 from freqtrade.constants import Config
+from freqtrade.exchange.exchange_types import Tickers
 
 
 def expand_pairlist(
@@ -47,3 +51,29 @@ def dynamic_expand_pairlist(config: Config, markets: list[str]) -> list[str]:
         expanded_pairs += [pair for pair in corr_pairlist if pair not in config["pairs"]]
 
     return expanded_pairs
+
+
+def build_ticker_table(tickers: Tickers, markets: dict[str, Any]) -> DataFrame:
+    """
+    Build a columnar snapshot of tickers and markets - one column per field, indexed by pair.
+    Allows Pairlist Handlers to validate all pairs at once (see IPairList._validate_pairs()).
+    Missing values are NaN.
+    :param tickers: Tickers (from exchange.get_tickers)
+    :param markets: Markets of the exchange
+    :return: DataFrame with the columns last, bid, ask, price_precision, amount_precision
+        and amount_min.
+    """
+    pairs = list(tickers)
+    pair_markets = [markets.get(pair, {}) for pair in pairs]
+    return DataFrame(
+        {
+            "last": [tickers[pair].get("last") for pair in pairs],
+            "bid": [tickers[pair].get("bid") for pair in pairs],
+            "ask": [tickers[pair].get("ask") for pair in pairs],
+            "price_precision": [m.get("precision", {}).get("price") for m in pair_markets],
+            "amount_precision": [m.get("precision", {}).get("amount") for m in pair_markets],
+            "amount_min": [m.get("limits", {}).get("amount", {}).get("min") for m in pair_markets],
+        },
+        index=pairs,
+        dtype="float64",
+    )
@@ -6,6 +6,7 @@ import logging
 from functools import partial
 
 from cachetools import TTLCache, cached
+from pandas import DataFrame
 
 from freqtrade.constants import Config, ListPairsWithTimeframes
 from freqtrade.data.dataprovider import DataProvider
@@ -15,7 +16,7 @@ from freqtrade.exceptions import OperationalException
 from freqtrade.exchange.exchange_types import Tickers
 from freqtrade.mixins import LoggingMixin
 from freqtrade.plugins.pairlist.IPairList import IPairList, SupportsBacktesting
-from freqtrade.plugins.pairlist.pairlist_helpers import expand_pairlist
+from freqtrade.plugins.pairlist.pairlist_helpers import build_ticker_table, expand_pairlist
 from freqtrade.resolvers import PairListResolver
 
 
@@ -30,6 +31,8 @@ class PairListManager(LoggingMixin):
         self._blacklist = self._config["exchange"].get("pair_blacklist", [])
         self._pairlist_handlers: list[IPairList] = []
         self._tickers_needed = False
+        # Ticker table - together with the tickers it was built from
+        self._ticker_table: tuple[Tickers, DataFrame] | None = None
         self._dataprovider: DataProvider | None = dataprovider
         for pairlist_handler_config in self._config.get("pairlists", []):
             pairlist_handler = PairListResolver.load_pairlist(
@@ -124,8 +127,19 @@ class PairListManager(LoggingMixin):
     def _get_cached_tickers(self) -> Tickers:
         return self._exchange.get_tickers()
 
+    def ticker_table(self, tickers: Tickers) -> DataFrame:
+        """
+        Columnar snapshot of tickers and markets, shared by all Pairlist Handlers
+        of one pairlist refresh. See build_ticker_table() for details.
+        :param tickers: Tickers (from exchange.get_tickers). May be cached.
+        """
+        if self._ticker_table is None or self._ticker_table[0] is not tickers:
+            self._ticker_table = (tickers, build_ticker_table(tickers, self._exchange.markets))
+        return self._ticker_table[1]
+
     def refresh_pairlist(self) -> None:
         """Run pairlist through all configured Pairlist Handlers."""
+        self._ticker_table = None
         # Tickers should be cached to avoid calling the exchange on each call.
         tickers: dict = {}
         if self._tickers_needed:
@@ -163,11 +177,13 @@ class PairListManager(LoggingMixin):
             logger.error(f"Pair blacklist contains an invalid Wildcard: {err}")
             return []
         log_once = partial(self.log_once, logmethod=logmethod)
-        for pair in pairlist.copy():
-            if pair in blacklist:
+        blacklisted = set(blacklist).intersection(pairlist)
+        if not blacklisted:
+            return pairlist
+        for pair in pairlist:
+            if pair in blacklisted:
                 log_once(f"Pair {pair} in your blacklist. Removing it from whitelist...")
-                pairlist.remove(pair)
-        return pairlist
+        return [pair for pair in pairlist if pair not in blacklisted]
 
     def verify_whitelist(
         self, pairlist: list[str], logmethod, keep_invalid: bool = False
@@ -1524,6 +1524,8 @@ class RPC:
                 data_format=config["dataformat_ohlcv"],
                 candle_type=config.get("candle_type_def", CandleType.SPOT),
                 startup_candles=startup_candles,
+                base_timeframe=config.get("ohlcv_base_timeframe"),
+                candle_offset=config.get("ohlcv_candle_offset"),
             )
             if pair not in _data:
                 raise RPCException(
@@ -5,12 +5,20 @@ This module defines the interface to apply for strategies
 
 import logging
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from math import isinf, isnan
 
-from pandas import DataFrame
+from joblib import effective_n_jobs
+from pandas import DataFrame, concat
 
-from freqtrade.constants import CUSTOM_TAG_MAX_LENGTH, Config, IntOrInf, ListPairsWithTimeframes
+from freqtrade.constants import (
+    CUSTOM_TAG_MAX_LENGTH,
+    Config,
+    IntOrInf,
+    ListPairsWithTimeframes,
+    PairWithTimeframe,
+)
 from freqtrade.data.converter import populate_dataframe_with_trades
 from freqtrade.data.converter.converter import reduce_dataframe_footprint
 from freqtrade.data.dataprovider import DataProvider
@@ -102,6 +110,8 @@ class IStrategy(ABC, HyperStrategyMixin):
 
     # run "populate_indicators" only for new candle
     process_only_new_candles: bool = True
+    # Analyze only new candles plus this many candles before them (0 analyzes all candles)
+    incremental_lookback_candles: int = 0
 
     use_exit_signal: bool
     exit_profit_only: bool
@@ -148,6 +158,8 @@ class IStrategy(ABC, HyperStrategyMixin):
         self.config = config
         # Dict to determine if analysis is necessary
         self._last_candle_seen_per_pair: dict[str, datetime] = {}
+        # Dataframes to emit once all pairs are analyzed (see analyze())
+        self._deferred_emits: dict[str, tuple[PairWithTimeframe, DataFrame, bool]] | None = None
         super().__init__(config)
 
         # Gather informative pairs from @informative-decorated methods.
@@ -1162,13 +1174,22 @@ class IStrategy(ABC, HyperStrategyMixin):
         # always run if process_only_new_candles is set to false
         if not self.process_only_new_candles or new_candle:
             # Defs that only make change on new candle data.
-            dataframe = self.analyze_ticker(dataframe, metadata)
+            analyzed = None
+            if self.process_only_new_candles and self.incremental_lookback_candles > 0:
+                analyzed = self._analyze_ticker_incremental(dataframe, metadata)
+            dataframe = (
+                analyzed if analyzed is not None else self.analyze_ticker(dataframe, metadata)
+            )
 
             self._last_candle_seen_per_pair[pair] = dataframe.iloc[-1]["date"]
 
             candle_type = self.config.get("candle_type_def", CandleType.SPOT)
             self.dp._set_cached_df(pair, self.timeframe, dataframe, candle_type=candle_type)
-            self.dp._emit_df((pair, self.timeframe, candle_type), dataframe, new_candle)
+            emit = ((pair, self.timeframe, candle_type), dataframe, new_candle)
+            if self._deferred_emits is not None:
+                self._deferred_emits[pair] = emit
+            else:
+                self.dp._emit_df(*emit)
 
         else:
             logger.debug("Skipping TA Analysis for already analyzed candle")
@@ -1178,6 +1199,37 @@ class IStrategy(ABC, HyperStrategyMixin):
 
         return dataframe
 
+    def _analyze_ticker_incremental(self, dataframe: DataFrame, metadata: dict) -> DataFrame | None:
+        """
+        Analyze only the candles added since the last analysis of this pair, together with the
+        `incremental_lookback_candles` candles before them.
+        The new rows are appended to the previously analyzed dataframe.
+        :param dataframe: Dataframe containing data from exchange
+        :param metadata: Metadata dictionary with additional data (e.g. 'pair')
+        :return: Analyzed dataframe - or None if all candles need to be analyzed.
+        """
+        if self.dp.runmode not in (RunMode.DRY_RUN, RunMode.LIVE):
+            return None
+        pair = str(metadata.get("pair"))
+        analyzed, _ = self.dp.get_analyzed_dataframe(pair, self.timeframe)
+        if analyzed.empty or self._last_candle_seen_per_pair.get(pair) != analyzed["date"].iat[-1]:
+            # Not analyzed by this strategy before
+            return None
+        new_rows = int((dataframe["date"] > analyzed["date"].iat[-1]).sum())
+        window = new_rows + self.incremental_lookback_candles
+        previous = analyzed.loc[analyzed["date"] >= dataframe["date"].iat[0]]
+        if (
+            new_rows == 0
+            or window >= len(dataframe)
+            or len(previous) + new_rows != len(dataframe)
+            or not (previous["date"].values == dataframe["date"].values[: len(previous)]).all()
+        ):
+            return None
+
+        logger.debug(f"Analyzing {new_rows} new candles of {pair} incrementally.")
+        tail = self.analyze_ticker(dataframe.iloc[-window:].reset_index(drop=True), metadata)
+        return concat([previous, tail.iloc[-new_rows:]], axis=0, ignore_index=True)
+
     def analyze_pair(self, pair: str) -> None:
         """
         Fetch data for this pair from dataprovider and analyze.
@@ -1211,10 +1263,25 @@ class IStrategy(ABC, HyperStrategyMixin):
     def analyze(self, pairs: list[str]) -> None:
         """
         Analyze all pairs using analyze_pair().
+        With `analyze_jobs` configured, pairs are analyzed in a thread pool.
+        Analyzed dataframes are then emitted in the order of pairs, once all pairs are analyzed.
         :param pairs: List of pairs to analyze
         """
-        for pair in pairs:
-            self.analyze_pair(pair)
+        n_jobs = min(effective_n_jobs(self.config.get("analyze_jobs", 1)), len(pairs))
+        if n_jobs <= 1:
+            for pair in pairs:
+                self.analyze_pair(pair)
+            return
+
+        self._deferred_emits = {}
+        try:
+            with ThreadPoolExecutor(max_workers=n_jobs, thread_name_prefix="analyze") as executor:
+                list(executor.map(self.analyze_pair, pairs))
+        finally:
+            deferred, self._deferred_emits = self._deferred_emits, None
+            for pair in pairs:
+                if pair in deferred:
+                    self.dp._emit_df(*deferred[pair])
 
     @staticmethod
     def preserve_df(dataframe: DataFrame) -> tuple[int, float, datetime]:
@@ -1680,11 +1747,20 @@ class IStrategy(ABC, HyperStrategyMixin):
         Also copy on output to avoid PerformanceWarnings pandas 1.3.0 started to show.
         Has positive effects on memory usage for whatever reason - also when
         using only one strategy.
-        """
-        return {
-            pair: self.advise_indicators(pair_data.copy(), {"pair": pair}).copy()
-            for pair, pair_data in data.items()
-        }
+        With `indicator_jobs` configured, pairs are analyzed in a thread pool.
+        """
+        n_jobs = effective_n_jobs(self.config.get("indicator_jobs", 1))
+        if n_jobs == 1 or len(data) < 2:
+            return {
+                pair: self._advise_pair_indicators(pair, pair_data)
+                for pair, pair_data in data.items()
+            }
+        with ThreadPoolExecutor(max_workers=n_jobs, thread_name_prefix="indicators") as executor:
+            results = executor.map(self._advise_pair_indicators, data.keys(), data.values())
+            return dict(zip(data.keys(), results, strict=True))
+
+    def _advise_pair_indicators(self, pair: str, pair_data: DataFrame) -> DataFrame:
+        return self.advise_indicators(pair_data.copy(), {"pair": pair}).copy()
 
     def ft_advise_signals(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         """
@@ -4,9 +4,10 @@ This module defines a base class for auto-hyperoptable strategies.
 """
 
 import logging
+import threading
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
-from contextlib import suppress
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager, suppress
 from typing import Any, Union
 
 from freqtrade.enums import HyperoptState
@@ -23,6 +24,26 @@ from freqtrade.exceptions import OperationalException
 
 logger = logging.getLogger(__name__)
 
+# Parameters read within record_parameter_reads() - per thread
+_parameter_reads = threading.local()
+
+
+@contextmanager
+def record_parameter_reads() -> Iterator[set["BaseParameter"]]:
+    """
+    Record all parameters whose value is read (in the current thread) within this context.
+    :return: set of parameters, filled once the context exits.
+    """
+    parent = getattr(_parameter_reads, "current", None)
+    reads: set[BaseParameter] = set()
+    _parameter_reads.current = reads
+    try:
+        yield reads
+    finally:
+        _parameter_reads.current = parent
+        if parent is not None:
+            parent.update(reads)
+
 
 class BaseParameter(ABC):
     """
@@ -31,7 +52,6 @@ class BaseParameter(ABC):
 
     category: str | None
     default: Any
-    value: Any
     in_space: bool = False
     name: str
 
@@ -66,6 +86,17 @@ class BaseParameter(ABC):
     def __repr__(self):
         return f"{self.__class__.__name__}({self.value})"
 
+    @property
+    def value(self) -> Any:
+        reads = getattr(_parameter_reads, "current", None)
+        if reads is not None:
+            reads.add(self)
+        return self._value
+
+    @value.setter
+    def value(self, value: Any) -> None:
+        self._value = value
+
     @abstractmethod
     def get_space(self, name: str) -> Union["Integer", "Real", "SKDecimal", "Categorical"]:
         """
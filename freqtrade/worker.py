@@ -6,6 +6,7 @@ import logging
 import time
 import traceback
 from collections.abc import Callable
+from datetime import datetime
 from os import getpid
 from typing import Any
 
@@ -16,7 +17,7 @@ from freqtrade.configuration import Configuration
 from freqtrade.constants import PROCESS_THROTTLE_SECS, RETRY_TIMEOUT, Config
 from freqtrade.enums import RPCMessageType, State
 from freqtrade.exceptions import OperationalException, TemporaryError
-from freqtrade.exchange import timeframe_to_next_date
+from freqtrade.exchange import timeframe_to_next_date, timeframe_to_prev_date
 from freqtrade.freqtradebot import FreqtradeBot
 
 
@@ -57,6 +58,15 @@ class Worker:
         internals_config = self._config.get("internals", {})
         self._throttle_secs = internals_config.get("process_throttle_secs", PROCESS_THROTTLE_SECS)
         self._heartbeat_interval = internals_config.get("heartbeat_interval", 60)
+        self._event_driven = internals_config.get("event_driven", False)
+        if self._event_driven and not self.freqtrade.strategy.process_only_new_candles:
+            logger.warning(
+                "Event driven bot loop requires `process_only_new_candles` - "
+                "running a full bot iteration every loop."
+            )
+            self._event_driven = False
+        # Open time of the candle the last full bot iteration ran for
+        self._processed_candle: datetime | None = None
 
         self._sd_notify = (
             sdnotify.SystemdNotifier()
@@ -101,6 +111,7 @@ class Worker:
                 State.PAUSED,
             ):
                 self.freqtrade.startup()
+                self._processed_candle = None
 
             if state == State.STOPPED:
                 self.freqtrade.check_for_open_trades()
@@ -183,9 +194,27 @@ class Worker:
             f"last iteration took {time_passed:.2f} s."
             #  f"next: {next_iter}"
         )
-        self._sleep(sleep_duration)
+        self._wait(sleep_duration)
         return result
 
+    def _wait(self, sleep_duration: float) -> None:
+        """
+        Sleep until the next iteration.
+        In event driven mode, wakes up early once the websocket connection received
+        a new candle of the strategy timeframe.
+        """
+        event = self.freqtrade.exchange.candle_closed if self._event_driven else None
+        if event is None:
+            self._sleep(sleep_duration)
+            return
+        timeframe = self.freqtrade.config["timeframe"]
+        wake_up = time.monotonic() + sleep_duration
+        while event.wait(max(wake_up - time.monotonic(), 0.0)):
+            event.clear()
+            if timeframe_to_prev_date(timeframe) != self._processed_candle:
+                break
+            # Signal for a candle which was already processed - keep sleeping
+
     @staticmethod
     def _sleep(sleep_duration: float) -> None:
         """Local sleep method - to improve testability"""
@@ -196,7 +225,16 @@ class Worker:
 
     def _process_running(self) -> None:
         try:
-            self.freqtrade.process()
+            if not self._event_driven:
+                self.freqtrade.process()
+                return
+            candle = timeframe_to_prev_date(self.freqtrade.config["timeframe"])
+            if candle != self._processed_candle:
+                # A candle closed since the last full iteration
+                self.freqtrade.process()
+                self._processed_candle = candle
+            else:
+                self.freqtrade.process_trades()
         except TemporaryError as error:
             logger.warning(f"Error: {error}, retrying in {RETRY_TIMEOUT} seconds...")
             time.sleep(RETRY_TIMEOUT)
@@ -9,12 +9,17 @@ from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration.timerange import TimeRange
 from freqtrade.data.converter import (
+    clean_ohlcv_dataframe,
     convert_ohlcv_format,
     convert_trades_format,
     convert_trades_to_ohlcv,
+    converter,
+    merge_ohlcv_dataframes,
     ohlcv_fill_up_missing_data,
+    ohlcv_resample,
     ohlcv_to_dataframe,
     reduce_dataframe_footprint,
+    trades_chunks_to_ohlcv,
     trades_df_remove_duplicates,
     trades_dict_to_list,
     trades_to_ohlcv,
@@ -26,8 +31,8 @@ from freqtrade.data.history import (
     load_pair_history,
     validate_backtest_data,
 )
-from freqtrade.data.history.datahandlers import IDataHandler
-from freqtrade.enums import CandleType
+from freqtrade.data.history.datahandlers import IDataHandler, get_datahandler
+from freqtrade.enums import CandleType, TradingMode
 from freqtrade.exchange import timeframe_to_minutes, timeframe_to_seconds
 from tests.conftest import generate_test_data, generate_trades_history, log_has, log_has_re
 from tests.data.test_history import _clean_test_file
@@ -109,6 +114,19 @@ def test_trades_to_ohlcv_multi(timeframe, rows, days, candles, start, end, weekd
         assert df.iloc[-1, :]["date"].day_name() == weekday
 
 
+def test_trades_chunks_to_ohlcv():
+    with pytest.raises(ValueError, match="Trade-list empty."):
+        trades_chunks_to_ohlcv(iter([]), ["1m"])
+
+    trades_history = generate_trades_history(n_rows=20_000, days=5)
+    # Chunk boundaries split candles of all timeframes
+    chunks = (trades_history.iloc[i : i + 3_001] for i in range(0, len(trades_history), 3_001))
+    result = trades_chunks_to_ohlcv(chunks, ["1m", "5m", "1h", "1d"])
+    assert list(result) == ["1m", "5m", "1h", "1d"]
+    for timeframe, ohlcv in result.items():
+        assert_frame_equal(ohlcv, trades_to_ohlcv(trades_history, timeframe), check_freq=False)
+
+
 def test_ohlcv_fill_up_missing_data(testdatadir, caplog):
     data = load_pair_history(
         datadir=testdatadir, timeframe="1m", pair="UNITTEST/BTC", fill_up_missing=False
@@ -191,6 +209,151 @@ def test_ohlcv_fill_up_missing_data2(caplog):
     )
 
 
+@pytest.mark.parametrize("timeframe", ["1m", "5m", "1h", "1d", "3d", "1w", "1M"])
+@pytest.mark.parametrize("unit", ["ms", "ns"])
+def test_clean_ohlcv_dataframe_fast_path(mocker, timeframe, unit):
+    data = generate_test_data(timeframe, 200, "2020-01-06")
+    data["date"] = data["date"].dt.as_unit(unit)
+    # Gaps, and missing values in existing candles
+    data = data.drop(index=[3, 50, 51, 52, 199]).reset_index(drop=True)
+    data.loc[10, "close"] = np.nan
+    data.loc[11, "volume"] = np.nan
+    data["extra"] = 1
+
+    fast_spy = mocker.spy(converter, "_fill_up_missing_fast")
+    groupby_spy = mocker.spy(pd.DataFrame, "groupby")
+    result = clean_ohlcv_dataframe(
+        data, timeframe, "UNITTEST/USDT", fill_missing=True, drop_incomplete=True
+    )
+    assert groupby_spy.call_count == 0
+    fast_result = fast_spy.spy_return
+    # Weekly and monthly candles (and timeframes not dividing a day) are resampled
+    assert (fast_result is None) == (timeframe in ("3d", "1w", "1M"))
+
+    # Same result as grouping and resampling
+    mocker.patch(f"{converter.__name__}._candle_dates", return_value=None)
+    mocker.patch(f"{converter.__name__}._fill_up_missing_fast", return_value=None)
+    expected = clean_ohlcv_dataframe(
+        data, timeframe, "UNITTEST/USDT", fill_missing=True, drop_incomplete=True
+    )
+    assert groupby_spy.call_count == 1
+    assert_frame_equal(result, expected, check_exact=True)
+    assert result["date"].dt.unit == unit
+
+
+def test_candle_dates():
+    data = generate_test_data("5m", 10, "2020-01-01")
+    assert (converter._candle_dates(data) == data["date"].astype("int64")).all()
+    assert converter._candle_dates(data.iloc[::-1]) is None
+    assert converter._candle_dates(pd.concat([data, data.iloc[-1:]])) is None
+    data.loc[0, "date"] = pd.NaT
+    assert converter._candle_dates(data) is None
+    assert converter._candle_dates(data.iloc[1:]) is not None
+
+
+@pytest.mark.parametrize(
+    "new_start,new_end",
+    [
+        # Refresh overlapping the last candles
+        (195, 202),
+        # Only the last candle changes
+        (199, 200),
+        # New candles after a gap
+        (205, 210),
+        # New candles within the existing candles
+        (20, 40),
+        # New candles before the existing candles
+        (-10, 5),
+    ],
+)
+def test_merge_ohlcv_dataframes(mocker, new_start, new_end, caplog):
+    caplog.set_level(logging.DEBUG)
+    data = generate_test_data("5m", 220, "2020-01-06")
+    old = data.iloc[10:200].reset_index(drop=True)
+    # Only the last candles of the existing data are merged - and cleaned up
+    old.loc[len(old) - 1, "open"] = np.nan
+    new = data.iloc[10 + new_start : 10 + new_end].copy().reset_index(drop=True)
+    new["close"] += 1
+    new["high"] += 2
+    new["volume"] /= 2
+    new.loc[0, "close"] = np.nan
+
+    fast_spy = mocker.spy(converter, "_merge_ohlcv_fast")
+    fill_spy = mocker.spy(converter, "_fill_candle_gaps")
+    result = merge_ohlcv_dataframes(old, new, "5m", "UNITTEST/USDT")
+    assert fast_spy.spy_return is not None
+    # Older candles are not part of the merge
+    merged_len = len(fill_spy.call_args[0][0]["close"])
+    assert merged_len == len(result) - min(max(new_start, 0), len(old) - 1)
+    if new_start > 200:
+        assert log_has_re(r"Missing data fillup for UNITTEST/USDT, 5m: before: \d+.*", caplog)
+
+    # Same result as grouping and resampling the combined candles
+    expected = clean_ohlcv_dataframe(
+        pd.concat([old, new], axis=0),
+        "5m",
+        "UNITTEST/USDT",
+        fill_missing=True,
+        drop_incomplete=False,
+    )
+    assert_frame_equal(result, expected, check_exact=True)
+
+
+@pytest.mark.parametrize(
+    "timeframe,offset,first,last",
+    [
+        ("5m", None, "2020-01-06 00:10", "2020-01-13 00:00"),
+        ("1h", None, "2020-01-06 01:00", "2020-01-12 23:00"),
+        ("1d", None, "2020-01-07 00:00", "2020-01-12 00:00"),
+        ("1d", "8h", "2020-01-06 08:00", "2020-01-11 08:00"),
+        ("1w", None, "2020-01-13 00:00", None),
+    ],
+)
+def test_ohlcv_resample(timeframe, offset, first, last):
+    # 7 days of 1m candles, starting within the first candle
+    data = generate_test_data("1m", 7 * 1440, "2020-01-06 00:07")
+    result = ohlcv_resample(data, "1m", timeframe, offset=offset)
+    assert result.columns.tolist() == ["date", "open", "high", "low", "close", "volume"]
+    if last is None:
+        # Not a single full candle
+        assert result.empty
+        return
+    # Candles not fully covered by the data are dropped
+    assert result["date"].iat[0] == pd.Timestamp(first, tz="UTC")
+    assert result["date"].iat[-1] == pd.Timestamp(last, tz="UTC")
+
+    candle = result.iloc[1]
+    tf_delta = pd.Timedelta(seconds=timeframe_to_seconds(timeframe))
+    base = data.loc[(data["date"] >= candle["date"]) & (data["date"] < candle["date"] + tf_delta)]
+    assert len(base) == tf_delta / pd.Timedelta("1m")
+    assert candle["open"] == base["open"].iat[0]
+    assert candle["high"] == base["high"].max()
+    assert candle["low"] == base["low"].min()
+    assert candle["close"] == base["close"].iat[-1]
+    assert candle["volume"] == pytest.approx(base["volume"].sum())
+
+
+def test_merge_ohlcv_dataframes_fallback(mocker):
+    old = generate_test_data("5m", 50, "2020-01-06")
+    # Not aligned to the timeframe
+    new = old.tail(3).copy()
+    new["date"] += pd.Timedelta(minutes=1)
+    fast_spy = mocker.spy(converter, "_merge_ohlcv_fast")
+    result = merge_ohlcv_dataframes(old, new, "5m", "UNITTEST/USDT")
+    assert fast_spy.spy_return is None
+    expected = clean_ohlcv_dataframe(
+        pd.concat([old, new], axis=0),
+        "5m",
+        "UNITTEST/USDT",
+        fill_missing=True,
+        drop_incomplete=False,
+    )
+    assert_frame_equal(result, expected)
+
+    # Empty frames
+    assert_frame_equal(merge_ohlcv_dataframes(old.iloc[:0], old, "5m", "UNITTEST/USDT"), old)
+
+
 @pytest.mark.parametrize(
     "timeframe",
     ["1s", "1m", "5m", "15m", "1h", "2h", "4h", "8h", "12h", "1d", "7d", "1w", "1M", "3M", "1y"],
@@ -588,3 +751,33 @@ def test_convert_trades_to_ohlcv(testdatadir, tmp_path, caplog):
         candle_type=CandleType.SPOT,
     )
     assert log_has(msg, caplog)
+
+
+def test_convert_trades_to_ohlcv_read_error(testdatadir, tmp_path, mocker, caplog):
+    pair = "XRP/ETH"
+    copyfile(testdatadir / "XRP_ETH-trades.feather", tmp_path / "XRP_ETH-trades.feather")
+    trades = get_datahandler(tmp_path, "feather").trades_load(pair, TradingMode.SPOT)
+
+    def failing_chunks(*args, **kwargs):
+        yield trades.iloc[:1_000]
+        raise OSError("Corrupt file")
+
+    mocker.patch(
+        "freqtrade.data.history.datahandlers.featherdatahandler.FeatherDataHandler"
+        "._trades_load_chunks",
+        side_effect=failing_chunks,
+    )
+    convert_trades_to_ohlcv(
+        [pair],
+        timeframes=["1m", "5m"],
+        data_format_trades="feather",
+        datadir=tmp_path,
+        timerange=TimeRange(),
+        erase=False,
+        data_format_ohlcv="feather",
+        candle_type=CandleType.SPOT,
+    )
+    assert log_has("Error loading trades for XRP/ETH, not converting to OHLCV.", caplog)
+    # Partially read trades must not be stored as candles
+    assert not (tmp_path / "XRP_ETH-1m.feather").exists()
+    assert not (tmp_path / "XRP_ETH-5m.feather").exists()
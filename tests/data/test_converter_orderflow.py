@@ -7,6 +7,7 @@ from freqtrade.data.converter.orderflow import (
     ORDERFLOW_ADDED_COLUMNS,
     stacked_imbalance,
     timeframe_to_DateOffset,
+    trades_orderflow_to_imbalances,
     trades_to_volumeprofile_with_total_delta_bid_ask,
 )
 from freqtrade.data.converter.trade_converter import trades_list_to_df
@@ -104,6 +105,7 @@ def test_public_trades_mock_populate_dataframe_with_trades__check_orderflow(
             "imbalance_volume": 0,
             "imbalance_ratio": 3,
             "stacked_imbalance_range": 3,
+            "store_trades": True,
         },
     }
     # Apply the function to populate the data frame with order flow data
@@ -244,6 +246,7 @@ def test_public_trades_trades_mock_populate_dataframe_with_trades__check_trades(
             "imbalance_volume": 0,
             "imbalance_ratio": 3,
             "stacked_imbalance_range": 3,
+            "store_trades": True,
         },
     }
 
@@ -389,6 +392,68 @@ def test_public_trades_binned_big_sample_list(public_trades_list):
     assert 52.7199999 == pytest.approx(df["delta"].iat[0])  # delta
 
 
+@pytest.mark.parametrize("store_trades", [True, False])
+def test_populate_dataframe_with_trades_per_candle(public_trades_list, store_trades):
+    """
+    Orderflow of all candles is calculated at once - and matches the per candle calculation.
+    """
+    trades = trades_list_to_df(public_trades_list[DEFAULT_TRADES_COLUMNS].values.tolist())
+    dataframe = pd.DataFrame(
+        {
+            "date": pd.date_range("2023-02-02 09:19:00", periods=6, freq="1min", tz="UTC"),
+            "open": 1.0,
+            "high": 1.0,
+            "low": 1.0,
+            "close": 1.0,
+            "volume": 1.0,
+        }
+    )
+    config_orderflow = {
+        "cache_size": 10,
+        "max_candles": 10,
+        "scale": 0.05,
+        "imbalance_volume": 0,
+        "imbalance_ratio": 1.5,
+        "stacked_imbalance_range": 2,
+        "store_trades": store_trades,
+    }
+    df, cache = populate_dataframe_with_trades(
+        None, {"timeframe": "1m", "orderflow": config_orderflow}, dataframe, trades.copy()
+    )
+    # No trades in the first and last candle
+    assert df["total_trades"].isna().tolist() == [True, False, False, False, False, True]
+    assert df["total_trades"].sum() == len(trades)
+    assert len(cache) == 6
+
+    stacked_found = False
+    for idx in range(1, 5):
+        row = df.iloc[idx]
+        candle_trades = trades.loc[
+            (trades["date"] >= row["date"]) & (trades["date"] < row["date"] + pd.Timedelta("1m"))
+        ]
+        orderflow = trades_to_volumeprofile_with_total_delta_bid_ask(candle_trades, scale=0.05)
+        imbalances = trades_orderflow_to_imbalances(
+            orderflow, imbalance_ratio=1.5, imbalance_volume=0
+        )
+        assert row["orderflow"] == orderflow.to_dict(orient="index")
+        assert row["imbalances"] == imbalances.to_dict(orient="index")
+        for label in ("bid", "ask"):
+            stacked = stacked_imbalance(imbalances, label=label, stacked_imbalance_range=2)
+            assert row[f"stacked_imbalances_{label}"] == stacked
+            stacked_found |= len(stacked) > 0
+        bid = candle_trades.loc[candle_trades["side"] == "sell", "amount"]
+        ask = candle_trades.loc[candle_trades["side"] == "buy", "amount"]
+        assert row["bid"] == pytest.approx(bid.sum())
+        assert row["ask"] == pytest.approx(ask.sum())
+        assert row["delta"] == pytest.approx(ask.sum() - bid.sum())
+        assert row["total_trades"] == len(candle_trades)
+        if store_trades:
+            assert row["trades"] == candle_trades.to_dict(orient="records")
+        else:
+            assert pd.isna(row["trades"])
+    assert stacked_found
+
+
 def test_public_trades_config_max_trades(
     default_conf, populate_dataframe_with_trades_dataframe, populate_dataframe_with_trades_trades
 ):
@@ -502,7 +567,7 @@ def test_analyze_with_orderflow(
     mocker.patch.object(strategy.dp, "trades", return_value=populate_dataframe_with_trades_trades)
     import freqtrade.data.converter.orderflow as orderflow_module
 
-    spy = mocker.spy(orderflow_module, "trades_to_volumeprofile_with_total_delta_bid_ask")
+    spy = mocker.spy(orderflow_module, "_orderflow_per_candle")
 
     pair = "ETH/BTC"
     df = strategy.advise_indicators(ohlcv_history, {"pair:": pair})
@@ -522,6 +587,7 @@ def test_analyze_with_orderflow(
         "imbalance_volume": 0,
         "imbalance_ratio": 3,
         "stacked_imbalance_range": 3,
+        "store_trades": True,
     }
 
     strategy.config = default_conf_usdt
@@ -529,7 +595,7 @@ def test_analyze_with_orderflow(
     df1 = strategy.advise_indicators(ohlcv_history, {"pair": pair})
     assert len(df1) == len(ohlcv_history)
     assert "open" in df1.columns
-    assert spy.call_count == 5
+    assert spy.call_count == 1
 
     for col in ORDERFLOW_ADDED_COLUMNS:
         assert col in df1.columns, f"Column {col} not found in df.columns"
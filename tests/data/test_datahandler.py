@@ -3,14 +3,15 @@
 import re
 from datetime import datetime, timezone
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
-from pandas import DataFrame, Timestamp
+from pandas import DataFrame, Timestamp, concat
 from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration import TimeRange
-from freqtrade.constants import AVAILABLE_DATAHANDLERS
+from freqtrade.data.converter import trim_dataframe
+from freqtrade.data.history.datahandlers.datacatalog import CATALOG_FILENAME
 from freqtrade.data.history.datahandlers.featherdatahandler import FeatherDataHandler
 from freqtrade.data.history.datahandlers.idatahandler import (
     IDataHandler,
@@ -21,7 +22,7 @@ from freqtrade.data.history.datahandlers.jsondatahandler import JsonDataHandler,
 from freqtrade.data.history.datahandlers.parquetdatahandler import ParquetDataHandler
 from freqtrade.enums import CandleType, TradingMode
 from freqtrade.exceptions import OperationalException
-from tests.conftest import log_has, log_has_re
+from tests.conftest import generate_test_data, log_has, log_has_re
 
 
 def test_datahandler_ohlcv_get_pairs(testdatadir):
@@ -180,6 +181,79 @@ def test_datahandler_ohlcv_data_min_max(testdatadir):
     assert min_max[1] == datetime(2017, 11, 14, 22, 59, tzinfo=timezone.utc)
 
 
+@pytest.mark.parametrize("datahandler", ["jsongz", "feather", "parquet"])
+def test_datahandler_ohlcv_data_catalog(mocker, tmp_path, datahandler):
+    ohlcv = generate_test_data("1h", 100, "2021-01-01")
+    dh = get_datahandler(tmp_path, datahandler)
+    file = dh._pair_data_filename(tmp_path, "UNITTEST/NEW", "1h", CandleType.FUTURES)
+    dh.ohlcv_store("UNITTEST/NEW", "1h", ohlcv.iloc[:50], CandleType.FUTURES)
+    assert (tmp_path / CATALOG_FILENAME).is_file()
+
+    load_mock = mocker.spy(dh, "_ohlcv_load")
+    entry = dh._catalog.get(file)
+    assert entry.pair == "UNITTEST/NEW"
+    assert entry.candle_type == CandleType.FUTURES
+    assert entry.rows == 50
+    assert entry.gaps == 0
+    assert dh.ohlcv_data_min_max("UNITTEST/NEW", "1h", CandleType.FUTURES) == (
+        datetime(2021, 1, 1, tzinfo=timezone.utc),
+        datetime(2021, 1, 3, 1, tzinfo=timezone.utc),
+        50,
+    )
+    assert load_mock.call_count == 0
+
+    if datahandler != "jsongz":
+        # Overlapping and new candles are added without loading the data
+        dh.ohlcv_append("UNITTEST/NEW", "1h", ohlcv.iloc[45:60], CandleType.FUTURES)
+        # Leave a gap of 10 candles
+        dh.ohlcv_append("UNITTEST/NEW", "1h", ohlcv.iloc[70:], CandleType.FUTURES)
+        entry = dh._catalog.get(file)
+        assert entry.rows == 90
+        assert entry.gaps == 10
+        assert entry.max_date == datetime(2021, 1, 5, 3, tzinfo=timezone.utc)
+        assert load_mock.call_count == 0
+
+        # Filling the gap can't be derived from the catalog entry
+        dh.ohlcv_append("UNITTEST/NEW", "1h", ohlcv.iloc[60:70], CandleType.FUTURES)
+        assert dh._catalog.get(file) is None
+        assert dh.ohlcv_data_min_max("UNITTEST/NEW", "1h", CandleType.FUTURES)[2] == 100
+        assert load_mock.call_count == 1
+        assert dh._catalog.get(file).gaps == 0
+
+        # Segments removed or added outside of freqtrade are detected
+        segments = dh._segment_files(file)
+        segments[-1].unlink()
+        assert dh._catalog.get(file) is None
+        assert dh.ohlcv_data_min_max("UNITTEST/NEW", "1h", CandleType.FUTURES)[2] == 90
+        dh._ohlcv_write(ohlcv.iloc[60:70], segments[-1])
+        assert dh._catalog.get(file) is None
+        assert dh.ohlcv_data_min_max("UNITTEST/NEW", "1h", CandleType.FUTURES)[2] == 100
+
+        # The entry is not served if the catalog couldn't be updated after appending
+        with patch.object(dh._catalog, "_write"):
+            dh.ohlcv_append("UNITTEST/NEW", "1h", ohlcv.iloc[-1:], CandleType.FUTURES)
+        assert dh._catalog.get(file) is None
+
+    # Files changed outside of freqtrade are not served from the catalog
+    dh._remove_segments(file)
+    (tmp_path / "other").mkdir()
+    dh2 = get_datahandler(tmp_path / "other", datahandler)
+    dh2.ohlcv_store("UNITTEST/NEW", "1h", ohlcv.iloc[:10], CandleType.FUTURES)
+    dh2._pair_data_filename(tmp_path / "other", "UNITTEST/NEW", "1h", CandleType.FUTURES).replace(
+        file
+    )
+    assert dh._catalog.get(file) is None
+    assert dh.ohlcv_data_min_max("UNITTEST/NEW", "1h", CandleType.FUTURES)[2] == 10
+
+    assert dh.ohlcv_purge("UNITTEST/NEW", "1h", CandleType.FUTURES)
+    assert dh._catalog.get(file) is None
+
+    # A broken catalog falls back to the data files
+    (tmp_path / CATALOG_FILENAME).write_text("garbage")
+    dh.ohlcv_store("UNITTEST/NEW", "1h", ohlcv, CandleType.FUTURES)
+    assert dh.ohlcv_data_min_max("UNITTEST/NEW", "1h", CandleType.FUTURES)[2] == 100
+
+
 def test_datahandler__check_empty_df(testdatadir, caplog):
     dh = JsonDataHandler(testdatadir)
     expected_text = r"Price jump in UNITTEST/USDT, 1h, spot between"
@@ -290,7 +364,7 @@ def test_jsondatahandler_trades_load(testdatadir, caplog):
     assert log_has(logmsg, caplog)
 
 
-@pytest.mark.parametrize("datahandler", AVAILABLE_DATAHANDLERS)
+@pytest.mark.parametrize("datahandler", ["json", "jsongz"])
 def test_datahandler_ohlcv_append(
     datahandler,
     testdatadir,
@@ -302,11 +376,99 @@ def test_datahandler_ohlcv_append(
         dh.ohlcv_append("UNITTEST/ETH", "5m", DataFrame(), CandleType.MARK)
 
 
-@pytest.mark.parametrize("datahandler", AVAILABLE_DATAHANDLERS)
+@pytest.mark.parametrize("datahandler", ["json", "jsongz"])
 def test_datahandler_trades_append(datahandler, testdatadir):
     dh = get_datahandler(testdatadir, datahandler)
     with pytest.raises(NotImplementedError):
-        dh.trades_append("UNITTEST/ETH", DataFrame())
+        dh.trades_append("UNITTEST/ETH", DataFrame(), TradingMode.SPOT)
+
+
+@pytest.mark.parametrize("datahandler", ["feather", "parquet"])
+def test_generic_datahandler_ohlcv_append(mocker, tmp_path, datahandler):
+    mocker.patch.object(IDataHandler, "_max_segments", 2)
+    ohlcv = generate_test_data("1h", 100, "2021-01-01")
+    dh = get_datahandler(tmp_path, datahandler)
+    file = tmp_path / f"UNITTEST_NEW-1h.{dh._get_file_extension()}"
+
+    # Appending to a non-existing file creates it
+    dh.ohlcv_append("UNITTEST/NEW", "1h", ohlcv.iloc[:50], CandleType.SPOT)
+    assert file.is_file()
+    assert dh._segment_files(file) == []
+
+    # Overlapping candles are replaced by the appended data
+    new_candles = ohlcv.iloc[49:80].copy()
+    new_candles.loc[new_candles.index[0], "close"] = 42.0
+    dh.ohlcv_append("UNITTEST/NEW", "1h", new_candles, CandleType.SPOT)
+    dh.ohlcv_append("UNITTEST/NEW", "1h", ohlcv.iloc[80:], CandleType.SPOT)
+    assert len(dh._segment_files(file)) == 2
+    assert [p.name for p in tmp_path.glob(f"*.{dh._get_file_extension()}")] == [file.name]
+    assert dh.ohlcv_get_available_data(tmp_path, TradingMode.SPOT) == [
+        ("UNITTEST/NEW", "1h", CandleType.SPOT)
+    ]
+
+    loaded = dh.ohlcv_load("UNITTEST/NEW", "1h", CandleType.SPOT)
+    assert len(loaded) == 100
+    assert loaded["date"].is_monotonic_increasing
+    assert loaded.iloc[49]["close"] == 42.0
+    tr = TimeRange.parse_timerange("20210102-20210103")
+    loaded_tr = dh.ohlcv_load("UNITTEST/NEW", "1h", CandleType.SPOT, timerange=tr)
+    assert loaded_tr.iloc[0]["date"] == Timestamp("2021-01-02", tz="UTC")
+    assert loaded_tr.iloc[-1]["date"] == Timestamp("2021-01-03", tz="UTC")
+
+    # Segments are merged into the data file once there are too many of them
+    dh.ohlcv_append("UNITTEST/NEW", "1h", ohlcv.iloc[99:], CandleType.SPOT)
+    assert dh._segment_files(file) == []
+    assert_frame_equal(dh.ohlcv_load("UNITTEST/NEW", "1h", CandleType.SPOT), loaded)
+
+    dh.ohlcv_append("UNITTEST/NEW", "1h", ohlcv.iloc[99:], CandleType.SPOT)
+    assert len(dh._segment_files(file)) == 1
+    assert dh.ohlcv_purge("UNITTEST/NEW", "1h", CandleType.SPOT)
+    assert [p.name for p in tmp_path.iterdir()] == [CATALOG_FILENAME]
+
+
+@pytest.mark.parametrize("datahandler", ["feather", "parquet"])
+def test_generic_datahandler_trades_append(mocker, testdatadir, tmp_path, datahandler):
+    mocker.patch.object(IDataHandler, "_max_segments", 2)
+    trades = get_datahandler(testdatadir, "feather").trades_load("XRP/ETH", TradingMode.SPOT)
+    dh = get_datahandler(tmp_path, datahandler)
+    file = tmp_path / f"XRP_ETH-trades.{dh._get_file_extension()}"
+
+    dh.trades_append("XRP/ETH", trades.iloc[:100], TradingMode.SPOT)
+    assert file.is_file()
+    dh.trades_append("XRP/ETH", trades.iloc[90:200], TradingMode.SPOT)
+    dh.trades_append("XRP/ETH", trades.iloc[200:], TradingMode.SPOT)
+    assert len(dh._segment_files(file)) == 2
+    assert dh.trades_get_pairs(tmp_path) == ["XRP/ETH"]
+
+    loaded = dh.trades_load("XRP/ETH", TradingMode.SPOT)
+    assert_frame_equal(loaded.reset_index(drop=True), trades.reset_index(drop=True))
+
+    # Compaction
+    dh.trades_append("XRP/ETH", trades.iloc[-1:], TradingMode.SPOT)
+    assert dh._segment_files(file) == []
+    assert_frame_equal(
+        dh.trades_load("XRP/ETH", TradingMode.SPOT).reset_index(drop=True),
+        loaded.reset_index(drop=True),
+    )
+
+    dh.trades_append("XRP/ETH", trades.iloc[-1:], TradingMode.SPOT)
+    assert dh.trades_purge("XRP/ETH", TradingMode.SPOT)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_datahandler_rename_futures_data_segments(tmp_path):
+    dh = get_datahandler(tmp_path, "feather")
+    ohlcv = generate_test_data("1h", 10, "2021-01-01")
+    dh.ohlcv_store("XRP/USDT", "1h", ohlcv.iloc[:5], CandleType.FUTURES)
+    dh.ohlcv_append("XRP/USDT", "1h", ohlcv.iloc[5:], CandleType.FUTURES)
+
+    dh.rename_futures_data("XRP/USDT", "XRP/USDT:USDT", "1h", CandleType.FUTURES)
+    assert sorted(p.name for p in (tmp_path / "futures").iterdir()) == [
+        "XRP_USDT_USDT-1h-futures.feather",
+        "XRP_USDT_USDT-1h-futures.feather.000001.seg",
+    ]
+    loaded = dh.ohlcv_load("XRP/USDT:USDT", "1h", CandleType.FUTURES)
+    assert len(loaded) == 10
 
 
 @pytest.mark.parametrize(
@@ -403,6 +565,52 @@ def test_generic_datahandler_ohlcv_load_and_resave(
     assert log_has_re("Error loading data from", caplog)
 
 
+@pytest.mark.parametrize(
+    "timerange",
+    [
+        "20210102-20210105",
+        "20210104-",
+        "-20210102",
+        "20210110-20210120",
+        "20200101-20200201",
+    ],
+)
+@pytest.mark.parametrize("datahandler", ["feather", "parquet"])
+def test_generic_datahandler_ohlcv_load_timerange(mocker, tmp_path, datahandler, timerange):
+    ohlcv = generate_test_data("1m", 10000, "2021-01-01")
+    dh = get_datahandler(tmp_path, datahandler)
+    mocker.patch.object(ParquetDataHandler, "_row_group_size", 1000)
+    dh.ohlcv_store("UNITTEST/NEW", "1m", ohlcv, candle_type=CandleType.SPOT)
+    # Small record batches, so only parts of the file are read
+    ohlcv.to_feather(tmp_path / "UNITTEST_NEW-1m.feather", chunksize=1000)
+
+    tr = TimeRange.parse_timerange(timerange)
+    full = dh._ohlcv_load("UNITTEST/NEW", "1m", None, candle_type=CandleType.SPOT)
+    loaded = dh._ohlcv_load("UNITTEST/NEW", "1m", tr, candle_type=CandleType.SPOT)
+    expected = trim_dataframe(full, tr).reset_index(drop=True)
+    assert len(loaded) == len(expected)
+    assert_frame_equal(loaded, expected, check_index_type=False)
+
+
+@pytest.mark.parametrize("datahandler", ["feather", "parquet"])
+def test_generic_datahandler_ohlcv_load_timerange_drop_incomplete(tmp_path, datahandler):
+    ohlcv = generate_test_data("1h", 100, "2021-01-01")
+    dh = get_datahandler(tmp_path, datahandler)
+    dh.ohlcv_store("UNITTEST/NEW", "1h", ohlcv, candle_type=CandleType.SPOT)
+    tr = TimeRange.parse_timerange("20210102-20210103")
+
+    # The last candle is only incomplete if it's the last candle of the file
+    loaded = dh.ohlcv_load(
+        "UNITTEST/NEW", "1h", CandleType.SPOT, timerange=tr, drop_incomplete=True
+    )
+    assert loaded.iloc[-1]["date"] == Timestamp("2021-01-03", tz="UTC")
+    tr = TimeRange.parse_timerange("20210102-20210110")
+    loaded = dh.ohlcv_load(
+        "UNITTEST/NEW", "1h", CandleType.SPOT, timerange=tr, drop_incomplete=True
+    )
+    assert loaded.iloc[-1]["date"] == ohlcv.iloc[-2]["date"]
+
+
 @pytest.mark.parametrize("datahandler", ["jsongz", "feather", "parquet"])
 def test_datahandler_trades_load(testdatadir, datahandler):
     dh = get_datahandler(testdatadir, datahandler)
@@ -417,6 +625,63 @@ def test_datahandler_trades_load(testdatadir, datahandler):
     assert trades1.empty
 
 
+@pytest.mark.parametrize("datahandler", ["feather", "parquet"])
+def test_datahandler_trades_load_timerange(testdatadir, datahandler):
+    dh = get_datahandler(testdatadir, datahandler)
+    trades = dh.trades_load("XRP/ETH", TradingMode.SPOT)
+    timerange = TimeRange.parse_timerange("20191011-20191012")
+    trades_tr = dh.trades_load("XRP/ETH", TradingMode.SPOT, timerange=timerange)
+    assert 0 < len(trades_tr) < len(trades)
+    expected = trades.loc[trades["timestamp"] <= timerange.stopts * 1000].reset_index(drop=True)
+    assert_frame_equal(trades_tr, expected, check_exact=True)
+
+    trades_none = dh.trades_load(
+        "XRP/ETH", TradingMode.SPOT, timerange=TimeRange.parse_timerange("20200101-")
+    )
+    assert trades_none.empty
+
+
+@pytest.mark.parametrize("datahandler", ["jsongz", "feather", "parquet"])
+def test_datahandler_trades_load_chunks(testdatadir, datahandler):
+    dh = get_datahandler(testdatadir, datahandler)
+    trades = dh.trades_load("XRP/ETH", TradingMode.SPOT)
+
+    chunks = list(dh.trades_load_chunks("XRP/ETH", TradingMode.SPOT, chunk_size=1_000))
+    if datahandler == "jsongz":
+        # json can't be read partially
+        assert len(chunks) == 1
+    else:
+        assert len(chunks) > 1
+        assert all(len(chunk) <= 1_000 for chunk in chunks)
+    assert_frame_equal(concat(chunks, ignore_index=True), trades, check_exact=True)
+
+    timerange = TimeRange.parse_timerange("20191012-")
+    chunks = list(dh.trades_load_chunks("XRP/ETH", TradingMode.SPOT, timerange, 1_000))
+    expected = trades.loc[trades["timestamp"] >= timerange.startts * 1000].reset_index(drop=True)
+    if datahandler != "jsongz":
+        # json ignores the timerange
+        assert chunks[0].iloc[0]["timestamp"] >= timerange.startts * 1000
+        assert_frame_equal(concat(chunks, ignore_index=True), expected, check_exact=True)
+
+    assert list(dh.trades_load_chunks("UNITTEST/NONEXIST", TradingMode.SPOT)) == []
+
+
+@pytest.mark.parametrize("datahandler", ["feather", "parquet"])
+def test_datahandler_trades_load_chunks_segments(testdatadir, tmp_path, datahandler):
+    trades = get_datahandler(testdatadir, datahandler).trades_load("XRP/ETH", TradingMode.SPOT)
+    dh = get_datahandler(tmp_path, datahandler)
+    dh.trades_store("XRP/ETH", trades.iloc[:5_000], TradingMode.SPOT)
+    # Appended data overlaps with the stored trades
+    dh.trades_append("XRP/ETH", trades.iloc[4_990:], TradingMode.SPOT)
+    filename = dh._pair_trades_filename(tmp_path, "XRP/ETH", TradingMode.SPOT)
+    assert len(dh._segment_files(filename)) == 1
+
+    chunks = list(dh.trades_load_chunks("XRP/ETH", TradingMode.SPOT, chunk_size=5_000))
+    # Repeated trades are removed from the first chunk of the segment
+    assert [len(chunk) for chunk in chunks] == [5_000, 4_990, len(trades) - 9_990]
+    assert_frame_equal(concat(chunks, ignore_index=True), trades, check_exact=True)
+
+
 @pytest.mark.parametrize("datahandler", ["jsongz", "feather", "parquet"])
 def test_datahandler_trades_store(testdatadir, tmp_path, datahandler):
     dh = get_datahandler(testdatadir, datahandler)
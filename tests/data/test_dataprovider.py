@@ -1,4 +1,7 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from itertools import repeat
 from unittest.mock import MagicMock
 
 import pytest
@@ -62,6 +65,27 @@ def test_historic_ohlcv(mocker, default_conf, ohlcv_history):
     assert historymock.call_args_list[0][1]["timeframe"] == "5m"
 
 
+def test_historic_ohlcv_concurrent(mocker, default_conf, ohlcv_history):
+    barrier = threading.Barrier(2, timeout=5)
+
+    def load_pair_history(**kwargs):
+        # Fails with BrokenBarrierError unless both pairs are loaded at the same time
+        barrier.wait()
+        return ohlcv_history
+
+    historymock = mocker.patch(
+        "freqtrade.data.dataprovider.load_pair_history", side_effect=load_pair_history
+    )
+    dp = DataProvider(default_conf, None)
+    pairs = ["UNITTEST/BTC", "ETH/BTC", "UNITTEST/BTC", "ETH/BTC"]
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(dp.historic_ohlcv, pairs, repeat("5m")))
+
+    assert all(len(result) == len(ohlcv_history) for result in results)
+    # Each pair is loaded only once
+    assert historymock.call_count == 2
+
+
 def test_historic_trades(mocker, default_conf, trades_history_df):
     historymock = MagicMock(return_value=trades_history_df)
     mocker.patch(
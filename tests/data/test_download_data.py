@@ -6,7 +6,7 @@ from freqtrade.configuration.config_setup import setup_utils_configuration
 from freqtrade.data.history.history_utils import download_data_main
 from freqtrade.enums import RunMode
 from freqtrade.exceptions import OperationalException
-from tests.conftest import EXMS, log_has_re, patch_exchange
+from tests.conftest import EXMS, log_has, log_has_re, patch_exchange
 
 
 def test_download_data_main_no_markets(mocker, caplog):
@@ -46,6 +46,32 @@ def test_download_data_main_all_pairs(mocker, markets):
     assert set(dl_mock.call_args_list[0][1]["pairs"]) == expected
 
 
+def test_download_data_main_base_timeframe(mocker, markets, caplog):
+    dl_mock = mocker.patch(
+        "freqtrade.data.history.history_utils.refresh_backtest_ohlcv_data",
+        MagicMock(return_value=[]),
+    )
+    patch_exchange(mocker)
+    mocker.patch(f"{EXMS}.markets", PropertyMock(return_value=markets))
+
+    config = setup_utils_configuration({"exchange": "binance"}, RunMode.UTIL_EXCHANGE)
+    config.update(
+        {
+            "pairs": ["ETH/USDT"],
+            "timeframes": ["1s", "5m", "1h", "1d"],
+            "ohlcv_base_timeframe": "1m",
+        }
+    )
+    download_data_main(config)
+    # Higher timeframes are aggregated from the base timeframe
+    assert dl_mock.call_args_list[0][1]["timeframes"] == ["1m", "1s"]
+    assert log_has(
+        "Not downloading timeframes 5m, 1h, 1d, as they're aggregated "
+        "from the base timeframe 1m when loading the data.",
+        caplog,
+    )
+
+
 def test_download_data_main_trades(mocker):
     dl_mock = mocker.patch(
         "freqtrade.data.history.history_utils.refresh_backtest_trades_data",
@@ -1,7 +1,9 @@
 # pragma pylint: disable=missing-docstring, protected-access, C0103
 
+import asyncio
 import json
 import logging
+import threading
 import uuid
 from datetime import timedelta
 from pathlib import Path
@@ -9,13 +11,14 @@ from shutil import copyfile
 from unittest.mock import MagicMock, PropertyMock
 
 import pytest
-from pandas import DataFrame
+from pandas import DataFrame, Timedelta, Timestamp
 from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import DATETIME_PRINT_FORMAT
-from freqtrade.data.converter import ohlcv_to_dataframe
-from freqtrade.data.history import get_datahandler
+from freqtrade.data.converter import ohlcv_resample, ohlcv_to_dataframe
+from freqtrade.data.history import get_datahandler, set_ohlcv_cache_size
+from freqtrade.data.history.datahandlers.featherdatahandler import FeatherDataHandler
 from freqtrade.data.history.datahandlers.jsondatahandler import JsonDataHandler, JsonGzDataHandler
 from freqtrade.data.history.history_utils import (
     _download_pair_history,
@@ -37,6 +40,7 @@ from freqtrade.util import dt_ts, dt_utc
 from tests.conftest import (
     CURRENT_TEST_STRATEGY,
     EXMS,
+    generate_test_data,
     get_patched_exchange,
     log_has,
     log_has_re,
@@ -357,6 +361,10 @@ def test_download_pair_history2(mocker, default_conf, testdatadir, ohlcv_history
         "freqtrade.data.history.datahandlers.featherdatahandler.FeatherDataHandler.ohlcv_store",
         return_value=None,
     )
+    append_mock = mocker.patch(
+        "freqtrade.data.history.datahandlers.featherdatahandler.FeatherDataHandler.ohlcv_append",
+        return_value=None,
+    )
     exchange = get_patched_exchange(mocker, default_conf)
     mocker.patch.object(exchange, "get_historic_ohlcv", return_value=ohlcv_history)
     _download_pair_history(
@@ -380,7 +388,10 @@ def test_download_pair_history2(mocker, default_conf, testdatadir, ohlcv_history
         timeframe="1h",
         candle_type="mark",
     )
-    assert json_dump_mock.call_count == 3
+    # Existing data is only appended to
+    assert json_dump_mock.call_count == 2
+    assert append_mock.call_count == 1
+    assert append_mock.call_args_list[0][0][:2] == ("UNITTEST/BTC", "1m")
 
 
 def test_download_backtesting_data_exception(mocker, caplog, default_conf, tmp_path) -> None:
@@ -435,6 +446,95 @@ def test_load_partial_missing(testdatadir, caplog) -> None:
     )
 
 
+def test_load_data_n_jobs(testdatadir) -> None:
+    pairs = ["UNITTEST/BTC", "NOPAIR/XXX", "XLM/BTC", "TRX/BTC", "ADA/BTC"]
+    timerange = TimeRange.parse_timerange("20180110-20180113")
+    expected = load_data(testdatadir, "5m", pairs, timerange=timerange, startup_candles=20)
+    data = load_data(testdatadir, "5m", pairs, timerange=timerange, startup_candles=20, n_jobs=3)
+    # Same pair order as the sequential loading - pairs without data are skipped
+    assert list(data) == list(expected) == ["UNITTEST/BTC", "XLM/BTC", "TRX/BTC", "ADA/BTC"]
+    for pair, df in data.items():
+        assert_frame_equal(df, expected[pair])
+
+
+def test_load_data_ohlcv_cache(mocker, tmp_path, testdatadir) -> None:
+    copyfile(testdatadir / "UNITTEST_BTC-5m.feather", tmp_path / "UNITTEST_BTC-5m.feather")
+    load_mock = mocker.spy(FeatherDataHandler, "_ohlcv_load")
+    timerange = TimeRange.parse_timerange("20180110-20180113")
+    try:
+        set_ohlcv_cache_size(10)
+        data = load_data(tmp_path, "5m", ["UNITTEST/BTC"], timerange=timerange)
+        assert load_mock.call_count == 1
+        # Cached data is not modified by callers
+        data["UNITTEST/BTC"].loc[:, "close"] = 0.0
+        data2 = load_data(tmp_path, "5m", ["UNITTEST/BTC"], timerange=timerange)
+        assert load_mock.call_count == 1
+        assert (data2["UNITTEST/BTC"]["close"] > 0).all()
+
+        # Other timeranges are loaded separately
+        load_data(tmp_path, "5m", ["UNITTEST/BTC"])
+        assert load_mock.call_count == 2
+
+        # Changed files are loaded again
+        dh = get_datahandler(tmp_path, "feather")
+        dh.ohlcv_append(
+            "UNITTEST/BTC", "5m", generate_test_data("5m", 10, "2018-02-01"), CandleType.SPOT
+        )
+        data3 = load_data(tmp_path, "5m", ["UNITTEST/BTC"])
+        assert load_mock.call_count == 3
+        assert data3["UNITTEST/BTC"].iloc[-1]["date"] == Timestamp("2018-02-01 00:45", tz="UTC")
+
+        # Disabling the cache drops cached data
+        set_ohlcv_cache_size(0)
+        load_data(tmp_path, "5m", ["UNITTEST/BTC"])
+        assert load_mock.call_count == 4
+    finally:
+        set_ohlcv_cache_size(0)
+
+
+def test_load_data_base_timeframe(mocker, tmp_path) -> None:
+    dh = get_datahandler(tmp_path, "feather")
+    data_1m = generate_test_data("1m", 3 * 1440, "2018-01-10")
+    dh.ohlcv_store("UNITTEST/BTC", "1m", data_1m, CandleType.SPOT)
+    stored_1h = generate_test_data("1h", 72, "2018-01-10")
+    dh.ohlcv_store("UNITTEST/BTC", "1h", stored_1h, CandleType.SPOT)
+    dh.ohlcv_store("XRP/BTC", "1h", stored_1h, CandleType.SPOT)
+    timerange = TimeRange.parse_timerange("20180111-20180113")
+
+    data = load_data(
+        tmp_path, "1h", ["UNITTEST/BTC", "XRP/BTC"], timerange=timerange, base_timeframe="1m"
+    )
+    expected = ohlcv_resample(data_1m, "1m", "1h")
+    expected = expected.loc[expected["date"] >= timerange.startdt].reset_index(drop=True)
+    assert_frame_equal(data["UNITTEST/BTC"], expected, check_dtype=False)
+    # Falls back to the stored timeframe without base data
+    assert_frame_equal(
+        data["XRP/BTC"],
+        stored_1h.loc[stored_1h["date"] >= timerange.startdt].reset_index(drop=True),
+    )
+
+    # The base timeframe itself, and lower timeframes are loaded from their own files
+    data = load_data(tmp_path, "1m", ["UNITTEST/BTC"], timerange=timerange, base_timeframe="1h")
+    assert data["UNITTEST/BTC"]["date"].diff().iat[1] == Timedelta("1m")
+
+    load_mock = mocker.spy(FeatherDataHandler, "_ohlcv_load")
+    try:
+        set_ohlcv_cache_size(10)
+        data_4h = load_data(tmp_path, "4h", ["UNITTEST/BTC"], base_timeframe="1m")
+        assert load_mock.call_count == 1
+        assert load_mock.call_args_list[0][0][2] == "1m"
+        # Aggregated data is cached per timeframe
+        assert_frame_equal(
+            load_data(tmp_path, "4h", ["UNITTEST/BTC"], base_timeframe="1m")["UNITTEST/BTC"],
+            data_4h["UNITTEST/BTC"],
+        )
+        assert load_mock.call_count == 1
+        load_data(tmp_path, "1h", ["UNITTEST/BTC"], base_timeframe="1m")
+        assert load_mock.call_count == 2
+    finally:
+        set_ohlcv_cache_size(0)
+
+
 def test_init(default_conf) -> None:
     assert {} == load_data(datadir=Path(), pairs=[], timeframe=default_conf["timeframe"])
 
@@ -571,6 +671,60 @@ def test_refresh_backtest_ohlcv_data(
         assert log_has_re(r"Downloading pair ETH/BTC, mark, interval 4h\.", caplog)
 
 
+@pytest.mark.parametrize("trademode,callcount", [("spot", 4), ("futures", 8)])
+def test_refresh_backtest_ohlcv_data_concurrent(
+    mocker, default_conf, markets, tmp_path, ohlcv_history, trademode, callcount
+):
+    mocker.patch(f"{EXMS}.markets", PropertyMock(return_value=markets))
+    default_conf["trading_mode"] = trademode
+    ex = get_patched_exchange(mocker, default_conf, exchange="bybit")
+
+    running = 0
+    max_running = 0
+    threads = set()
+
+    async def get_historic_ohlcv(pair, timeframe, since_ms, candle_type, **kwargs):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return ohlcv_history
+
+    def ohlcv_store(*args, **kwargs):
+        threads.add(threading.current_thread().name)
+
+    dl_mock = mocker.patch(
+        f"{EXMS}._async_get_historic_ohlcv_df", MagicMock(side_effect=get_historic_ohlcv)
+    )
+    store_mock = mocker.patch(
+        "freqtrade.data.history.datahandlers.featherdatahandler.FeatherDataHandler.ohlcv_store",
+        side_effect=ohlcv_store,
+    )
+    unav_pairs = refresh_backtest_ohlcv_data(
+        exchange=ex,
+        pairs=["ETH/BTC", "XRP/BTC", "NOPAIR/BTC"],
+        timeframes=["1m", "5m"],
+        datadir=tmp_path,
+        timerange=TimeRange.parse_timerange("20190101-20190102"),
+        trading_mode=trademode,
+        download_jobs=3,
+    )
+    assert unav_pairs == ["NOPAIR/BTC: Pair not available on exchange."]
+    assert dl_mock.call_count == callcount
+    assert store_mock.call_count == callcount
+    assert max_running == 3
+    # Data is stored in the storage thread
+    assert len(threads) == 1
+    assert threads.pop().startswith("storage")
+    downloaded = {
+        (c[1]["pair"], c[1]["timeframe"], c[1]["candle_type"]) for c in dl_mock.call_args_list
+    }
+    assert ("XRP/BTC", "5m", CandleType.get_default(trademode)) in downloaded
+    if trademode == "futures":
+        assert ("ETH/BTC", "8h", CandleType.FUNDING_RATE) in downloaded
+
+
 def test_download_data_no_markets(mocker, default_conf, caplog, testdatadir):
     dl_mock = mocker.patch(
         "freqtrade.data.history.history_utils._download_pair_history", MagicMock()
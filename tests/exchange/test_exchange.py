@@ -1,5 +1,6 @@
 import copy
 import logging
+import pickle
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 from random import randint
@@ -9,6 +10,7 @@ import ccxt
 import pytest
 from numpy import nan
 from pandas import DataFrame, to_datetime
+from pandas.testing import assert_frame_equal
 
 from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS
 from freqtrade.enums import CandleType, MarginMode, RunMode, TradingMode
@@ -29,6 +31,7 @@ from freqtrade.exchange import (
     Exchange,
     Kraken,
     market_is_active,
+    timeframe_to_msecs,
     timeframe_to_prev_date,
 )
 from freqtrade.exchange.common import (
@@ -38,9 +41,10 @@ from freqtrade.exchange.common import (
     remove_exchange_credentials,
 )
 from freqtrade.resolvers.exchange_resolver import ExchangeResolver
-from freqtrade.util import dt_now, dt_ts
+from freqtrade.util import dt_from_ts, dt_now, dt_ts
 from tests.conftest import (
     EXMS,
+    generate_test_data,
     generate_test_data_raw,
     get_mock_coro,
     get_patched_exchange,
@@ -230,6 +234,22 @@ def test_destroy(default_conf, mocker, caplog):
     assert log_has("Exchange object destroyed, closing async loop", caplog)
 
 
+def test_exchange_pickle(default_conf, mocker):
+    ex = get_patched_exchange(mocker, default_conf)
+    restored = pickle.loads(pickle.dumps(ex))
+
+    assert restored.markets == ex.markets
+    assert restored._api is None
+    assert restored._api_async is None
+    assert restored.loop is not ex.loop
+    assert not restored.loop.is_closed()
+    # The pickled instance remains usable
+    assert ex._api is not None
+    assert ex._api_async is not None
+    assert not ex.loop.is_closed()
+    restored.close()
+
+
 def test_init_exception(default_conf, mocker):
     default_conf["exchange"]["name"] = "wrong_exchange_name"
 
@@ -2589,60 +2609,83 @@ def test_refresh_latest_ohlcv_cache(mocker, default_conf, candle_type, time_mach
 
 def test_refresh_ohlcv_with_cache(mocker, default_conf, time_machine) -> None:
     start = datetime(2021, 8, 1, 0, 0, 0, 0, tzinfo=timezone.utc)
-    ohlcv = generate_test_data_raw("1h", 100, start.strftime("%Y-%m-%d"))
-    time_machine.move_to(start, tick=False)
-    pairs = [
-        ("ETH/BTC", "1d", CandleType.SPOT),
-        ("TKN/BTC", "1d", CandleType.SPOT),
-        ("LTC/BTC", "1d", CandleType.SPOT),
-        ("LTC/BTC", "5m", CandleType.SPOT),
-        ("LTC/BTC", "1h", CandleType.SPOT),
-    ]
+    time_machine.move_to(start + timedelta(minutes=30), tick=False)
+    pairs_1d = [("ETH/BTC", "1d", CandleType.SPOT), ("TKN/BTC", "1d", CandleType.SPOT)]
+    pairs_1h = [("LTC/BTC", "1h", CandleType.SPOT)]
+
+    def refresh_latest_ohlcv(pair_list, *, since_ms, cache):
+        # Closed candles since since_ms
+        return {
+            p: generate_test_data(
+                p[1],
+                (dt_ts(timeframe_to_prev_date(p[1])) - since_ms) // timeframe_to_msecs(p[1]),
+                dt_from_ts(since_ms),
+            )
+            for p in pair_list
+        }
 
-    ohlcv_data = {p: ohlcv for p in pairs}
-    ohlcv_mock = mocker.patch(f"{EXMS}.refresh_latest_ohlcv", return_value=ohlcv_data)
-    mocker.patch(f"{EXMS}.ohlcv_candle_limit", return_value=100)
+    def since(timeframe, candles):
+        return dt_ts(timeframe_to_prev_date(timeframe)) - candles * timeframe_to_msecs(timeframe)
+
+    ohlcv_mock = mocker.patch(f"{EXMS}.refresh_latest_ohlcv", side_effect=refresh_latest_ohlcv)
     exchange = get_patched_exchange(mocker, default_conf)
 
-    assert len(exchange._expiring_candle_cache) == 0
+    assert len(exchange._pairlist_candles) == 0
 
-    res = exchange.refresh_ohlcv_with_cache(pairs, start.timestamp())
+    res = exchange.refresh_ohlcv_with_cache(pairs_1d, since("1d", 10))
     assert ohlcv_mock.call_count == 1
-    assert ohlcv_mock.call_args_list[0][0][0] == pairs
-    assert len(ohlcv_mock.call_args_list[0][0][0]) == 5
-
-    assert len(res) == 5
-    # length of 3 - as we have 3 different timeframes
-    assert len(exchange._expiring_candle_cache) == 3
+    assert ohlcv_mock.call_args_list[0][0][0] == pairs_1d
+    assert ohlcv_mock.call_args_list[0][1]["since_ms"] == since("1d", 10)
+    assert len(res) == 2
+    assert len(res[pairs_1d[0]]) == 10
 
+    # Shorter lookback - served from the stored candles
     ohlcv_mock.reset_mock()
-    res = exchange.refresh_ohlcv_with_cache(pairs, start.timestamp())
+    res_short = exchange.refresh_ohlcv_with_cache(pairs_1d, since("1d", 3))
     assert ohlcv_mock.call_count == 0
+    assert len(res_short[pairs_1d[0]]) == 3
+    assert_frame_equal(res_short[pairs_1d[0]], res[pairs_1d[0]].tail(3).reset_index(drop=True))
 
-    # Expire 5m cache
-    time_machine.move_to(start + timedelta(minutes=6), tick=False)
+    # Longer lookback - all candles are downloaded again
+    res = exchange.refresh_ohlcv_with_cache(pairs_1d, since("1d", 20))
+    assert ohlcv_mock.call_count == 1
+    assert len(res[pairs_1d[0]]) == 20
 
     ohlcv_mock.reset_mock()
-    res = exchange.refresh_ohlcv_with_cache(pairs, start.timestamp())
+    res = exchange.refresh_ohlcv_with_cache(pairs_1h, since("1h", 5))
     assert ohlcv_mock.call_count == 1
-    assert len(ohlcv_mock.call_args_list[0][0][0]) == 1
-
-    # Expire 5m and 1h cache
-    time_machine.move_to(start + timedelta(hours=2), tick=False)
+    assert len(res[pairs_1h[0]]) == 5
+    assert res[pairs_1h[0]]["date"].iat[-1] == start - timedelta(hours=1)
 
+    # New 1h candle - only the 1h candles are extended, by the new candles
+    time_machine.move_to(start + timedelta(hours=1, minutes=30), tick=False)
     ohlcv_mock.reset_mock()
-    res = exchange.refresh_ohlcv_with_cache(pairs, start.timestamp())
+    exchange.refresh_ohlcv_with_cache(pairs_1d, since("1d", 20))
+    assert ohlcv_mock.call_count == 0
+    res = exchange.refresh_ohlcv_with_cache(pairs_1h, since("1h", 5))
     assert ohlcv_mock.call_count == 1
-    assert len(ohlcv_mock.call_args_list[0][0][0]) == 2
-
-    # Expire all caches
-    time_machine.move_to(start + timedelta(days=1, hours=2), tick=False)
+    assert ohlcv_mock.call_args_list[0][1]["since_ms"] == dt_ts(start - timedelta(hours=1))
+    assert len(res[pairs_1h[0]]) == 5
+    assert res[pairs_1h[0]]["date"].iat[-1] == start
+    assert len(exchange._pairlist_candles[pairs_1h[0]][2]) == 5
 
+    # New 1d candle
+    time_machine.move_to(start + timedelta(days=1, minutes=30), tick=False)
     ohlcv_mock.reset_mock()
-    res = exchange.refresh_ohlcv_with_cache(pairs, start.timestamp())
+    res = exchange.refresh_ohlcv_with_cache(pairs_1d, since("1d", 20))
     assert ohlcv_mock.call_count == 1
-    assert len(ohlcv_mock.call_args_list[0][0][0]) == 5
-    assert ohlcv_mock.call_args_list[0][0][0] == pairs
+    assert ohlcv_mock.call_args_list[0][1]["since_ms"] == dt_ts(start - timedelta(days=1))
+    assert len(res[pairs_1d[0]]) == 20
+    assert res[pairs_1d[0]]["date"].iat[-1] == start
+    assert res[pairs_1d[0]]["date"].is_monotonic_increasing
+
+    # Failed downloads keep the stored candles
+    time_machine.move_to(start + timedelta(days=2, minutes=30), tick=False)
+    ohlcv_mock.side_effect = None
+    ohlcv_mock.return_value = {}
+    res = exchange.refresh_ohlcv_with_cache(pairs_1d, since("1d", 20))
+    assert len(res[pairs_1d[0]]) == 20
+    assert res[pairs_1d[0]]["date"].iat[-1] == start
 
 
 @pytest.mark.parametrize("exchange_name", EXCHANGES)
@@ -72,7 +72,7 @@ async def test_exchangews_ohlcv(mocker, time_machine, caplog):
     async def sleeper(*args, **kwargs):
         # pass
         await asyncio.sleep(0.12)
-        return MagicMock()
+        return []
 
     ccxt_object.un_watch_ohlcv_for_symbols = AsyncMock(side_effect=NotSupported)
 
@@ -197,3 +197,39 @@ async def test_exchangews_get_ohlcv(mocker, caplog):
     assert log_has_re(msg, caplog)
 
     exchange_ws.cleanup()
+
+
+def test_exchangews_candle_closed(mocker):
+    config = {"timeframe": "1m"}
+    ccxt_object = MagicMock()
+    mocker.patch("freqtrade.exchange.exchange_ws.ExchangeWS._start_forever", MagicMock())
+
+    exchange_ws = ExchangeWS(config, ccxt_object)
+    paircomb = ("ETH/USDT", "1m", CandleType.SPOT)
+    candles = [
+        [1635840000000, 100, 200, 300, 400, 500],
+        [1635840060000, 101, 201, 301, 401, 501],
+    ]
+    # First candles received - nothing to compare against
+    exchange_ws._register_candle(paircomb, candles[:1])
+    assert not exchange_ws.candle_closed.is_set()
+    exchange_ws._register_candle(paircomb, [])
+    # Update of the same candle
+    exchange_ws._register_candle(paircomb, candles[:1])
+    assert not exchange_ws.candle_closed.is_set()
+
+    exchange_ws._register_candle(paircomb, candles)
+    assert exchange_ws.candle_closed.is_set()
+
+    exchange_ws.candle_closed.clear()
+    exchange_ws._pop_history(paircomb)
+    exchange_ws._register_candle(paircomb, candles)
+    assert not exchange_ws.candle_closed.is_set()
+
+    # Other timeframes (e.g. informative pairs) don't signal a new candle
+    paircomb_5m = ("ETH/USDT", "5m", CandleType.SPOT)
+    exchange_ws._register_candle(paircomb_5m, candles[:1])
+    exchange_ws._register_candle(paircomb_5m, candles)
+    assert not exchange_ws.candle_closed.is_set()
+
+    exchange_ws.cleanup()
@@ -1,4 +1,5 @@
 import logging
+import threading
 import time
 from datetime import timedelta
 from unittest.mock import MagicMock, PropertyMock
@@ -200,6 +201,79 @@ def test_throttle_sleep_time(mocker, default_conf, caplog) -> None:
         assert 11.1 < sleep_mock.call_args[0][0] < 13.2
 
 
+@pytest.mark.parametrize("use_ws", [True, False])
+def test_worker_event_driven(mocker, default_conf, use_ws) -> None:
+    default_conf["internals"] = {"event_driven": True}
+    worker = get_patched_worker(mocker, default_conf)
+    process = mocker.patch("freqtrade.freqtradebot.FreqtradeBot.process")
+    process_trades = mocker.patch("freqtrade.freqtradebot.FreqtradeBot.process_trades")
+    sleep_mock = mocker.patch("freqtrade.worker.Worker._sleep")
+    event = threading.Event()
+    mocker.patch(f"{EXMS}.candle_closed", PropertyMock(return_value=event if use_ws else None))
+
+    with time_machine.travel("2022-09-01 05:00:01 +00:00") as t:
+        # Full iteration once per candle
+        worker._process_running()
+        assert process.call_count == 1
+        assert process_trades.call_count == 0
+        t.shift(timedelta(minutes=2))
+        worker._process_running()
+        assert process.call_count == 1
+        assert process_trades.call_count == 1
+
+        t.move_to("2022-09-01 05:05:01 +00:00")
+        worker._process_running()
+        assert process.call_count == 2
+        assert process_trades.call_count == 1
+
+        if use_ws:
+            # Woken up by the websocket once a new candle closed
+            t.move_to("2022-09-01 05:10:01 +00:00")
+            event.set()
+            worker._wait(10)
+            assert not event.is_set()
+            assert sleep_mock.call_count == 0
+        else:
+            worker._wait(10)
+            assert sleep_mock.call_count == 1
+
+
+def test_worker_event_driven_same_candle(mocker, default_conf) -> None:
+    default_conf["internals"] = {"event_driven": True}
+    worker = get_patched_worker(mocker, default_conf)
+    mocker.patch("freqtrade.freqtradebot.FreqtradeBot.process")
+    event = threading.Event()
+    mocker.patch(f"{EXMS}.candle_closed", PropertyMock(return_value=event))
+
+    with time_machine.travel("2022-09-01 05:00:01 +00:00", tick=False):
+        worker._process_running()
+
+        def set_repeatedly():
+            for _ in range(5):
+                event.set()
+                time.sleep(0.02)
+
+        thread = threading.Thread(target=set_repeatedly)
+        start = time.monotonic()
+        thread.start()
+        # Signals for the already processed candle don't end the sleep early
+        worker._wait(0.3)
+        assert time.monotonic() - start >= 0.3
+        thread.join()
+        assert not event.is_set()
+
+
+def test_worker_event_driven_process_only_new_candles(mocker, default_conf, caplog) -> None:
+    default_conf["internals"] = {"event_driven": True}
+    default_conf["process_only_new_candles"] = False
+    worker = get_patched_worker(mocker, default_conf)
+    process = mocker.patch("freqtrade.freqtradebot.FreqtradeBot.process")
+    assert log_has_re(r"Event driven bot loop requires `process_only_new_candles`.*", caplog)
+    worker._process_running()
+    worker._process_running()
+    assert process.call_count == 2
+
+
 def test_throttle_with_assets(mocker, default_conf) -> None:
     def throttled_func(nb_assets=-1):
         return nb_assets
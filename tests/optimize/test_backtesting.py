@@ -2,6 +2,7 @@
 
 import random
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -10,6 +11,7 @@ from unittest.mock import ANY, MagicMock, PropertyMock
 import numpy as np
 import pandas as pd
 import pytest
+from joblib.externals import cloudpickle
 
 from freqtrade import constants
 from freqtrade.commands.optimize_commands import setup_optimize_configuration, start_backtesting
@@ -22,11 +24,18 @@ from freqtrade.data.history import get_timerange
 from freqtrade.enums import CandleType, ExitType, RunMode
 from freqtrade.exceptions import DependencyException, OperationalException
 from freqtrade.exchange import timeframe_to_next_date, timeframe_to_prev_date
-from freqtrade.optimize.backtest_caching import get_backtest_metadata_filename, get_strategy_run_id
+from freqtrade.optimize.backtest_caching import (
+    get_backtest_metadata_filename,
+    get_data_fingerprint,
+    get_strategy_run_id,
+    load_backtest_state,
+)
+from freqtrade.optimize.backtest_workers import init_worker
 from freqtrade.optimize.backtesting import Backtesting
 from freqtrade.persistence import LocalTrade, Trade
 from freqtrade.resolvers import StrategyResolver
-from freqtrade.util.datetime_helpers import dt_utc
+from freqtrade.strategy.interface import IStrategy
+from freqtrade.util.datetime_helpers import dt_ts, dt_utc
 from tests.conftest import (
     CURRENT_TEST_STRATEGY,
     EXMS,
@@ -1922,6 +1931,174 @@ def test_backtest_multi_pair_long_short_switch(
     assert len(results["results"]) == 53
 
 
+@pytest.mark.parametrize("use_detail", [True, False])
+@pytest.mark.parametrize("tres", [0, 30])
+@pytest.mark.parametrize("gap", [False, True])
+def test_backtest_columnar_engine(default_conf_usdt, fee, mocker, use_detail, tres, gap):
+    def _trend_sparse(dataframe=None, metadata=None):
+        multi = 20 if metadata["pair"] in ("ETH/USDT", "LTC/USDT") else 27
+        dataframe["enter_long"] = np.where(dataframe.index % multi == 0, 1, 0)
+        dataframe["exit_long"] = np.where((dataframe.index + multi - 7) % multi == 0, 1, 0)
+        dataframe["enter_short"] = 0
+        dataframe["exit_short"] = 0
+        dataframe["enter_tag"] = np.where(dataframe.index % 2 == 0, "even", None)
+        return dataframe
+
+    default_conf_usdt.update(
+        {
+            "runmode": "backtest",
+            "stoploss": -0.05,
+            "minimal_roi": {"0": 0.03, "60": 0.01},
+            "timeframe": "5m",
+            "max_open_trades": 2,
+        }
+    )
+    if use_detail:
+        default_conf_usdt["timeframe_detail"] = "1m"
+
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    patch_exchange(mocker)
+
+    raw_candles_1m = generate_test_data("1m", 3000, "2022-01-03 12:00:00+00:00")
+    raw_candles = ohlcv_fill_up_missing_data(raw_candles_1m, "5m", "dummy")
+
+    pairs = ["ADA/USDT", "DASH/USDT", "ETH/USDT", "LTC/USDT", "NXT/USDT"]
+    data = trim_dictlist({pair: raw_candles for pair in pairs}, -500)
+    if tres > 0:
+        data["LTC/USDT"] = data["LTC/USDT"][tres:].reset_index()
+    if gap:
+        # Missing candles in the middle of the data
+        data["ETH/USDT"] = data["ETH/USDT"].drop(range(200, 210)).reset_index(drop=True)
+
+    results = {}
+    for engine in ("classic", "columnar"):
+        default_conf_usdt["backtest_engine"] = engine
+        backtesting = Backtesting(default_conf_usdt)
+        backtesting.detail_data = {pair: raw_candles_1m for pair in pairs}
+        backtesting._set_strategy(backtesting.strategylist[0])
+        backtesting.strategy.advise_entry = _trend_sparse
+        backtesting.strategy.advise_exit = _trend_sparse
+
+        processed = backtesting.strategy.advise_all_indicators(data)
+        min_date, max_date = get_timerange(processed)
+        results[engine] = backtesting.backtest(
+            processed=deepcopy(processed), start_date=min_date, end_date=max_date
+        )
+        for pair in pairs:
+            assert (
+                len(backtesting.dataprovider.get_analyzed_dataframe(pair, "5m")[0])
+                == len(data[pair]) - 1
+            )
+
+    classic = results["classic"]["results"]
+    columnar = results["columnar"]["results"]
+    assert len(classic) > 10
+    pd.testing.assert_frame_equal(classic, columnar)
+    assert results["classic"]["final_balance"] == results["columnar"]["final_balance"]
+    assert results["classic"]["rejected_signals"] == results["columnar"]["rejected_signals"]
+
+
+@pytest.mark.parametrize(
+    "trailing,use_exit_signal",
+    [
+        ({}, True),
+        ({}, False),
+        ({"trailing_stop": True}, True),
+        (
+            {
+                "trailing_stop": True,
+                "trailing_stop_positive": 0.01,
+                "trailing_stop_positive_offset": 0.02,
+                "trailing_only_offset_is_reached": True,
+            },
+            False,
+        ),
+    ],
+)
+def test_backtest_columnar_exit_prescan(default_conf_usdt, fee, mocker, trailing, use_exit_signal):
+    def _sparse(dataframe=None, metadata=None):
+        dataframe["enter_long"] = np.where(dataframe.index % 97 == 0, 1, 0)
+        dataframe["exit_long"] = np.where(dataframe.index % 97 == 60, 1, 0)
+        dataframe["enter_short"] = 0
+        dataframe["exit_short"] = 0
+        return dataframe
+
+    default_conf_usdt.update(
+        {
+            "runmode": "backtest",
+            "stoploss": -0.05,
+            "minimal_roi": {"0": 0.08, "120": 0.04, "240": 0.02},
+            "timeframe": "5m",
+            "max_open_trades": 2,
+            "use_exit_signal": use_exit_signal,
+            **trailing,
+        }
+    )
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    patch_exchange(mocker)
+
+    raw_candles = generate_test_data("5m", 2000, "2022-01-03 12:00:00+00:00")
+    pairs = ["ADA/USDT", "ETH/USDT", "LTC/USDT"]
+    data = trim_dictlist({pair: raw_candles for pair in pairs}, -1500)
+
+    results = {}
+    loop_calls = {}
+    for engine in ("classic", "columnar"):
+        default_conf_usdt["backtest_engine"] = engine
+        backtesting = Backtesting(default_conf_usdt)
+        backtesting._set_strategy(backtesting.strategylist[0])
+        backtesting.strategy.advise_entry = _sparse
+        backtesting.strategy.advise_exit = _sparse
+        # Use the default (no-op) position adjustment, so the pre-scan can be used.
+        backtesting.strategy.adjust_trade_position = IStrategy.adjust_trade_position.__get__(
+            backtesting.strategy
+        )
+        assert backtesting._exit_prescan_available()
+        backtest_loop = mocker.spy(backtesting, "backtest_loop")
+
+        processed = backtesting.strategy.advise_all_indicators(data)
+        min_date, max_date = get_timerange(processed)
+        results[engine] = backtesting.backtest(
+            processed=deepcopy(processed), start_date=min_date, end_date=max_date
+        )
+        loop_calls[engine] = backtest_loop.call_count
+
+    classic = results["classic"]["results"]
+    columnar = results["columnar"]["results"]
+    assert len(classic) > 10
+    pd.testing.assert_frame_equal(classic, columnar)
+    assert results["classic"]["final_balance"] == results["columnar"]["final_balance"]
+    # Trades which can't exit are not visited on every candle.
+    assert loop_calls["columnar"] < loop_calls["classic"] / 2
+
+
+def test_backtest_columnar_bot_loop_start(default_conf, fee, mocker, testdatadir):
+    default_conf.update({"runmode": "backtest", "backtest_engine": "columnar"})
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    patch_exchange(mocker)
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    data = trim_dictlist(
+        history.load_data(datadir=testdatadir, timeframe="5m", pairs=["UNITTEST/BTC"]), -200
+    )
+    processed = backtesting.strategy.advise_all_indicators(data)
+    min_date, max_date = get_timerange(processed)
+
+    backtesting.backtest(processed=deepcopy(processed), start_date=min_date, end_date=max_date)
+    assert backtesting.progress.progress == 1
+
+    # Strategies implementing bot_loop_start still see every candle.
+    backtesting.strategy.bot_loop_start = MagicMock()
+    backtesting.backtest(processed=deepcopy(processed), start_date=min_date, end_date=max_date)
+    assert backtesting.strategy.bot_loop_start.call_count == 199
+
+
 def test_backtest_start_timerange(default_conf, mocker, caplog, testdatadir):
     patch_exchange(mocker)
     mocker.patch("freqtrade.optimize.backtesting.Backtesting.backtest")
@@ -2649,6 +2826,19 @@ def test_get_strategy_run_id(default_conf_usdt):
     x = get_strategy_run_id(strategy)
     assert isinstance(x, str)
 
+    # Settings which only affect speed don't change the run id
+    strategy.config.update(
+        {
+            "backtest_strategy_jobs": 4,
+            "indicator_jobs": 4,
+            "data_load_jobs": 4,
+            "ohlcv_cache_size": 100,
+        }
+    )
+    assert get_strategy_run_id(strategy) == x
+    strategy.config["max_open_trades"] = 5
+    assert get_strategy_run_id(strategy) != x
+
 
 def test_get_backtest_metadata_filename():
     # Test with a file path
@@ -2690,3 +2880,233 @@ def test_get_backtest_metadata_filename():
     filename = "backtest_results_zip.zip"
     expected = Path("backtest_results_zip.meta.json")
     assert get_backtest_metadata_filename(filename) == expected
+
+
+def test_backtest_start_multi_strat_parallel(default_conf, mocker, testdatadir):
+    def get_thread_pool(backtesting, n_jobs, data_dir, detail_dir):
+        # One thread instead of processes, so mocks stay active - but pickle like loky does.
+        copy = cloudpickle.loads(cloudpickle.dumps(backtesting))
+        return ThreadPoolExecutor(
+            max_workers=1, initializer=init_worker, initargs=(copy, data_dir, detail_dir)
+        )
+
+    patch_exchange(mocker)
+    show_mock = mocker.patch("freqtrade.optimize.backtesting.show_backtest_results")
+    pool_mock = mocker.patch(
+        "freqtrade.optimize.backtesting.get_worker_pool", side_effect=get_thread_pool
+    )
+    mocker.patch(
+        "freqtrade.plugins.pairlistmanager.PairListManager.whitelist",
+        PropertyMock(return_value=["ETH/BTC", "LTC/BTC"]),
+    )
+    patched_configuration_load_config_file(mocker, default_conf)
+    strategy_list = [CURRENT_TEST_STRATEGY, "StrategyTestV2"]
+
+    results = {}
+    for jobs in ("1", "2"):
+        args = [
+            "backtesting",
+            "--config",
+            "config.json",
+            "--datadir",
+            str(testdatadir),
+            "--strategy-path",
+            str(Path(__file__).parents[1] / "strategy/strats"),
+            "--timeframe",
+            "5m",
+            "--timerange",
+            "20180110-20180130",
+            "--export",
+            "none",
+            "--strategy-list",
+            *strategy_list,
+            "--strategy-jobs",
+            jobs,
+        ]
+        start_backtesting(get_args(args))
+        results[jobs] = show_mock.call_args[0][1]
+
+    assert pool_mock.call_count == 1
+    assert list(results["2"]["strategy"]) == strategy_list
+    for strategy in strategy_list:
+        sequential = results["1"]["strategy"][strategy]
+        parallel = results["2"]["strategy"][strategy]
+        assert sequential["total_trades"] > 0
+        assert parallel["trades"] == sequential["trades"]
+        assert parallel["backtest_start"] == sequential["backtest_start"]
+        assert parallel["backtest_end"] == sequential["backtest_end"]
+
+
+@pytest.mark.parametrize("engine", constants.BACKTEST_ENGINES)
+def test_backtest_resume_from_state(default_conf_usdt, fee, mocker, engine):
+    def _sparse(dataframe=None, metadata=None):
+        dataframe["enter_long"] = np.where(dataframe.index % 97 == 0, 1, 0)
+        dataframe["exit_long"] = np.where(dataframe.index % 97 == 60, 1, 0)
+        dataframe["enter_short"] = 0
+        dataframe["exit_short"] = 0
+        return dataframe
+
+    default_conf_usdt.update(
+        {
+            "runmode": "backtest",
+            "backtest_engine": engine,
+            # Only exit signals close trades
+            "stoploss": -0.99,
+            "minimal_roi": {"0": 10},
+            "max_open_trades": 2,
+        }
+    )
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    patch_exchange(mocker)
+
+    raw_candles = generate_test_data("5m", 2000, "2022-01-03 12:00:00+00:00")
+    data = {pair: raw_candles for pair in ["ADA/USDT", "ETH/USDT", "LTC/USDT"]}
+    backtesting = Backtesting(default_conf_usdt)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    backtesting.strategy.advise_entry = _sparse
+    backtesting.strategy.advise_exit = _sparse
+    processed = backtesting.strategy.advise_all_indicators(data)
+    min_date, max_date = get_timerange(processed)
+    # Trade opened at candle 1164 is still open
+    snapshot_date = raw_candles["date"].iloc[1170].to_pydatetime()
+
+    full = backtesting.backtest(
+        processed=deepcopy(processed), start_date=min_date, end_date=max_date
+    )
+    assert len(full["results"]) > 10
+    assert backtesting._state_snapshot is None
+
+    # First run ends at the snapshot date
+    backtesting.backtest(
+        processed={pair: df[df["date"] <= snapshot_date].copy() for pair, df in processed.items()},
+        start_date=min_date,
+        end_date=snapshot_date,
+        snapshot_date=snapshot_date,
+    )
+    state = backtesting._state_snapshot
+    assert state["date"] == snapshot_date
+    assert len(state["trades"]) > 0
+    assert len(state["trades_open"]) > 0
+
+    resumed = backtesting.backtest(
+        processed=deepcopy(processed),
+        start_date=min_date,
+        end_date=max_date,
+        resume_state=state,
+    )
+    pd.testing.assert_frame_equal(resumed["results"], full["results"])
+    assert resumed["final_balance"] == full["final_balance"]
+    # The state can be used more than once
+    assert backtesting._state_snapshot is None
+    resumed = backtesting.backtest(
+        processed=deepcopy(processed),
+        start_date=min_date,
+        end_date=max_date,
+        resume_state=state,
+        snapshot_date=max_date,
+    )
+    pd.testing.assert_frame_equal(resumed["results"], full["results"])
+    assert backtesting._state_snapshot["date"] == max_date
+
+
+def test_backtest_incremental_cache(default_conf, mocker, testdatadir, tmp_path, caplog):
+    patch_exchange(mocker)
+    mocker.patch(
+        "freqtrade.plugins.pairlistmanager.PairListManager.whitelist",
+        PropertyMock(return_value=["ETH/BTC", "LTC/BTC"]),
+    )
+    default_conf.update(
+        {
+            "datadir": testdatadir,
+            "user_data_dir": tmp_path,
+            "export": "none",
+            "max_open_trades": 1,
+            "timeframe": "5m",
+        }
+    )
+
+    def run_backtest(timerange: str, incremental: bool):
+        conf = deepcopy(default_conf)
+        conf.update({"timerange": timerange, "backtest_incremental_cache": incremental})
+        backtesting = Backtesting(conf)
+        data, timerange = backtesting.load_bt_data()
+        strat = backtesting.strategylist[0]
+        dates = backtesting.backtest_one_strategy(strat, data, timerange)
+        return backtesting.all_bt_content[strat.get_strategy_name()], data, dates
+
+    state_dir = tmp_path / "backtest_results" / "state_cache"
+    run_backtest("20180110-20180120", True)
+    assert len(list(state_dir.glob("backtest-state-*.pkl"))) == 1
+    assert not log_has_re("Continuing cached backtest", caplog)
+
+    resumed, data, dates = run_backtest("20180110-20180128", True)
+    assert log_has("Continuing cached backtest from 2018-01-20 00:00:00.", caplog)
+    full, _, _ = run_backtest("20180110-20180128", False)
+    assert len(full["results"]) > 0
+    pd.testing.assert_frame_equal(resumed["results"], full["results"])
+    assert resumed["final_balance"] == full["final_balance"]
+
+    # Changed candle data
+    state_file = next(state_dir.glob("backtest-state-*.pkl"))
+    cache_key = state_file.stem.removeprefix("backtest-state-")
+    assert load_backtest_state(state_dir, cache_key, *dates, data) is not None
+    data["ETH/BTC"].loc[10, "close"] += 1
+    assert load_backtest_state(state_dir, cache_key, *dates, data) is None
+    assert log_has("Candle data changed since the backtest state was cached, ignoring.", caplog)
+
+    # Changed timerange start
+    caplog.clear()
+    run_backtest("20180111-20180128", True)
+    assert log_has("Backtest state cache doesn't match the timerange, ignoring.", caplog)
+    assert not log_has_re("Continuing cached backtest", caplog)
+
+
+def test_get_data_fingerprint(testdatadir):
+    data = history.load_data(datadir=testdatadir, timeframe="5m", pairs=["UNITTEST/BTC"])
+    end_date = dt_utc(2018, 1, 20)
+    fingerprint = get_data_fingerprint(data, end_date)
+    assert fingerprint["UNITTEST/BTC"]["start"] == dt_ts(dt_utc(2018, 1, 10, 4, 55)) // 1000
+    assert fingerprint["UNITTEST/BTC"]["end"] == dt_ts(dt_utc(2018, 1, 19, 23, 55)) // 1000
+
+    # Candles after end_date don't change the fingerprint
+    changed = {"UNITTEST/BTC": data["UNITTEST/BTC"].copy()}
+    changed["UNITTEST/BTC"].loc[changed["UNITTEST/BTC"].index[-1], "close"] += 1
+    assert get_data_fingerprint(changed, end_date) == fingerprint
+
+    changed["UNITTEST/BTC"].loc[10, "close"] += 1
+    assert get_data_fingerprint(changed, end_date) != fingerprint
+    assert get_data_fingerprint({}, end_date) != fingerprint
+
+
+def test_get_detail_data(default_conf, mocker, testdatadir):
+    default_conf.update({"timeframe": "5m", "timeframe_detail": "1m"})
+    patch_exchange(mocker)
+    backtesting = Backtesting(default_conf)
+    detail = history.load_data(datadir=testdatadir, timeframe="1m", pairs=["UNITTEST/BTC"])
+    backtesting.detail_data = detail
+    candle_date = pd.Timestamp("2017-11-14 21:15:00", tz="UTC")
+    row = [candle_date, 1, 2, 3, 4, 1, 0, 0, 1, "enter_tag", None]
+
+    result = backtesting.get_detail_data("UNITTEST/BTC", row)
+    df = detail["UNITTEST/BTC"]
+    expected = df.loc[
+        (df["date"] >= candle_date) & (df["date"] < candle_date + timedelta(minutes=5)),
+        ["date", "open", "high", "low", "close"],
+    ].values.tolist()
+    assert len(result) == 5
+    assert result == [[*r, 1, 0, 0, 1, "enter_tag", None] for r in expected]
+    assert isinstance(result[0][0], pd.Timestamp)
+
+    # No detail data for this candle
+    assert (
+        backtesting.get_detail_data("UNITTEST/BTC", [candle_date + timedelta(days=1), *row[1:]])
+        is None
+    )
+
+    # Index is rebuilt for new detail data
+    last_candle = [pd.Timestamp("2017-11-14 22:55:00", tz="UTC"), *row[1:]]
+    assert len(backtesting.get_detail_data("UNITTEST/BTC", last_candle)) == 5
+    backtesting.detail_data = {"UNITTEST/BTC": df.iloc[:-2]}
+    assert len(backtesting.get_detail_data("UNITTEST/BTC", last_candle)) == 3
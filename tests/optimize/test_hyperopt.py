@@ -1,9 +1,11 @@
 # pragma pylint: disable=missing-docstring,W0212,C0103
+from concurrent.futures import Future
 from datetime import datetime, timedelta
 from functools import wraps
 from pathlib import Path
 from unittest.mock import ANY, MagicMock, PropertyMock
 
+import numpy as np
 import pandas as pd
 import pytest
 from filelock import Timeout
@@ -11,13 +13,16 @@ from skopt.space import Integer
 
 from freqtrade.commands.optimize_commands import setup_optimize_configuration, start_hyperopt
 from freqtrade.data.history import load_data
-from freqtrade.enums import ExitType, RunMode
+from freqtrade.enums import ExitType, HyperoptState, RunMode
 from freqtrade.exceptions import OperationalException
 from freqtrade.optimize.hyperopt import Hyperopt
 from freqtrade.optimize.hyperopt.hyperopt_auto import HyperOptAuto
-from freqtrade.optimize.hyperopt_tools import HyperoptTools
+from freqtrade.optimize.hyperopt.hyperopt_indicator_cache import IndicatorCache
+from freqtrade.optimize.hyperopt_tools import HyperoptStateContainer, HyperoptTools
 from freqtrade.optimize.optimize_reports import generate_strategy_stats
+from freqtrade.optimize.shared_data_store import SharedDataStore
 from freqtrade.optimize.space import SKDecimal
+from freqtrade.resolvers import StrategyResolver
 from freqtrade.strategy import IntParameter
 from freqtrade.util import dt_utc
 from tests.conftest import (
@@ -338,7 +343,7 @@ def test_params_no_optimize_details(hyperopt) -> None:
 
 
 def test_start_calls_optimizer(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.shared_data_store.SharedDataStore.dump")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch(
         "freqtrade.optimize.hyperopt.hyperopt_optimizer.calculate_market_change", return_value=1.5
@@ -542,7 +547,8 @@ def test_generate_optimizer(mocker, hyperopt_conf) -> None:
     mocker.patch.object(Path, "open")
     mocker.patch("freqtrade.configuration.config_validation.validate_config_schema")
     mocker.patch(
-        "freqtrade.optimize.hyperopt.hyperopt_optimizer.load", return_value={"XRP/BTC": None}
+        "freqtrade.optimize.shared_data_store.SharedDataStore.load",
+        return_value={"XRP/BTC": None},
     )
 
     optimizer_param = {
@@ -620,15 +626,113 @@ def test_clean_hyperopt(mocker, hyperopt_conf, caplog):
         MagicMock(return_value={}),
     )
     mocker.patch("freqtrade.optimize.hyperopt.hyperopt.Path.is_file", MagicMock(return_value=True))
+    mocker.patch("freqtrade.optimize.hyperopt.hyperopt.Path.is_dir", MagicMock(return_value=True))
     unlinkmock = mocker.patch("freqtrade.optimize.hyperopt.hyperopt.Path.unlink", MagicMock())
+    rmtreemock = mocker.patch("freqtrade.optimize.shared_data_store.shutil.rmtree")
     h = Hyperopt(hyperopt_conf)
 
-    assert unlinkmock.call_count == 2
-    assert log_has(f"Removing `{h.data_pickle_file}`.", caplog)
+    assert unlinkmock.call_count == 1
+    assert rmtreemock.call_count == 1
+    assert log_has(f"Removing `{h.data_store.directory}`.", caplog)
+
+
+def test_hyperopt_data_store(tmp_path, testdatadir):
+    data = load_data(testdatadir, "5m", ["UNITTEST/BTC", "ADA/BTC"])
+    data["UNITTEST/BTC"]["enter_tag"] = None
+    data["UNITTEST/BTC"].loc[10, "enter_tag"] = "tag"
+    # Not representable in arrow - falls back to joblib
+    data["ADA/BTC"]["lists"] = [[1, "a"]] * len(data["ADA/BTC"])
+    data["ETH/BTC"] = data["ADA/BTC"].iloc[0:0]
+
+    store = SharedDataStore(tmp_path / "hyperopt_tickerdata")
+    assert not store.exists()
+    store.dump(data)
+    assert store.exists()
+    assert (tmp_path / "hyperopt_tickerdata" / "pair_0.arrow").is_file()
+    assert (tmp_path / "hyperopt_tickerdata" / "pair_1.pkl").is_file()
+
+    loaded = store.load()
+    assert list(loaded.keys()) == ["UNITTEST/BTC", "ADA/BTC", "ETH/BTC"]
+    for pair, df in data.items():
+        pd.testing.assert_frame_equal(loaded[pair], df)
+
+    # Numeric columns are shared, read-only views - changes don't leak into the next load.
+    loaded2 = store.load()
+    assert np.shares_memory(loaded["UNITTEST/BTC"]["close"], loaded2["UNITTEST/BTC"]["close"])
+    assert not loaded["UNITTEST/BTC"]["close"].to_numpy().flags.writeable
+    loaded["UNITTEST/BTC"]["new_col"] = 1
+    loaded["UNITTEST/BTC"].loc[10, "enter_tag"] = "other"
+    loaded3 = store.load()
+    assert "new_col" not in loaded3["UNITTEST/BTC"].columns
+    assert loaded3["UNITTEST/BTC"].loc[10, "enter_tag"] == "tag"
+
+    # New data is picked up
+    store.dump({"ADA/BTC": data["ADA/BTC"]})
+    assert list(store.load().keys()) == ["ADA/BTC"]
+
+    store.clean()
+    assert not store.exists()
+    assert not (tmp_path / "hyperopt_tickerdata").exists()
+
+
+def test_indicator_cache(default_conf, testdatadir):
+    default_conf.update({"strategy": "HyperoptableStrategy"})
+    strategy = StrategyResolver.load_strategy(default_conf)
+    strategy.ft_bot_start()
+    HyperoptStateContainer.set_state(HyperoptState.OPTIMIZE)
+    data = load_data(testdatadir, "5m", ["UNITTEST/BTC"])
+    data["ADA/BTC"] = data["UNITTEST/BTC"].copy()
+
+    def populate_indicators(dataframe, metadata):
+        if metadata["pair"] == "UNITTEST/BTC":
+            dataframe["rsi_buy"] = dataframe["close"].rolling(strategy.buy_rsi.value).mean()
+        else:
+            dataframe["rsi_sell"] = dataframe["close"].rolling(strategy.sell_rsi.value).mean()
+        return dataframe
+
+    strategy.populate_indicators = MagicMock(side_effect=populate_indicators)
+    cache = IndicatorCache(100)
+
+    def check(expected_calls):
+        result = cache.advise_all_indicators(strategy, data)
+        assert strategy.populate_indicators.call_count == expected_calls
+        expected = {
+            "UNITTEST/BTC": data["UNITTEST/BTC"]["close"].rolling(strategy.buy_rsi.value).mean(),
+            "ADA/BTC": data["ADA/BTC"]["close"].rolling(strategy.sell_rsi.value).mean(),
+        }
+        for pair, df in result.items():
+            col = "rsi_buy" if pair == "UNITTEST/BTC" else "rsi_sell"
+            pd.testing.assert_series_equal(df[col], expected[pair], check_names=False)
+        return result
+
+    result = check(2)
+    # Results are copies - changing them doesn't affect the cache
+    result["UNITTEST/BTC"]["rsi_buy"] = 0
+    check(2)
+    # Only UNITTEST/BTC uses buy_rsi
+    strategy.buy_rsi.value = 20
+    check(3)
+    # Unrelated parameter
+    strategy.buy_plusdi.value = 0.2
+    check(3)
+    strategy.sell_rsi.value = 60
+    check(4)
+    # Back to the first values - still cached
+    strategy.buy_rsi.value = 35
+    strategy.sell_rsi.value = 74
+    check(4)
+
+    # Cache limited to one entry
+    cache = IndicatorCache(1)
+    cache.max_size = int(data["UNITTEST/BTC"].memory_usage(index=True).sum() * 1.5)
+    strategy.populate_indicators.reset_mock()
+    check(2)
+    # Least recently used entries are evicted first
+    check(4)
 
 
 def test_print_json_spaces_all(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.shared_data_store.SharedDataStore.dump")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch("freqtrade.optimize.hyperopt.hyperopt.file_dump_json")
     mocker.patch(
@@ -695,7 +799,7 @@ def test_print_json_spaces_all(mocker, hyperopt_conf, capsys) -> None:
 
 
 def test_print_json_spaces_default(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.shared_data_store.SharedDataStore.dump")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch("freqtrade.optimize.hyperopt.hyperopt.file_dump_json")
     mocker.patch(
@@ -752,7 +856,7 @@ def test_print_json_spaces_default(mocker, hyperopt_conf, capsys) -> None:
 
 
 def test_print_json_spaces_roi_stoploss(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.shared_data_store.SharedDataStore.dump")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch(
         "freqtrade.optimize.hyperopt.hyperopt_optimizer.calculate_market_change", return_value=1.5
@@ -807,7 +911,7 @@ def test_print_json_spaces_roi_stoploss(mocker, hyperopt_conf, capsys) -> None:
 
 
 def test_simplified_interface_roi_stoploss(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.shared_data_store.SharedDataStore.dump")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch(
         "freqtrade.optimize.hyperopt.hyperopt_optimizer.calculate_market_change", return_value=1.5
@@ -861,7 +965,7 @@ def test_simplified_interface_roi_stoploss(mocker, hyperopt_conf, capsys) -> Non
 
 
 def test_simplified_interface_all_failed(mocker, hyperopt_conf, caplog) -> None:
-    mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump", MagicMock())
+    mocker.patch("freqtrade.optimize.shared_data_store.SharedDataStore.dump", MagicMock())
     mocker.patch("freqtrade.optimize.hyperopt.hyperopt.file_dump_json")
     mocker.patch(
         "freqtrade.optimize.backtesting.Backtesting.load_bt_data",
@@ -900,7 +1004,7 @@ def test_simplified_interface_all_failed(mocker, hyperopt_conf, caplog) -> None:
 
 
 def test_simplified_interface_buy(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.shared_data_store.SharedDataStore.dump")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch(
         "freqtrade.optimize.hyperopt.hyperopt_optimizer.calculate_market_change", return_value=1.5
@@ -954,7 +1058,7 @@ def test_simplified_interface_buy(mocker, hyperopt_conf, capsys) -> None:
 
 
 def test_simplified_interface_sell(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.shared_data_store.SharedDataStore.dump")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch(
         "freqtrade.optimize.hyperopt.hyperopt_optimizer.calculate_market_change", return_value=1.5
@@ -1020,7 +1124,7 @@ def test_simplified_interface_sell(mocker, hyperopt_conf, capsys) -> None:
     ],
 )
 def test_simplified_interface_failed(mocker, hyperopt_conf, space) -> None:
-    mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump", MagicMock())
+    mocker.patch("freqtrade.optimize.shared_data_store.SharedDataStore.dump", MagicMock())
     mocker.patch("freqtrade.optimize.hyperopt.hyperopt.file_dump_json")
     mocker.patch(
         "freqtrade.optimize.backtesting.Backtesting.load_bt_data",
@@ -1138,6 +1242,90 @@ def test_in_strategy_auto_hyperopt_with_parallel(mocker, hyperopt_conf, tmp_path
     hyperopt.start()
 
 
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+@pytest.mark.parametrize("scheduler", ["hyperopt_persistent_workers", "hyperopt_async_scheduler"])
+def test_in_strategy_auto_hyperopt_persistent_workers(
+    mocker, hyperopt_conf, tmp_path, fee, caplog, scheduler
+) -> None:
+    mocker.patch(f"{EXMS}.validate_config", MagicMock())
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    mocker.patch(f"{EXMS}.reload_markets")
+    mocker.patch(f"{EXMS}.markets", PropertyMock(return_value=get_markets()))
+    (tmp_path / "hyperopt_results").mkdir(parents=True)
+    mocker.patch("freqtrade.optimize.hyperopt.hyperopt.INITIAL_POINTS", 2)
+    hyperopt_conf.update(
+        {
+            "strategy": "HyperoptableStrategy",
+            "user_data_dir": tmp_path,
+            "hyperopt_random_state": 42,
+            "spaces": ["all"],
+            "epochs": 5,
+            "hyperopt_jobs": 2,
+            scheduler: True,
+            "fee": fee.return_value,
+        }
+    )
+    hyperopt = Hyperopt(hyperopt_conf)
+    opt = hyperopt.hyperopter
+    opt.backtesting.exchange.get_max_leverage = lambda *x, **xx: 1.0
+    opt.backtesting.exchange.get_min_pair_stake_amount = lambda *x, **xx: 0.00001
+    opt.backtesting.exchange.get_max_pair_stake_amount = lambda *x, **xx: 100.0
+    opt.backtesting.exchange._markets = get_markets()
+    parallel = mocker.spy(hyperopt, "run_optimizer_parallel")
+
+    hyperopt.start()
+
+    assert parallel.call_count == 0
+    assert log_has("Effective number of parallel workers used: 2", caplog)
+    assert hyperopt.num_epochs_saved == 5
+    epochs, _ = HyperoptTools.load_filtered_results(hyperopt.results_file, {})
+    assert [epoch["current_epoch"] for epoch in epochs] == [1, 2, 3, 4, 5]
+
+
+def test_hyperopt_async_scheduler_order(mocker, hyperopt_conf) -> None:
+    patch_exchange(mocker)
+    mocker.patch("freqtrade.optimize.hyperopt.hyperopt.INITIAL_POINTS", 2)
+    hyperopt_conf.update({"epochs": 5, "hyperopt_jobs": 2, "hyperopt_async_scheduler": True})
+    hyperopt = Hyperopt(hyperopt_conf)
+    hyperopt.hyperopter.init_spaces()
+    hyperopt.opt = hyperopt.hyperopter.get_optimizer(2, 42, 2, 2)
+    hyperopt._setup_logging_mp_workaround()
+
+    futures = []
+
+    def submit(func, point):
+        future = Future()
+        futures.append(future)
+        return future
+
+    def wait_mock(pending, return_when):
+        # Epochs finish in reverse order
+        future = next(f for f in reversed(futures) if f in pending)
+        future.set_result({"loss": len(futures) - futures.index(future)})
+        return {future}, set()
+
+    pool = MagicMock()
+    pool.__enter__.return_value.submit = submit
+    mocker.patch("freqtrade.optimize.hyperopt.hyperopt.get_worker_pool", return_value=pool)
+    mocker.patch("freqtrade.optimize.hyperopt.hyperopt.wait", side_effect=wait_mock)
+    tell = mocker.spy(hyperopt.opt, "tell")
+    evaluate_result = mocker.patch("freqtrade.optimize.hyperopt.hyperopt.Hyperopt.evaluate_result")
+    advance = MagicMock()
+
+    hyperopt.run_epochs_async(2, 0, advance)
+
+    assert len(futures) == 5
+    assert tell.call_count == 5
+    # Every point is told on its own
+    assert all(len(call[0][0]) == 1 for call in tell.call_args_list)
+    # No point is evaluated twice
+    points = [call[0][0][0] for call in tell.call_args_list]
+    assert len({tuple(p) for p in points}) == 5
+    # Results are evaluated in the order the epochs were started
+    assert [call[0][1] for call in evaluate_result.call_args_list] == [1, 2, 3, 4, 5]
+    assert advance.call_count == 5
+
+
 def test_in_strategy_auto_hyperopt_per_epoch(mocker, hyperopt_conf, tmp_path, fee) -> None:
     patch_exchange(mocker)
     mocker.patch(f"{EXMS}.get_fee", fee)
@@ -1151,6 +1339,7 @@ def test_in_strategy_auto_hyperopt_per_epoch(mocker, hyperopt_conf, tmp_path, fe
             "spaces": ["all"],
             "epochs": 3,
             "analyze_per_epoch": True,
+            "hyperopt_indicator_cache_size": 100,
         }
     )
     go = mocker.patch(
@@ -1166,6 +1355,7 @@ def test_in_strategy_auto_hyperopt_per_epoch(mocker, hyperopt_conf, tmp_path, fe
     opt = hyperopt.hyperopter
     opt.backtesting.exchange.get_max_leverage = MagicMock(return_value=1.0)
     assert isinstance(opt.custom_hyperopt, HyperOptAuto)
+    assert isinstance(opt.indicator_cache, IndicatorCache)
     assert isinstance(opt.backtesting.strategy.buy_rsi, IntParameter)
     assert opt.backtesting.strategy.bot_loop_started is False
     assert opt.backtesting.strategy.bot_started is True
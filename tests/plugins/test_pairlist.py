@@ -15,7 +15,11 @@ from freqtrade.data.dataprovider import DataProvider
 from freqtrade.enums import CandleType, RunMode
 from freqtrade.exceptions import OperationalException
 from freqtrade.persistence import LocalTrade, Trade
-from freqtrade.plugins.pairlist.pairlist_helpers import dynamic_expand_pairlist, expand_pairlist
+from freqtrade.plugins.pairlist.pairlist_helpers import (
+    build_ticker_table,
+    dynamic_expand_pairlist,
+    expand_pairlist,
+)
 from freqtrade.plugins.pairlistmanager import PairListManager
 from freqtrade.resolvers import PairListResolver
 from freqtrade.util.datetime_helpers import dt_now
@@ -2081,6 +2085,86 @@ def test_expand_pairlist_keep_invalid(wildcardlist, pairs, expected):
         assert sorted(expand_pairlist(wildcardlist, pairs, keep_invalid=True)) == sorted(expected)
 
 
+def test_build_ticker_table():
+    tickers = {
+        "ETH/BTC": {"last": 0.05, "bid": 0.049, "ask": 0.051},
+        "TKN/BTC": {"last": None, "bid": 0.001},
+        "XRP/BTC": {"last": 0.0001, "bid": 0.0001, "ask": 0.0001},
+    }
+    markets = {
+        "ETH/BTC": {
+            "precision": {"price": 0.00001, "amount": 0.001},
+            "limits": {"amount": {"min": 0.01}},
+        },
+        "TKN/BTC": {"precision": {"price": 8, "amount": None}, "limits": {}},
+    }
+    table = build_ticker_table(tickers, markets)
+
+    assert list(table.index) == ["ETH/BTC", "TKN/BTC", "XRP/BTC"]
+    assert all(dtype == "float64" for dtype in table.dtypes)
+    assert table.loc["ETH/BTC", "last"] == 0.05
+    assert table.loc["ETH/BTC", "ask"] == 0.051
+    assert table.loc["ETH/BTC", "amount_min"] == 0.01
+    assert table.loc["TKN/BTC", "price_precision"] == 8
+    assert table.loc["TKN/BTC", "bid"] == 0.001
+    # Missing values are NaN
+    assert table.loc["TKN/BTC", ["last", "ask", "amount_precision", "amount_min"]].isna().all()
+    # Pair without market
+    assert table.loc["XRP/BTC", ["price_precision", "amount_precision", "amount_min"]].isna().all()
+
+    assert build_ticker_table({}, markets).empty
+
+
+def test_pairlistmanager_ticker_table(mocker, whitelist_conf, markets, tickers):
+    whitelist_conf["pairlists"] = [
+        {"method": "StaticPairList"},
+        {"method": "PriceFilter", "low_price_ratio": 0.02},
+        {"method": "SpreadFilter", "max_spread_ratio": 0.005},
+    ]
+    mocker.patch.multiple(
+        EXMS,
+        markets=PropertyMock(return_value=markets),
+        exchange_has=MagicMock(return_value=True),
+        get_tickers=tickers,
+    )
+    build_mock = mocker.patch(
+        "freqtrade.plugins.pairlistmanager.build_ticker_table", side_effect=build_ticker_table
+    )
+    ftbot = get_patched_freqtradebot(mocker, whitelist_conf)
+    ftbot.pairlists.refresh_pairlist()
+    # Built once, shared by both filters
+    assert build_mock.call_count == 1
+    assert ftbot.pairlists.whitelist == ["ETH/BTC", "TKN/BTC"]
+
+    # Rebuilt on the next refresh
+    ftbot.pairlists.refresh_pairlist()
+    assert build_mock.call_count == 2
+
+
+def test_filter_pairlist_validate_pair_fallback(mocker, whitelist_conf, markets, tickers):
+    whitelist_conf["pairlists"] = [
+        {"method": "StaticPairList"},
+        {"method": "PrecisionFilter"},
+    ]
+    mocker.patch.multiple(
+        EXMS,
+        markets=PropertyMock(return_value=markets),
+        exchange_has=MagicMock(return_value=True),
+        get_tickers=tickers,
+    )
+    ftbot = get_patched_freqtradebot(mocker, whitelist_conf)
+    pl = ftbot.pairlists._pairlist_handlers[1]
+    validate_mock = mocker.patch.object(
+        pl, "_validate_pair", side_effect=lambda pair, ticker: pair != "TKN/BTC"
+    )
+    pairlist = ["ETH/BTC", "TKN/BTC", "NOTICKER/BTC"]
+    assert pl._validate_pairs(MagicMock(), tickers()) is None
+    assert pl.filter_pairlist(pairlist.copy(), tickers()) == ["ETH/BTC", "NOTICKER/BTC"]
+    assert validate_mock.call_count == 3
+    # Pairs without ticker are validated with None
+    assert validate_mock.call_args_list[2][0] == ("NOTICKER/BTC", None)
+
+
 def test_ProducerPairlist_no_emc(mocker, whitelist_conf):
     mocker.patch(f"{EXMS}.exchange_has", MagicMock(return_value=True))
 
@@ -5,14 +5,16 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import pandas as pd
 import pytest
 from pandas import DataFrame
+from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import CUSTOM_TAG_MAX_LENGTH
 from freqtrade.data.dataprovider import DataProvider
 from freqtrade.data.history import load_data
-from freqtrade.enums import ExitCheckTuple, ExitType, HyperoptState, SignalDirection
+from freqtrade.enums import ExitCheckTuple, ExitType, HyperoptState, RunMode, SignalDirection
 from freqtrade.exceptions import OperationalException, StrategyError
 from freqtrade.optimize.hyperopt_tools import HyperoptStateContainer
 from freqtrade.optimize.space import SKDecimal
@@ -26,9 +28,16 @@ from freqtrade.strategy.parameters import (
     DecimalParameter,
     IntParameter,
     RealParameter,
+    record_parameter_reads,
 )
 from freqtrade.util import dt_now
-from tests.conftest import CURRENT_TEST_STRATEGY, TRADE_SIDES, log_has, log_has_re
+from tests.conftest import (
+    CURRENT_TEST_STRATEGY,
+    TRADE_SIDES,
+    generate_test_data,
+    log_has,
+    log_has_re,
+)
 
 from .strats.strategy_test_v3 import StrategyTestV3
 
@@ -131,6 +140,35 @@ def test_analyze_pair_empty(mocker, caplog, ohlcv_history):
     assert log_has("Empty dataframe for pair ETH/BTC", caplog)
 
 
+@pytest.mark.parametrize("analyze_jobs", [1, 3])
+def test_analyze_jobs(mocker, default_conf, ohlcv_history, analyze_jobs):
+    default_conf["analyze_jobs"] = analyze_jobs
+    strategy = StrategyResolver.load_strategy(default_conf)
+    strategy.dp = DataProvider(default_conf, None, None)
+    pairs = [f"PAIR{i}/BTC" for i in range(8)]
+    mocker.patch.object(strategy.dp, "ohlcv", return_value=ohlcv_history)
+    emit_mock = mocker.patch.object(strategy.dp, "_emit_df")
+    analyze_mock = mocker.spy(strategy, "analyze_ticker")
+
+    strategy.analyze(pairs)
+    assert analyze_mock.call_count == 8
+    # Dataframes are emitted in the order of pairs
+    assert [c[0][0][0] for c in emit_mock.call_args_list] == pairs
+    assert all(c[0][2] for c in emit_mock.call_args_list)
+    for pair in pairs:
+        df, _ = strategy.dp.get_analyzed_dataframe(pair, strategy.timeframe)
+        assert "enter_long" in df.columns
+    assert strategy._deferred_emits is None
+
+    # Failures of one pair don't affect other pairs
+    emit_mock.reset_mock()
+    mocker.patch.object(strategy, "analyze_ticker", side_effect=StrategyError("fail"))
+    strategy.process_only_new_candles = False
+    strategy.analyze(pairs)
+    assert emit_mock.call_count == 0
+    assert strategy._deferred_emits is None
+
+
 def test_get_signal_empty(default_conf, caplog):
     assert (None, None) == _STRATEGY.get_latest_candle(
         "foo", default_conf["timeframe"], DataFrame()
@@ -312,6 +350,21 @@ def test_advise_all_indicators(default_conf, testdatadir) -> None:
     assert len(processed["UNITTEST/BTC"]) == 103
 
 
+def test_advise_all_indicators_threaded(default_conf, testdatadir) -> None:
+    strategy = StrategyResolver.load_strategy(default_conf)
+    pairs = ["UNITTEST/BTC", "ETH/BTC", "LTC/BTC", "XLM/BTC"]
+    data = load_data(testdatadir, "5m", pairs)
+    expected = strategy.advise_all_indicators(data)
+
+    default_conf["indicator_jobs"] = 2
+    strategy = StrategyResolver.load_strategy(default_conf)
+    processed = strategy.advise_all_indicators(data)
+    assert list(processed.keys()) == list(data.keys())
+    for pair in data:
+        pd.testing.assert_frame_equal(processed[pair], expected[pair])
+        assert processed[pair] is not data[pair]
+
+
 def test_freqai_not_initialized(default_conf) -> None:
     strategy = StrategyResolver.load_strategy(default_conf)
     strategy.ft_bot_start()
@@ -784,6 +837,52 @@ def test_analyze_ticker_default(ohlcv_history, mocker, caplog) -> None:
     assert not log_has("Skipping TA Analysis for already analyzed candle", caplog)
 
 
+def test__analyze_ticker_internal_incremental(mocker) -> None:
+    def populate_indicators(dataframe, metadata):
+        dataframe["sma"] = dataframe["close"].rolling(5).mean()
+        return dataframe
+
+    ind_mock = MagicMock(side_effect=populate_indicators)
+    mocker.patch.multiple(
+        "freqtrade.strategy.interface.IStrategy",
+        advise_indicators=ind_mock,
+        advise_entry=MagicMock(side_effect=lambda x, meta: x),
+        advise_exit=MagicMock(side_effect=lambda x, meta: x),
+    )
+    strategy = StrategyTestV3({"runmode": RunMode.DRY_RUN})
+    strategy.dp = DataProvider({"runmode": RunMode.DRY_RUN}, None, None)
+    strategy.incremental_lookback_candles = 10
+    data = generate_test_data("5m", 100, "2020-01-01")
+    history = data.iloc[:-2].reset_index(drop=True)
+
+    result = strategy._analyze_ticker_internal(history.copy(), {"pair": "ETH/BTC"})
+    assert len(ind_mock.call_args_list[-1][0][0]) == len(history)
+
+    # Only the new candles are analyzed - together with the lookback candles
+    update = data.iloc[2:].reset_index(drop=True)
+    result = strategy._analyze_ticker_internal(update.copy(), {"pair": "ETH/BTC"})
+    assert len(ind_mock.call_args_list[-1][0][0]) == 12
+    expected = strategy.analyze_ticker(update.copy(), {"pair": "ETH/BTC"})
+    # The first candles keep the indicator values calculated with the earlier candles
+    assert result["sma"].iloc[2:4].notna().all()
+    assert_frame_equal(result.iloc[4:], expected.iloc[4:], check_dtype=False)
+    analyzed, _ = strategy.dp.get_analyzed_dataframe("ETH/BTC", strategy.timeframe)
+    assert analyzed is result
+
+    # Not analyzed by this strategy before - analyze all candles
+    strategy._last_candle_seen_per_pair.clear()
+    data = generate_test_data("5m", len(update) + 1, update["date"].iat[0])
+    strategy._analyze_ticker_internal(data.copy(), {"pair": "ETH/BTC"})
+    assert len(ind_mock.call_args_list[-1][0][0]) == len(data)
+
+    # Only in dry-run and live mode
+    strategy.dp = DataProvider({"runmode": RunMode.BACKTEST}, None, None)
+    strategy._last_candle_seen_per_pair.clear()
+    strategy._analyze_ticker_internal(data.iloc[:-1].copy(), {"pair": "ETH/BTC"})
+    strategy._analyze_ticker_internal(data.copy(), {"pair": "ETH/BTC"})
+    assert len(ind_mock.call_args_list[-1][0][0]) == len(data)
+
+
 def test__analyze_ticker_internal_skip_analyze(ohlcv_history, mocker, caplog) -> None:
     caplog.set_level(logging.DEBUG)
     ind_mock = MagicMock(side_effect=lambda x, meta: x)
@@ -982,6 +1081,27 @@ def test_hyperopt_parameters():
     assert len(list(boolpar.range)) == 1
 
 
+def test_record_parameter_reads():
+    intpar = IntParameter(low=0, high=5, default=1, space="buy")
+    fltpar = DecimalParameter(low=0.0, high=0.5, default=0.1, decimals=1, space="buy")
+    catpar = CategoricalParameter(["a", "b"], default="a", space="sell")
+    HyperoptStateContainer.set_state(HyperoptState.OPTIMIZE)
+
+    with record_parameter_reads() as reads:
+        assert intpar.value == 1
+        with record_parameter_reads() as inner_reads:
+            assert list(catpar.range) == ["a"]
+        assert inner_reads == {catpar}
+        # Assignments are not reads
+        fltpar.value = 0.2
+    assert reads == {intpar, catpar}
+    assert fltpar.value == 0.2
+
+    # Reads outside of the context are not recorded
+    assert intpar.value == 1
+    assert reads == {intpar, catpar}
+
+
 def test_auto_hyperopt_interface(default_conf):
     default_conf.update({"strategy": "HyperoptableStrategyV2"})
     PairLocks.timeframe = default_conf["timeframe"]